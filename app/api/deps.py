@@ -8,10 +8,22 @@ Re-exports from app.dependencies for convenience.
 from app.dependencies import (
     get_db,
     DatabaseSession,
+    get_product_service,
+    ProductServiceDep,
+    get_store_service,
+    StoreServiceDep,
+    get_order_service,
+    OrderServiceDep,
+    get_user_service,
+    UserServiceDep,
+    get_upload_service,
+    UploadServiceDep,
     get_current_user_id,
     CurrentUserId,
     get_optional_user_id,
     OptionalUserId,
+    get_user_store_ids,
+    UserStoreIds,
     RoleChecker,
     require_admin,
     RequireAdmin,
@@ -24,10 +36,22 @@ from app.dependencies import (
 __all__ = [
     "get_db",
     "DatabaseSession",
+    "get_product_service",
+    "ProductServiceDep",
+    "get_store_service",
+    "StoreServiceDep",
+    "get_order_service",
+    "OrderServiceDep",
+    "get_user_service",
+    "UserServiceDep",
+    "get_upload_service",
+    "UploadServiceDep",
     "get_current_user_id",
     "CurrentUserId",
     "get_optional_user_id",
     "OptionalUserId",
+    "get_user_store_ids",
+    "UserStoreIds",
     "RoleChecker",
     "require_admin",
     "RequireAdmin",
@@ -6,6 +6,7 @@ Analytics and reporting endpoints for dashboard data.
 
 from typing import Optional
 from fastapi import APIRouter, Query
+from pydantic import TypeAdapter
 
 from app.api.deps import DatabaseSession, CurrentUserId
 from app.services.analytics_service import AnalyticsService
@@ -16,11 +17,18 @@ from app.schemas.analytics import (
     ProductPerformanceResponse,
     CustomerAnalyticsResponse,
 )
+from app.utils.response import model_response
 
 router = APIRouter()
 
+_DASHBOARD_ADAPTER = TypeAdapter(DashboardResponse)
 
-@router.get("/dashboard", response_model=DashboardResponse)
+
+@router.get(
+    "/dashboard",
+    response_model=None,
+    responses={200: {"model": DashboardResponse}},
+)
 async def get_dashboard(
     user_id: CurrentUserId,
     db: DatabaseSession,
@@ -43,10 +51,7 @@ async def get_dashboard(
         date_to=date_to,
     )
     
-    return {
-        "success": True,
-        "data": result,
-    }
+    return model_response(_DASHBOARD_ADAPTER, {"success": True, "data": result})
 
 
 @router.get("/revenue", response_model=RevenueResponse)
@@ -4,13 +4,16 @@ AGM Store Builder - Authentication Endpoints
 Handles user registration, login, logout, password reset, and OTP verification.
 """
 
+from typing import Optional
 from fastapi import APIRouter, Depends, status
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, TypeAdapter
 
 from app.api.deps import DatabaseSession, CurrentUserId
 from app.core.security import create_tokens, verify_refresh_token, verify_password, hash_password
 from app.core.exceptions import AuthenticationError, BadRequestError, NotFoundError
+from app.middleware.rate_limit import rate_limit
 from app.services.auth_service import AuthService
+from app.utils.response import model_response
 from app.schemas.auth import (
     RegisterRequest,
     LoginRequest,
@@ -27,48 +30,27 @@ from app.schemas.auth import (
 
 router = APIRouter()
 
+_AUTH_ADAPTER = TypeAdapter(AuthResponse)
+
 
 @router.post(
     "/register",
-    response_model=AuthResponse,
+    response_model=None,
+    responses={201: {"model": AuthResponse}},
     status_code=status.HTTP_201_CREATED,
 )
-async def register(
-    request: RegisterRequest,
-    db: DatabaseSession,
-):
-    """
-    Register a new user account.
-    
-    Creates a new user with the provided email and password.
-    Returns user data and authentication tokens.
-    """
-    auth_service = AuthService(db)
-    result = await auth_service.register(
-        email=request.email,
-        password=request.password,
-        full_name=request.full_name,
-        phone=request.phone,
-    )
-    
-    return {
-        "success": True,
-        "data": result,
-        "message": "Registration successful",
-    }
-
-
 @router.post(
     "/signup",
-    response_model=AuthResponse,
+    response_model=None,
     status_code=status.HTTP_201_CREATED,
+    include_in_schema=False,
 )
-async def signup(
+async def register(
     request: RegisterRequest,
     db: DatabaseSession,
 ):
     """
-    Signup - alias for register.
+    Register a new user account (also served at /signup).
     
     Creates a new user with the provided email and password.
     Returns user data and authentication tokens.
@@ -81,14 +63,23 @@ async def signup(
         phone=request.phone,
     )
     
-    return {
-        "success": True,
-        "data": result,
-        "message": "Registration successful",
-    }
+    return model_response(
+        _AUTH_ADAPTER,
+        {
+            "success": True,
+            "data": result,
+            "message": "Registration successful",
+        },
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
-@router.post("/login", response_model=AuthResponse)
+@router.post(
+    "/login",
+    response_model=None,
+    responses={200: {"model": AuthResponse}},
+    dependencies=[Depends(rate_limit("login"))],
+)
 async def login(
     request: LoginRequest,
     db: DatabaseSession,
@@ -104,11 +95,14 @@ async def login(
         password=request.password,
     )
     
-    return {
-        "success": True,
-        "data": result,
-        "message": "Login successful",
-    }
+    return model_response(
+        _AUTH_ADAPTER,
+        {
+            "success": True,
+            "data": result,
+            "message": "Login successful",
+        },
+    )
 
 
 @router.post("/refresh", response_model=TokenResponse)
@@ -134,14 +128,16 @@ async def refresh_token(
 async def logout(
     user_id: CurrentUserId,
     db: DatabaseSession,
+    request: Optional[RefreshTokenRequest] = None,
 ):
     """
     Logout the current user.
     
-    Invalidates the current session tokens.
+    Revokes the given refresh token, ending this session only; without
+    one, all of the user's sessions are ended.
     """
     auth_service = AuthService(db)
-    await auth_service.logout(user_id)
+    await auth_service.logout(user_id, request.refreshToken if request else None)
     
     return {
         "success": True,
@@ -149,7 +145,11 @@ async def logout(
     }
 
 
-@router.post("/forgot-password", response_model=MessageResponse)
+@router.post(
+    "/forgot-password",
+    response_model=MessageResponse,
+    dependencies=[Depends(rate_limit("forgot-password"))],
+)
 async def forgot_password(
     request: ForgotPasswordRequest,
     db: DatabaseSession,
@@ -168,7 +168,11 @@ async def forgot_password(
     }
 
 
-@router.post("/verify-otp", response_model=VerifyOTPResponse)
+@router.post(
+    "/verify-otp",
+    response_model=VerifyOTPResponse,
+    dependencies=[Depends(rate_limit("verify-otp"))],
+)
 async def verify_otp(
     request: VerifyOTPRequest,
     db: DatabaseSession,
@@ -215,7 +219,11 @@ async def reset_password(
     }
 
 
-@router.post("/resend-verification", response_model=MessageResponse)
+@router.post(
+    "/resend-verification",
+    response_model=MessageResponse,
+    dependencies=[Depends(rate_limit("resend-verification"))],
+)
 async def resend_verification(
     request: ResendVerificationRequest,
     db: DatabaseSession,
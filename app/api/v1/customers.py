@@ -4,96 +4,143 @@ AGM Store Builder - Dashboard Customer Endpoints
 Aggregates unique customers from orders for the dashboard customer list.
 """
 
-from typing import Optional
-from fastapi import APIRouter, Query
-from sqlalchemy import select, func, desc
+import hashlib
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from fastapi import APIRouter, Query, Request
+from sqlalchemy import and_, bindparam, case, or_, select, func, desc
 
-from app.api.deps import DatabaseSession, CurrentUserId
+from app.api.deps import DatabaseSession, UserStoreIds
+from app.core.exceptions import BadRequestError
+from app.database.session import async_session_maker
 from app.models.order import Order
-from app.models.store import Store
+from app.utils.helpers import decode_cursor, encode_cursor
+from app.utils.response import ndjson_response, wants_ndjson
 
 router = APIRouter()
 
+# Statements are built once at import; only bound parameters vary per request
+_CUSTOMER_FILTER = (
+    Order.store_id.in_(bindparam("store_ids", expanding=True)),
+    Order.deleted_at.is_(None),
+)
+
+# Each order ranked within its customer, newest first, so the aggregate
+# can read name/email from the customer's latest order
+_RANKED_ORDERS = (
+    select(
+        Order.id,
+        Order.customer_phone,
+        Order.customer_name,
+        Order.customer_email,
+        Order.total,
+        Order.created_at,
+        func.row_number().over(
+            partition_by=Order.customer_phone,
+            order_by=(Order.created_at.desc(), Order.id.desc()),
+        ).label("recency"),
+    )
+    .where(*_CUSTOMER_FILTER)
+    .subquery()
+)
+_latest = _RANKED_ORDERS.c.recency == 1
+
+# Aggregate customers by phone (unique identifier)
+_CUSTOMERS_STMT = (
+    select(
+        _RANKED_ORDERS.c.customer_phone.label("phone"),
+        func.max(case((_latest, _RANKED_ORDERS.c.customer_name))).label("name"),
+        func.max(case((_latest, _RANKED_ORDERS.c.customer_email))).label("email"),
+        func.count(_RANKED_ORDERS.c.id).label("totalOrders"),
+        func.sum(_RANKED_ORDERS.c.total).label("totalSpent"),
+        func.max(_RANKED_ORDERS.c.created_at).label("lastOrderDate"),
+        # Number of customer groups, computed in the same pass as the page
+        func.count().over().label("totalCustomers"),
+    )
+    .group_by(_RANKED_ORDERS.c.customer_phone)
+    .order_by(desc("lastOrderDate"), _RANKED_ORDERS.c.customer_phone.desc())
+)
+
+_CUSTOMERS_PAGE_STMT = _CUSTOMERS_STMT.limit(bindparam("limit")).offset(bindparam("offset"))
+
+# Keyset page: customers strictly after the (lastOrderDate, phone) cursor
+_CUSTOMERS_SEEK_STMT = _CUSTOMERS_STMT.having(
+    or_(
+        func.max(_RANKED_ORDERS.c.created_at) < bindparam("cursor_date"),
+        and_(
+            func.max(_RANKED_ORDERS.c.created_at) == bindparam("cursor_date"),
+            _RANKED_ORDERS.c.customer_phone < bindparam("cursor_phone"),
+        ),
+    )
+).limit(bindparam("limit"))
+
+_CUSTOMERS_COUNT_STMT = select(
+    func.count(func.distinct(Order.customer_phone))
+).where(*_CUSTOMER_FILTER)
+
 
 @router.get("/customers")
 async def get_customers(
-    user_id: CurrentUserId,
+    request: Request,
+    user_store_ids: UserStoreIds,
     db: DatabaseSession,
     store_id: Optional[str] = None,
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = None,
 ):
     """
     Get aggregated customer list from orders.
 
     Returns unique customers with total orders, total spent, and last order date.
+    Pass the previous page's ``nextCursor`` as ``cursor`` for keyset paging
+    (``page`` is then ignored). Send ``Accept: application/x-ndjson`` to stream every customer
+    (ignoring pagination) as newline-delimited JSON.
     """
-    # Base query: only orders belonging to the user's stores
-    store_filter = select(Store.id).where(
-        Store.user_id == user_id,
-        Store.deleted_at.is_(None),
-    )
-
+    # Only orders belonging to the user's stores
+    store_ids = user_store_ids
     if store_id:
-        store_filter = store_filter.where(Store.id == store_id)
-
-    store_ids_subq = store_filter.scalar_subquery()
-
-    # Aggregate customers by phone (unique identifier)
-    query = (
-        select(
-            Order.customer_phone.label("phone"),
-            Order.customer_name.label("name"),
-            Order.customer_email.label("email"),
-            func.count(Order.id).label("totalOrders"),
-            func.sum(Order.total).label("totalSpent"),
-            func.max(Order.created_at).label("lastOrderDate"),
+        store_ids = [store_id] if store_id in store_ids else []
+
+    if wants_ndjson(request):
+        return ndjson_response(_stream_customers(store_ids))
+
+    offset = (page - 1) * limit
+    rows = []
+    total = 0
+
+    if store_ids and cursor:
+        cursor_date, cursor_phone = _parse_cursor(cursor)
+        params = {"store_ids": store_ids, "limit": limit + 1}
+        result = await db.execute(
+            _CUSTOMERS_SEEK_STMT,
+            {**params, "cursor_date": cursor_date, "cursor_phone": cursor_phone},
         )
-        .where(
-            Order.store_id.in_(select(Store.id).where(
-                Store.user_id == user_id,
-                Store.deleted_at.is_(None),
-                *([Store.id == store_id] if store_id else []),
-            )),
-            Order.deleted_at.is_(None),
+        rows = result.all()
+        # The window count only sees groups after the cursor here
+        total_result = await db.execute(_CUSTOMERS_COUNT_STMT, {"store_ids": store_ids})
+        total = total_result.scalar() or 0
+    elif store_ids:
+        result = await db.execute(
+            _CUSTOMERS_PAGE_STMT,
+            {"store_ids": store_ids, "limit": limit + 1, "offset": offset},
         )
-        .group_by(Order.customer_phone, Order.customer_name, Order.customer_email)
-        .order_by(desc("lastOrderDate"))
-    )
+        rows = result.all()
 
-    # Count total customers
-    count_query = (
-        select(func.count(func.distinct(Order.customer_phone)))
-        .where(
-            Order.store_id.in_(select(Store.id).where(
-                Store.user_id == user_id,
-                Store.deleted_at.is_(None),
-                *([Store.id == store_id] if store_id else []),
-            )),
-            Order.deleted_at.is_(None),
-        )
-    )
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+        if rows:
+            total = rows[0].totalCustomers
+        elif offset:
+            # Past the last page there is no row to carry the window count
+            total_result = await db.execute(_CUSTOMERS_COUNT_STMT, {"store_ids": store_ids})
+            total = total_result.scalar() or 0
 
-    # Paginate
-    offset = (page - 1) * limit
-    query = query.offset(offset).limit(limit)
-
-    result = await db.execute(query)
-    rows = result.all()
-
-    customers = []
-    for i, row in enumerate(rows):
-        customers.append({
-            "id": f"cust_{offset + i + 1}",
-            "name": row.name or "Unknown",
-            "email": row.email or "",
-            "phone": row.phone or "",
-            "totalOrders": row.totalOrders or 0,
-            "totalSpent": float(row.totalSpent or 0),
-            "lastOrderDate": row.lastOrderDate.isoformat() if row.lastOrderDate else "",
-        })
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = None
+    if has_more:
+        next_cursor = encode_cursor(rows[-1].lastOrderDate.isoformat(), rows[-1].phone)
+
+    customers = [_customer_to_dict(row) for row in rows]
 
     return {
         "success": True,
@@ -103,5 +150,49 @@ async def get_customers(
             "limit": limit,
             "total": total,
             "pages": (total + limit - 1) // limit if total else 0,
+            "hasMore": has_more,
+            "nextCursor": next_cursor,
         },
     }
+
+
+def _parse_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a customer list cursor into (lastOrderDate, phone)."""
+    values = decode_cursor(cursor, 2)
+    try:
+        return datetime.fromisoformat(values[0]), values[1]  # type: ignore[index]
+    except (TypeError, ValueError):
+        raise BadRequestError(message="Invalid pagination cursor")
+
+
+def _customer_id(phone: Optional[str]) -> str:
+    """Stable customer id derived from the phone the rows are grouped by."""
+    return "cust_" + hashlib.sha1((phone or "").encode()).hexdigest()[:16]
+
+
+def _customer_to_dict(row) -> Dict[str, Any]:
+    """Convert an aggregated customer row to a dictionary."""
+    return {
+        "id": _customer_id(row.phone),
+        "name": row.name or "Unknown",
+        "email": row.email or "",
+        "phone": row.phone or "",
+        "totalOrders": row.totalOrders or 0,
+        "totalSpent": float(row.totalSpent or 0),
+        "lastOrderDate": row.lastOrderDate.isoformat() if row.lastOrderDate else "",
+    }
+
+
+async def _stream_customers(store_ids: List[str]) -> AsyncIterator[Dict[str, Any]]:
+    """Stream every aggregated customer row using a server-side cursor."""
+    if not store_ids:
+        return
+
+    # Own session so the stream outlives the request-scoped one
+    async with async_session_maker() as session:
+        result = await session.stream(
+            _CUSTOMERS_STMT.execution_options(yield_per=100),
+            {"store_ids": store_ids},
+        )
+        async for row in result:
+            yield _customer_to_dict(row)
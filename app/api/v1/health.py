@@ -4,32 +4,52 @@ AGM Store Builder - Health Check Endpoints
 Health check and version endpoints for monitoring.
 """
 
+import asyncio
 from datetime import datetime, timezone
 import time
-from fastapi import APIRouter
+from fastapi import APIRouter, Response, status
+from sqlalchemy import text
 
+from app.api.deps import DatabaseSession
 from app.core.config import settings
 
 router = APIRouter()
 
-# Application start time for uptime calculation
-_start_time = time.time()
+# Longest the health check waits for the database to answer
+DB_CHECK_TIMEOUT_SECONDS = 2.0
+
+# Application start time for uptime calculation (monotonic, immune to clock jumps)
+_start_time = time.monotonic()
+
+# Parts of the health payload that never change while the process runs
+_STATIC_HEALTH = {
+    "environment": settings.APP_ENV,
+    "version": settings.APP_VERSION,
+}
 
 
 @router.get("/health")
-async def health_check():
+async def health_check(db: DatabaseSession, response: Response):
     """
     Health check endpoint.
     
-    Returns the health status of the API with database connectivity.
+    Returns the health status of the API with database connectivity,
+    checked with a SELECT 1 that gives up after DB_CHECK_TIMEOUT_SECONDS.
+    Responds 503 when the database is unreachable.
     """
+    try:
+        await asyncio.wait_for(db.execute(text("SELECT 1")), DB_CHECK_TIMEOUT_SECONDS)
+        database = "connected"
+    except Exception:
+        database = "unavailable"
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    
     return {
-        "status": "ok",
+        **_STATIC_HEALTH,
+        "status": "ok" if database == "connected" else "degraded",
+        "database": database,
         "timestamp": datetime.now(timezone.utc).isoformat(),
-        "uptime": time.time() - _start_time,
-        "environment": settings.APP_ENV,
-        "version": settings.APP_VERSION,
-        "database": "connected",  # TODO: Add actual DB health check
+        "uptime": time.monotonic() - _start_time,
     }
 
 
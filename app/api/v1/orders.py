@@ -5,7 +5,7 @@ Order management endpoints for creating, tracking, and managing orders.
 """
 
 from typing import Optional
-from fastapi import APIRouter, status, Query
+from fastapi import APIRouter, Request, status, Query
 
 from app.api.deps import DatabaseSession, CurrentUserId
 from app.services.order_service import OrderService
@@ -18,6 +18,7 @@ from app.schemas.order import (
     UpdateOrderStatusRequest,
 )
 from app.schemas.common import MessageResponse
+from app.utils.response import ndjson_response, wants_ndjson
 
 router = APIRouter()
 
@@ -80,6 +81,7 @@ async def track_order(
 
 @router.get("", response_model=OrderListResponse)
 async def list_orders(
+    request: Request,
     user_id: CurrentUserId,
     db: DatabaseSession,
     store_id: Optional[str] = None,
@@ -90,13 +92,30 @@ async def list_orders(
     search: Optional[str] = None,
     date_from: Optional[str] = None,
     date_to: Optional[str] = None,
+    cursor: Optional[str] = None,
 ):
     """
     Get all orders for the user's stores.
     
-    Supports filtering by store, status, and date range.
+    Supports filtering by store, status, and date range. Pass the
+    previous page's ``nextCursor`` as ``cursor`` for keyset paging
+    (``page`` is then ignored). Send
+    ``Accept: application/x-ndjson`` to stream every matching order
+    (ignoring pagination) as newline-delimited JSON.
     """
     order_service = OrderService(db)
+    
+    if wants_ndjson(request):
+        return ndjson_response(order_service.stream_user_orders(
+            user_id=user_id,
+            store_id=store_id,
+            status=status,
+            payment_status=payment_status,
+            search=search,
+            date_from=date_from,
+            date_to=date_to,
+        ))
+    
     result = await order_service.get_user_orders(
         user_id=user_id,
         store_id=store_id,
@@ -107,6 +126,7 @@ async def list_orders(
         search=search,
         date_from=date_from,
         date_to=date_to,
+        cursor=cursor,
     )
     
     return {
@@ -4,8 +4,10 @@ AGM Store Builder - Payment Endpoints
 Payment management endpoints including verification, bank accounts, and Nigerian banks.
 """
 
+import hashlib
+import json
 from typing import List
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Request, Response, status
 
 from app.api.deps import DatabaseSession, CurrentUserId
 from app.services.payment_service import PaymentService
@@ -21,27 +23,46 @@ from app.schemas.payment import (
     ResolveBankAccountResponse,
 )
 from app.schemas.common import MessageResponse
+from app.utils.constants import NIGERIAN_BANKS
 
 router = APIRouter()
 
+# The bank list is static, so serialize it once and derive a stable ETag from it
+_BANKS_BYTES = json.dumps(
+    {"success": True, "data": NIGERIAN_BANKS},
+    separators=(",", ":"),
+).encode()
+_BANKS_ETAG = f'"{hashlib.md5(_BANKS_BYTES).hexdigest()}"'
+_BANKS_HEADERS = {
+    "ETag": _BANKS_ETAG,
+    "Cache-Control": "public, max-age=86400",
+}
+
 
 # =====================
 # Bank Account Endpoints (must be before /{reference} to avoid conflicts)
 # =====================
 
-@router.get("/banks", response_model=BankListResponse)
-async def get_nigerian_banks():
+@router.get(
+    "/banks",
+    response_model=None,
+    responses={200: {"model": BankListResponse}},
+)
+async def get_nigerian_banks(request: Request) -> Response:
     """
     Get list of Nigerian banks (public).
     
-    Returns bank names and codes for bank selection.
+    Returns bank names and codes for bank selection. The payload is
+    precomputed and served with an ETag, so repeat clients get a 304.
     """
-    from app.utils.constants import NIGERIAN_BANKS
+    if request.headers.get("if-none-match") == _BANKS_ETAG:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_BANKS_HEADERS)
     
-    return {
-        "success": True,
-        "data": NIGERIAN_BANKS,
-    }
+    return Response(
+        content=_BANKS_BYTES,
+        media_type="application/json",
+        headers=_BANKS_HEADERS,
+    )
 
 
 @router.post("/bank-accounts/resolve", response_model=ResolveBankAccountResponse)
@@ -6,9 +6,9 @@ Product management endpoints for creating, updating, and listing products.
 
 from typing import Optional, List
 from fastapi import APIRouter, status, Query
+from fastapi.responses import ORJSONResponse
 
-from app.api.deps import DatabaseSession, CurrentUserId, OptionalUserId
-from app.services.product_service import ProductService
+from app.api.deps import CurrentUserId, OptionalUserId, ProductServiceDep
 from app.schemas.product import (
     CreateProductRequest,
     UpdateProductRequest,
@@ -32,17 +32,16 @@ router = APIRouter()
 async def create_product(
     request: CreateProductRequest,
     user_id: CurrentUserId,
-    db: DatabaseSession,
+    product_service: ProductServiceDep,
 ):
     """
     Create a new product.
     
     Creates a product for the specified store.
     """
-    product_service = ProductService(db)
     product = await product_service.create_product(
         user_id=user_id,
-        **request.model_dump(),
+        **request.model_dump(exclude_unset=True),
     )
     
     return {
@@ -55,20 +54,26 @@ async def create_product(
 @router.get("/my-products", response_model=ProductListResponse)
 async def get_my_products(
     user_id: CurrentUserId,
-    db: DatabaseSession,
+    product_service: ProductServiceDep,
     store_id: Optional[str] = None,
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
     search: Optional[str] = None,
     category: Optional[str] = None,
     status: Optional[str] = None,
-):
+    cursor: Optional[str] = None,
+) -> ORJSONResponse:
     """
     Get all products for the authenticated user's stores.
     
-    Supports filtering by store, category, and search.
+    Supports filtering by store, category, and search. Pass the previous
+    page's ``nextCursor`` as ``cursor`` for keyset paging (``page`` is
+    then ignored); prefer it over deep page numbers.
+    
+    The repository already builds rows in the ``ProductListResponse``
+    shape, so the body is serialized directly; ``response_model`` is kept
+    for the OpenAPI schema only.
     """
-    product_service = ProductService(db)
     result = await product_service.get_user_products(
         user_id=user_id,
         store_id=store_id,
@@ -77,27 +82,27 @@ async def get_my_products(
         search=search,
         category=category,
         product_status=status,
+        cursor=cursor,
     )
     
-    return {
+    return ORJSONResponse({
         "success": True,
         "data": result["products"],
         "pagination": result["pagination"],
-    }
+    })
 
 
 @router.get("/{product_id}", response_model=ProductDetailResponse)
 async def get_product_by_id(
     product_id: str,
     user_id: CurrentUserId,
-    db: DatabaseSession,
+    product_service: ProductServiceDep,
 ):
     """
     Get product details by ID (owner only).
     
     Returns full product details for the owner.
     """
-    product_service = ProductService(db)
     product = await product_service.get_product_by_id(product_id, user_id)
     
     return {
@@ -111,14 +116,13 @@ async def update_product(
     product_id: str,
     request: UpdateProductRequest,
     user_id: CurrentUserId,
-    db: DatabaseSession,
+    product_service: ProductServiceDep,
 ):
     """
     Update product details (owner only).
     
     Updates product information.
     """
-    product_service = ProductService(db)
     product = await product_service.update_product(
         product_id=product_id,
         user_id=user_id,
@@ -137,14 +141,13 @@ async def update_stock(
     product_id: str,
     request: UpdateStockRequest,
     user_id: CurrentUserId,
-    db: DatabaseSession,
+    product_service: ProductServiceDep,
 ):
     """
     Update product stock quantity.
     
     Supports set, increment, and decrement operations.
     """
-    product_service = ProductService(db)
     product = await product_service.update_stock(
         product_id=product_id,
         user_id=user_id,
@@ -165,14 +168,13 @@ async def toggle_product_status(
     product_id: str,
     request: ToggleProductStatusRequest,
     user_id: CurrentUserId,
-    db: DatabaseSession,
+    product_service: ProductServiceDep,
 ):
     """
     Activate or deactivate a product.
     
     Toggles the product's active status.
     """
-    product_service = ProductService(db)
     product = await product_service.toggle_product_status(
         product_id=product_id,
         user_id=user_id,
@@ -192,14 +194,13 @@ async def toggle_product_status(
 async def delete_product(
     product_id: str,
     user_id: CurrentUserId,
-    db: DatabaseSession,
+    product_service: ProductServiceDep,
 ):
     """
     Delete a product (soft delete).
     
     Marks the product as deleted but preserves data.
     """
-    product_service = ProductService(db)
     await product_service.delete_product(product_id, user_id)
     
     return {
@@ -212,14 +213,13 @@ async def delete_product(
 async def bulk_update_products(
     request: BulkUpdateRequest,
     user_id: CurrentUserId,
-    db: DatabaseSession,
+    product_service: ProductServiceDep,
 ):
     """
     Update multiple products at once.
     
     Applies the same updates to all specified products.
     """
-    product_service = ProductService(db)
     count = await product_service.bulk_update(
         product_ids=request.product_ids,
         user_id=user_id,
@@ -4,10 +4,12 @@ AGM Store Builder - Settings Endpoints
 User settings endpoints for notification preferences, etc.
 """
 
-import uuid
+from datetime import datetime, timezone
+from typing import Mapping
 from pydantic import BaseModel
 from fastapi import APIRouter
 from sqlalchemy import select
+from sqlalchemy.dialects.mysql import insert
 
 from app.api.deps import DatabaseSession, CurrentUserId
 from app.models.user_settings import UserSettings
@@ -22,21 +24,36 @@ class NotificationPreferences(BaseModel):
     marketingEmails: bool = False
 
 
-async def _get_or_create_settings(db: DatabaseSession, user_id: str) -> UserSettings:
-    """Get user settings, creating defaults if none exist."""
-    result = await db.execute(
-        select(UserSettings).where(UserSettings.user_id == user_id)
-    )
-    settings = result.scalar_one_or_none()
-
-    if not settings:
-        settings = UserSettings(
-            id=str(uuid.uuid4()),
-            user_id=user_id,
+# Only these columns feed the notification endpoints
+_NOTIFICATION_COLUMNS = (
+    UserSettings.email_notifications,
+    UserSettings.sms_notifications,
+    UserSettings.order_notifications,
+    UserSettings.marketing_notifications,
+)
+_DEFAULT_NOTIFICATIONS = {column.key: column.default.arg for column in _NOTIFICATION_COLUMNS}
+
+
+async def _get_or_create_notifications(db: DatabaseSession, user_id: str) -> Mapping[str, bool]:
+    """Get the user's notification columns, creating default settings if none exist."""
+    query = select(*_NOTIFICATION_COLUMNS).where(UserSettings.user_id == user_id)
+    result = await db.execute(query)
+    settings = result.mappings().first()
+
+    if settings is None:
+        # INSERT IGNORE keeps concurrent first requests from colliding on user_id
+        result = await db.execute(
+            insert(UserSettings)
+            .prefix_with("IGNORE")
+            .values(user_id=user_id)
         )
-        db.add(settings)
         await db.commit()
-        await db.refresh(settings)
+        if result.rowcount == 1:
+            # Our insert created the row, so it holds the column defaults; MySQL
+            # has no RETURNING, and re-reading would cost another round-trip
+            return _DEFAULT_NOTIFICATIONS
+        result = await db.execute(query)
+        settings = result.mappings().one()
 
     return settings
 
@@ -51,14 +68,14 @@ async def get_notification_settings(
 
     Returns the user's notification settings mapped to frontend field names.
     """
-    settings = await _get_or_create_settings(db, user_id)
+    settings = await _get_or_create_notifications(db, user_id)
 
     return {
         "success": True,
         "data": {
-            "emailOrders": settings.email_notifications and settings.order_notifications,
-            "smsOrders": settings.sms_notifications and settings.order_notifications,
-            "marketingEmails": settings.marketing_notifications,
+            "emailOrders": settings["email_notifications"] and settings["order_notifications"],
+            "smsOrders": settings["sms_notifications"] and settings["order_notifications"],
+            "marketingEmails": settings["marketing_notifications"],
         },
     }
 
@@ -74,16 +91,23 @@ async def update_notification_settings(
 
     Maps frontend field names back to the UserSettings model columns.
     """
-    settings = await _get_or_create_settings(db, user_id)
-
     # Map frontend fields -> model columns
-    settings.email_notifications = prefs.emailOrders
-    settings.order_notifications = prefs.emailOrders or prefs.smsOrders
-    settings.sms_notifications = prefs.smsOrders
-    settings.marketing_notifications = prefs.marketingEmails
+    values = {
+        "email_notifications": prefs.emailOrders,
+        "order_notifications": prefs.emailOrders or prefs.smsOrders,
+        "sms_notifications": prefs.smsOrders,
+        "marketing_notifications": prefs.marketingEmails,
+    }
 
+    # Single upsert instead of select + insert/update round-trips
+    stmt = insert(UserSettings).values(user_id=user_id, **values)
+    await db.execute(
+        stmt.on_duplicate_key_update(
+            **values,
+            updated_at=datetime.now(timezone.utc),
+        )
+    )
     await db.commit()
-    await db.refresh(settings)
 
     return {
         "success": True,
@@ -5,11 +5,18 @@ Store management endpoints for creating, updating, and managing stores.
 """
 
 from typing import List, Optional, Dict
-from pydantic import BaseModel, Field, EmailStr
-from fastapi import APIRouter, status, Query
-
-from app.api.deps import DatabaseSession, CurrentUserId, OptionalUserId
-from app.services.store_service import StoreService
+import orjson
+from pydantic import BaseModel, Field, EmailStr, TypeAdapter
+from fastapi import APIRouter, Request, Response, status, Query
+
+from app.api.deps import (
+    CurrentUserId,
+    OptionalUserId,
+    OrderServiceDep,
+    ProductServiceDep,
+    StoreServiceDep,
+)
+from app.core.cache import storefront_cache
 from app.schemas.store import (
     CreateStoreRequest,
     UpdateStoreRequest,
@@ -21,9 +28,12 @@ from app.schemas.store import (
 )
 from app.schemas.common import MessageResponse
 from app.schemas.order import OrderItem
+from app.utils.response import conditional_response, etag_body
 
 router = APIRouter()
 
+_STORE_DETAIL_ADAPTER = TypeAdapter(StoreDetailResponse)
+
 
 class CheckoutRequest(BaseModel):
     """Public checkout request via store route."""
@@ -47,14 +57,13 @@ class CheckoutRequest(BaseModel):
 async def create_store(
     request: CreateStoreRequest,
     user_id: CurrentUserId,
-    db: DatabaseSession,
+    store_service: StoreServiceDep,
 ):
     """
     Create a new store.
     
     Creates a store for the authenticated user.
     """
-    store_service = StoreService(db)
     store = await store_service.create_store(
         user_id=user_id,
         name=request.name,
@@ -76,14 +85,14 @@ async def create_store(
 @router.get("/check/{username}", response_model=CheckUsernameResponse)
 async def check_username(
     username: str,
-    db: DatabaseSession,
+    store_service: StoreServiceDep,
 ):
     """
     Check if a store username is available.
     
-    Returns availability status and suggestions if taken.
+    Advisory only: store creation enforces uniqueness itself and
+    returns 409 with suggestions if the username is taken.
     """
-    store_service = StoreService(db)
     result = await store_service.check_username_availability(username)
     
     return {
@@ -95,14 +104,13 @@ async def check_username(
 @router.get("/my-stores", response_model=StoreListResponse)
 async def get_my_stores(
     user_id: CurrentUserId,
-    db: DatabaseSession,
+    store_service: StoreServiceDep,
 ):
     """
     Get all stores owned by the authenticated user.
     
     Returns a list of stores with summary statistics.
     """
-    store_service = StoreService(db)
     stores = await store_service.get_user_stores(user_id)
     
     return {
@@ -111,102 +119,126 @@ async def get_my_stores(
     }
 
 
-@router.get("/{username}/products")
+@router.get("/{username}/products", response_model=None)
 async def get_store_products(
+    request: Request,
     username: str,
-    db: DatabaseSession,
+    store_service: StoreServiceDep,
+    product_service: ProductServiceDep,
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
     search: Optional[str] = None,
     category: Optional[str] = None,
     sortBy: Optional[str] = None,
-):
+    cursor: Optional[str] = None,
+) -> Response:
     """
     Get public products for a store by username.
     
-    Returns paginated list of active products for the store.
+    Returns paginated list of active products for the store. Pass the
+    previous page's ``nextCursor`` as ``cursor`` for keyset paging
+    (``page`` is then ignored). Served with an ETag for revalidation.
     """
-    from app.services.product_service import ProductService
-    
-    store_service = StoreService(db)
-    store = await store_service.get_store_by_username(username)
-    
-    product_service = ProductService(db)
-    result = await product_service.get_store_products(
-        store_id=store["id"],
-        page=page,
-        limit=limit,
-        search=search,
-        category=category,
-        sort_by=sortBy,
+    cache_key = (
+        f"storefront:{username.lower()}:products:"
+        f"{page}:{limit}:{search or ''}:{category or ''}:{sortBy or ''}:{cursor or ''}"
     )
+    cached = storefront_cache.get(cache_key)
+    if cached is None:
+        store = await store_service.get_store_by_username(username)
+        
+        result = await product_service.get_store_products(
+            store_id=store["id"],
+            page=page,
+            limit=limit,
+            search=search,
+            category=category,
+            sort_by=sortBy,
+            cursor=cursor,
+        )
+        
+        cached = etag_body(orjson.dumps({
+            "success": True,
+            "data": result["products"],
+            "pagination": result["pagination"],
+        }, default=str))
+        storefront_cache.set(cache_key, cached)
     
-    return {
-        "success": True,
-        "data": result["products"],
-        "pagination": result["pagination"],
-    }
+    return conditional_response(request, *cached)
 
 
-@router.get("/{username}/products/{product_id}")
+@router.get("/{username}/products/{product_id}", response_model=None)
 async def get_store_product(
+    request: Request,
     username: str,
     product_id: str,
-    db: DatabaseSession,
-):
+    store_service: StoreServiceDep,
+    product_service: ProductServiceDep,
+) -> Response:
     """
     Get a specific product from a store by username.
     
-    Returns product details for the specified product.
+    Returns product details for the specified product, served with an
+    ETag for revalidation.
     """
-    from app.services.product_service import ProductService
-    
-    store_service = StoreService(db)
-    store = await store_service.get_store_by_username(username)
+    cache_key = f"storefront:{username.lower()}:product:{product_id}"
+    cached = storefront_cache.get(cache_key)
+    if cached is not None:
+        # Views are still counted when the body comes from cache
+        await product_service.record_product_view(product_id)
+    else:
+        store = await store_service.get_store_by_username(username)
+        
+        product = await product_service.get_public_product(
+            store_id=store["id"],
+            product_id=product_id,
+        )
+        
+        cached = etag_body(orjson.dumps({
+            "success": True,
+            "data": product,
+        }, default=str))
+        storefront_cache.set(cache_key, cached)
     
-    product_service = ProductService(db)
-    product = await product_service.get_public_product(
-        store_id=store["id"],
-        product_id=product_id,
-    )
-    
-    return {
-        "success": True,
-        "data": product,
-    }
+    return conditional_response(request, *cached)
 
 
 @router.get("/{username}", response_model=StoreDetailResponse)
 async def get_store_by_username(
+    request: Request,
     username: str,
-    db: DatabaseSession,
-):
+    store_service: StoreServiceDep,
+) -> Response:
     """
     Get public store details by username.
     
-    Returns store information visible to the public.
+    Returns store information visible to the public, served with an
+    ETag for revalidation.
     """
-    store_service = StoreService(db)
-    store = await store_service.get_store_by_username(username)
+    cache_key = f"storefront:{username.lower()}:store"
+    cached = storefront_cache.get(cache_key)
+    if cached is None:
+        store = await store_service.get_store_by_username(username)
+        
+        cached = etag_body(_STORE_DETAIL_ADAPTER.dump_json(
+            _STORE_DETAIL_ADAPTER.validate_python({"success": True, "data": store})
+        ))
+        storefront_cache.set(cache_key, cached)
     
-    return {
-        "success": True,
-        "data": store,
-    }
+    return conditional_response(request, *cached)
 
 
 @router.get("/id/{store_id}", response_model=StoreDetailResponse)
 async def get_store_by_id(
     store_id: str,
     user_id: CurrentUserId,
-    db: DatabaseSession,
+    store_service: StoreServiceDep,
 ):
     """
     Get store details by ID (owner only).
     
     Returns full store details for the owner.
     """
-    store_service = StoreService(db)
     store = await store_service.get_store_by_id(store_id, user_id)
     
     return {
@@ -220,14 +252,13 @@ async def update_store(
     store_id: str,
     request: UpdateStoreRequest,
     user_id: CurrentUserId,
-    db: DatabaseSession,
+    store_service: StoreServiceDep,
 ):
     """
     Update store details (owner only).
     
     Updates store information for the authenticated owner.
     """
-    store_service = StoreService(db)
     store = await store_service.update_store(
         store_id=store_id,
         user_id=user_id,
@@ -246,14 +277,13 @@ async def toggle_store_status(
     store_id: str,
     request: ToggleStatusRequest,
     user_id: CurrentUserId,
-    db: DatabaseSession,
+    store_service: StoreServiceDep,
 ):
     """
     Activate or deactivate a store.
     
     Toggles the store's active status.
     """
-    store_service = StoreService(db)
     store = await store_service.toggle_store_status(
         store_id=store_id,
         user_id=user_id,
@@ -273,14 +303,13 @@ async def toggle_store_status(
 async def delete_store(
     store_id: str,
     user_id: CurrentUserId,
-    db: DatabaseSession,
+    store_service: StoreServiceDep,
 ):
     """
     Delete a store (soft delete).
     
     Marks the store as deleted but preserves data.
     """
-    store_service = StoreService(db)
     await store_service.delete_store(store_id, user_id)
     
     return {
@@ -293,30 +322,16 @@ async def delete_store(
 async def store_checkout(
     store_id: str,
     request: CheckoutRequest,
-    db: DatabaseSession,
+    order_service: OrderServiceDep,
 ):
     """
     Create an order via store checkout (public).
 
-    Resolves the store by ID and creates an order with payment details.
+    Resolves the store by ID or username and creates an order with payment details.
     """
-    from app.services.order_service import OrderService
-
-    # Look up store by ID (try both ID and username for flexibility)
-    store_service = StoreService(db)
-    try:
-        store = await store_service.get_store_by_username(store_id)
-    except Exception:
-        # If not found by username, try repo get_by_id directly
-        store_obj = await store_service.store_repo.get_by_id(store_id)
-        if not store_obj or not store_obj.is_active:
-            from app.core.exceptions import NotFoundError
-            raise NotFoundError(message="Store not found", resource_type="Store")
-        store = store_service._store_to_dict(store_obj)
-
-    order_service = OrderService(db)
+    # create_order resolves the store by ID or username in one query
     result = await order_service.create_order(
-        store_username=store["username"],
+        store_username=store_id,
         customer_name=request.customer_name,
         customer_email=request.customer_email,
         customer_phone=request.customer_phone,
@@ -4,11 +4,12 @@ AGM Store Builder - Upload Endpoints
 File upload endpoints for images using Cloudinary.
 """
 
+import asyncio
 from typing import List, Optional
 from fastapi import APIRouter, UploadFile, File, HTTPException, status, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.dependencies import get_db, get_current_user_id
+from app.core.exceptions import FileUploadError
+from app.dependencies import get_current_user_id, get_upload_service
 from app.services.upload_service import UploadService
 from app.schemas.upload import (
     UploadResponse,
@@ -19,8 +20,10 @@ from app.schemas.common import MessageResponse
 router = APIRouter()
 
 # Allowed image types
-ALLOWED_TYPES = ["image/jpeg", "image/png", "image/webp", "image/gif"]
+ALLOWED_TYPES = frozenset({"image/jpeg", "image/png", "image/webp", "image/gif"})
+_INVALID_TYPE_DETAIL = f"Invalid file type. Allowed: {', '.join(sorted(ALLOWED_TYPES))}"
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
+READ_CHUNK_SIZE = 64 * 1024
 
 
 def validate_image(file: UploadFile) -> None:
@@ -28,15 +31,33 @@ def validate_image(file: UploadFile) -> None:
     if file.content_type not in ALLOWED_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid file type. Allowed: {', '.join(ALLOWED_TYPES)}",
+            detail=_INVALID_TYPE_DETAIL,
         )
 
 
+async def read_image(file: UploadFile, too_large_detail: str) -> bytes:
+    """
+    Read an uploaded file in chunks, stopping as soon as it exceeds MAX_FILE_SIZE.
+    
+    Rejects up front when the upload's size is already known.
+    """
+    if file.size is not None and file.size > MAX_FILE_SIZE:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=too_large_detail)
+    
+    content = bytearray()
+    while chunk := await file.read(READ_CHUNK_SIZE):
+        content += chunk
+        if len(content) > MAX_FILE_SIZE:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=too_large_detail)
+    
+    return bytes(content)
+
+
 @router.post("/image", response_model=UploadResponse)
 async def upload_image(
     image: UploadFile = File(...),
     user_id: str = Depends(get_current_user_id),
-    db: AsyncSession = Depends(get_db),
+    upload_service: UploadService = Depends(get_upload_service),
 ):
     """
     Upload a single image to Cloudinary.
@@ -46,15 +67,8 @@ async def upload_image(
     validate_image(image)
     
     # Read file content
-    content = await image.read()
+    content = await read_image(image, "File size exceeds 5MB limit")
     
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="File size exceeds 5MB limit",
-        )
-    
-    upload_service = UploadService()
     result = await upload_service.upload_image(
         file_content=content,
         filename=image.filename or "image.jpg",
@@ -71,7 +85,7 @@ async def upload_image(
 async def upload_multiple_images(
     images: List[UploadFile] = File(...),
     user_id: str = Depends(get_current_user_id),
-    db: AsyncSession = Depends(get_db),
+    upload_service: UploadService = Depends(get_upload_service),
 ):
     """
     Upload multiple images to Cloudinary (max 5).
@@ -87,24 +101,41 @@ async def upload_multiple_images(
     for image in images:
         validate_image(image)
     
-    upload_service = UploadService()
-    results = []
+    # Read (and size-check) every file before processing any of them
+    contents = [
+        await read_image(image, f"File {image.filename} exceeds 5MB limit")
+        for image in images
+    ]
     
-    for image in images:
-        content = await image.read()
-        
-        if len(content) > MAX_FILE_SIZE:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"File {image.filename} exceeds 5MB limit",
+    results = await asyncio.gather(
+        *(
+            upload_service.upload_image(
+                file_content=content,
+                filename=image.filename or "image.jpg",
+                user_id=user_id,
             )
-        
-        result = await upload_service.upload_image(
-            file_content=content,
-            filename=image.filename or "image.jpg",
-            user_id=user_id,
+            for image, content in zip(images, contents)
+        ),
+        return_exceptions=True,
+    )
+    
+    # Report every failed file at once rather than just the first
+    errors = {
+        image.filename or f"image_{index}": getattr(result, "message", str(result))
+        for index, (image, result) in enumerate(zip(images, results))
+        if isinstance(result, BaseException)
+    }
+    if errors:
+        # All or nothing: don't leave the files that did succeed behind
+        await asyncio.gather(
+            *(
+                upload_service.delete_image(result["public_id"], user_id)
+                for result in results
+                if not isinstance(result, BaseException)
+            ),
+            return_exceptions=True,
         )
-        results.append(result)
+        raise FileUploadError(message="Failed to process images", details={"files": errors})
     
     return {
         "success": True,
@@ -116,14 +147,13 @@ async def upload_multiple_images(
 async def delete_image(
     public_id: str,
     user_id: str = Depends(get_current_user_id),
-    db: AsyncSession = Depends(get_db),
+    upload_service: UploadService = Depends(get_upload_service),
 ):
     """
     Delete an image from Cloudinary.
     
     Removes the image by its public ID.
     """
-    upload_service = UploadService()
     await upload_service.delete_image(public_id, user_id)
     
     return {
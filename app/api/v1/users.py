@@ -6,8 +6,7 @@ User profile management endpoints.
 
 from fastapi import APIRouter, status
 
-from app.api.deps import DatabaseSession, CurrentUserId
-from app.services.user_service import UserService
+from app.api.deps import CurrentUserId, UserServiceDep
 from app.schemas.user import (
     UserResponse,
     UpdateProfileRequest,
@@ -22,14 +21,13 @@ router = APIRouter()
 @router.get("/me", response_model=UserProfileResponse)
 async def get_current_user(
     user_id: CurrentUserId,
-    db: DatabaseSession,
+    user_service: UserServiceDep,
 ):
     """
     Get the authenticated user's profile.
     
     Returns complete user profile information.
     """
-    user_service = UserService(db)
     user = await user_service.get_user_profile(user_id)
     
     return {
@@ -42,14 +40,13 @@ async def get_current_user(
 async def update_profile(
     request: UpdateProfileRequest,
     user_id: CurrentUserId,
-    db: DatabaseSession,
+    user_service: UserServiceDep,
 ):
     """
     Update the authenticated user's profile.
     
     Updates user profile fields like name and phone.
     """
-    user_service = UserService(db)
     user = await user_service.update_profile(
         user_id=user_id,
         full_name=request.full_name,
@@ -67,14 +64,13 @@ async def update_profile(
 async def change_password(
     request: ChangePasswordRequest,
     user_id: CurrentUserId,
-    db: DatabaseSession,
+    user_service: UserServiceDep,
 ):
     """
     Change the authenticated user's password.
     
     Requires current password verification.
     """
-    user_service = UserService(db)
     await user_service.change_password(
         user_id=user_id,
         current_password=request.currentPassword,
@@ -90,14 +86,13 @@ async def change_password(
 @router.delete("/me", response_model=MessageResponse)
 async def delete_account(
     user_id: CurrentUserId,
-    db: DatabaseSession,
+    user_service: UserServiceDep,
 ):
     """
     Delete the authenticated user's account.
     
     Performs a soft delete, preserving data for potential recovery.
     """
-    user_service = UserService(db)
     await user_service.delete_account(user_id)
     
     return {
@@ -4,19 +4,57 @@ AGM Store Builder - Webhook Endpoints
 Webhook handlers for external service callbacks (Monnify).
 """
 
-from fastapi import APIRouter, Request, HTTPException, status, Header
-from typing import Optional
+import asyncio
 import hashlib
+from fastapi import APIRouter, BackgroundTasks, Request, HTTPException, status, Header
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, Optional
 import hmac
+import orjson
 from loguru import logger
 
-from app.api.deps import DatabaseSession
 from app.core.config import settings
+from app.database.session import async_session_maker
+from app.repositories.webhook_event_repository import WebhookEventRepository
 from app.services.payment_service import PaymentService
 from app.schemas.common import MessageResponse
 
 router = APIRouter()
 
+# Largest webhook body accepted; Monnify payloads are a few KB
+MAX_WEBHOOK_BODY_BYTES = 1024 * 1024
+
+# Chunks at least this large are hashed on a worker thread; below it the
+# thread hop (~80us) costs more than SHA-512 itself (~170us per 64 KiB)
+_THREADED_HASH_MIN_BYTES = 64 * 1024
+
+# Hex length of an HMAC-SHA512 signature
+_SIGNATURE_HEX_LENGTH = 128
+
+
+@lru_cache(maxsize=4)
+def _keyed_mac(secret: str) -> hmac.HMAC:
+    """
+    Build an HMAC-SHA512 keyed with the webhook secret, with no data fed yet.
+    
+    The secret is fixed for the process, so the key-padded inner and outer
+    digest states are derived once here and ``copy()``-ed per webhook.
+    """
+    return hmac.new(secret.encode(), digestmod="sha512")
+
+
+def _signature_matches(mac: hmac.HMAC, signature: str) -> bool:
+    """Compare a fully fed MAC against the hex signature in constant time."""
+    if len(signature) != _SIGNATURE_HEX_LENGTH:
+        return False
+    
+    # Compare raw digests rather than formatting our digest as hex
+    try:
+        expected = bytes.fromhex(signature)
+    except ValueError:
+        return False
+    return hmac.compare_digest(mac.digest(), expected)
+
 
 def verify_monnify_signature(
     payload: bytes,
@@ -26,32 +64,200 @@ def verify_monnify_signature(
     """
     Verify Monnify webhook signature.
     
-    Monnify signs webhooks with HMAC SHA-512.
+    Monnify signs webhooks with HMAC SHA-512. The MAC starts from a
+    precomputed keyed state instead of re-deriving the key pads.
+    """
+    mac = _keyed_mac(secret).copy()
+    mac.update(payload)
+    
+    return _signature_matches(mac, signature)
+
+
+async def _read_body(request: Request, mac: Optional[hmac.HMAC] = None) -> bytearray:
+    """
+    Read the raw request body into a buffer sized from Content-Length.
+    
+    Chunks are copied into place instead of being collected and joined;
+    the buffer still grows or shrinks if the header was wrong. When a MAC
+    is given, each chunk is hashed as it arrives so verification needs no
+    second pass over the body.
+    
+    Raises:
+        HTTPException: 413 if the body exceeds MAX_WEBHOOK_BODY_BYTES
     """
-    computed_hash = hmac.new(
-        secret.encode(),
-        payload,
-        hashlib.sha512,
-    ).hexdigest()
+    try:
+        expected = max(int(request.headers.get("content-length", 0)), 0)
+    except ValueError:
+        expected = 0
+    
+    if expected > MAX_WEBHOOK_BODY_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail="Webhook payload too large",
+        )
+    
+    buffer = bytearray(expected)
+    offset = 0
+    async for chunk in request.stream():
+        if offset + len(chunk) > MAX_WEBHOOK_BODY_BYTES:
+            raise HTTPException(
+                status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                detail="Webhook payload too large",
+            )
+        buffer[offset:offset + len(chunk)] = chunk
+        offset += len(chunk)
+        if mac is not None:
+            if len(chunk) >= _THREADED_HASH_MIN_BYTES:
+                # hashlib releases the GIL for large buffers, so the loop keeps serving
+                await asyncio.to_thread(mac.update, chunk)
+            else:
+                mac.update(chunk)
+    del buffer[offset:]
     
-    return hmac.compare_digest(computed_hash, signature)
+    return buffer
+
+
+# =====================
+# Event Handlers
+# =====================
+
+async def _handle_successful_transaction(payment_service: PaymentService, event_data: dict) -> None:
+    """Mark the payment as paid."""
+    payment_reference = event_data.get("paymentReference")
+    monnify_reference = event_data.get("transactionReference")
+    amount_paid = float(event_data.get("amountPaid", 0))
+    
+    await payment_service.process_successful_payment(
+        payment_reference=payment_reference,
+        monnify_reference=monnify_reference,
+        amount_paid=amount_paid,
+        event_data=event_data,
+    )
+    
+    logger.info("Processed successful payment: {}", payment_reference)
+
+
+async def _handle_failed_transaction(payment_service: PaymentService, event_data: dict) -> None:
+    """Mark the payment as failed."""
+    payment_reference = event_data.get("paymentReference")
+    
+    await payment_service.process_failed_payment(
+        payment_reference=payment_reference,
+        event_data=event_data,
+    )
+    
+    logger.info("Processed failed payment: {}", payment_reference)
+
+
+async def _handle_expired_transaction(payment_service: PaymentService, event_data: dict) -> None:
+    """Mark the payment as expired."""
+    payment_reference = event_data.get("paymentReference")
+    
+    await payment_service.process_expired_payment(
+        payment_reference=payment_reference,
+        event_data=event_data,
+    )
+    
+    logger.info("Processed expired payment: {}", payment_reference)
+
+
+EventHandler = Callable[[PaymentService, dict], Awaitable[None]]
+
+# Event type -> handler, so dispatch is one dict lookup. Only types with a
+# handler are stored; disbursement and refund events are acknowledged and
+# ignored until payouts and refunds are recorded by this service
+_EVENT_HANDLERS: Dict[str, EventHandler] = {
+    "SUCCESSFUL_TRANSACTION": _handle_successful_transaction,
+    "FAILED_TRANSACTION": _handle_failed_transaction,
+    "EXPIRED_TRANSACTION": _handle_expired_transaction,
+}
+
+
+# eventData fields that identify an event, tried in order
+_EVENT_REFERENCE_FIELDS = ("transactionReference", "paymentReference")
+
+
+def _event_key(event_type: str, event_data: dict, body: bytes) -> str:
+    """Build the dedupe key for an event: its type plus its Monnify reference."""
+    for field in _EVENT_REFERENCE_FIELDS:
+        reference = event_data.get(field)
+        if reference:
+            return f"{event_type}:{reference}"[:160]
+    return f"{event_type}:{hashlib.sha256(body).hexdigest()}"
+
+
+async def _process_event(event_id: str) -> bool:
+    """
+    Claim a stored webhook event and run its handler.
+    
+    Uses its own session since the request-scoped one is closed by then.
+    The claim is an atomic UPDATE, so an event is handled by one worker
+    at a time; a failed run releases it for replay.
+    
+    Returns:
+        True if this call processed the event
+    """
+    async with async_session_maker() as session:
+        events = WebhookEventRepository(session)
+        event = await events.claim(event_id)
+        if event is None:
+            return False
+        
+        handler = _EVENT_HANDLERS.get(event.event_type)
+        if handler is None:
+            # Stored before its type lost its handler; nothing left to do
+            logger.info("Ignored webhook event type: {}", event.event_type)
+            await events.mark_processed(event_id)
+            return False
+        
+        try:
+            await handler(PaymentService(session), event.event_data)
+        except Exception:
+            logger.exception("Failed to process Monnify webhook: {}", event.event_type)
+            await session.rollback()
+            await events.release(event_id)
+            return False
+        
+        await events.mark_processed(event_id)
+        return True
+
+
+async def reprocess_pending_webhooks() -> int:
+    """
+    Replay stored webhook events that were never processed.
+    
+    Safe to run from every worker: each event is claimed before it is
+    handled, so live background tasks and other workers are skipped.
+    
+    Returns:
+        Number of events replayed
+    """
+    async with async_session_maker() as session:
+        event_ids = await WebhookEventRepository(session).get_unprocessed_ids()
+    
+    replayed = 0
+    for event_id in event_ids:
+        if await _process_event(event_id):
+            replayed += 1
+    
+    return replayed
 
 
 @router.post("/monnify", response_model=MessageResponse)
 async def monnify_webhook(
     request: Request,
-    db: DatabaseSession,
+    background_tasks: BackgroundTasks,
     monnify_signature: Optional[str] = Header(None, alias="Monnify-Signature"),
 ):
     """
     Handle Monnify payment webhooks.
     
-    Processes payment notifications from Monnify.
+    Verifies and parses payment notifications from Monnify, stores
+    each event in webhook_events, then acknowledges it; the event
+    itself is processed in the background.
     """
-    # Get raw body for signature verification
-    body = await request.body()
-    
-    # Verify signature in production
+    # Verify signature in production, hashing the body while it is read
+    mac = None
     if settings.is_production and settings.MONNIFY_WEBHOOK_SECRET:
         if not monnify_signature:
             logger.warning("Missing Monnify signature")
@@ -59,23 +265,29 @@ async def monnify_webhook(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Missing webhook signature",
             )
-        
-        if not verify_monnify_signature(
-            body,
-            monnify_signature,
-            settings.MONNIFY_WEBHOOK_SECRET,
-        ):
+        # Malformed signatures are rejected before any of the body is read
+        if len(monnify_signature) != _SIGNATURE_HEX_LENGTH:
             logger.warning("Invalid Monnify signature")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid webhook signature",
             )
+        mac = _keyed_mac(settings.MONNIFY_WEBHOOK_SECRET).copy()
+    
+    body = await _read_body(request, mac)
+    
+    if mac is not None and not _signature_matches(mac, monnify_signature):
+        logger.warning("Invalid Monnify signature")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid webhook signature",
+        )
     
     # Parse webhook data
     try:
-        data = await request.json()
-    except Exception as e:
-        logger.error(f"Failed to parse webhook data: {e}")
+        data = orjson.loads(body)
+    except orjson.JSONDecodeError as e:
+        logger.error("Failed to parse webhook data: {}", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid JSON payload",
@@ -84,78 +296,23 @@ async def monnify_webhook(
     event_type = data.get("eventType")
     event_data = data.get("eventData", {})
     
-    logger.info(f"Received Monnify webhook: {event_type}")
-    
-    # Process based on event type
-    payment_service = PaymentService(db)
-    
-    if event_type == "SUCCESSFUL_TRANSACTION":
-        payment_reference = event_data.get("paymentReference")
-        monnify_reference = event_data.get("transactionReference")
-        amount_paid = float(event_data.get("amountPaid", 0))
-        
-        await payment_service.process_successful_payment(
-            payment_reference=payment_reference,
-            monnify_reference=monnify_reference,
-            amount_paid=amount_paid,
-            event_data=event_data,
-        )
-        
-        logger.info(f"Processed successful payment: {payment_reference}")
-    
-    elif event_type == "FAILED_TRANSACTION":
-        payment_reference = event_data.get("paymentReference")
-        
-        await payment_service.process_failed_payment(
-            payment_reference=payment_reference,
-            event_data=event_data,
-        )
-        
-        logger.info(f"Processed failed payment: {payment_reference}")
-    
-    elif event_type == "EXPIRED_TRANSACTION":
-        payment_reference = event_data.get("paymentReference")
-        
-        await payment_service.process_expired_payment(
-            payment_reference=payment_reference,
-            event_data=event_data,
-        )
-        
-        logger.info(f"Processed expired payment: {payment_reference}")
+    logger.info("Received Monnify webhook: {}", event_type)
     
+    if event_type in _EVENT_HANDLERS:
+        # Store the event before acknowledging it, so a failed or lost
+        # background run can be replayed; an error here makes Monnify retry
+        async with async_session_maker() as session:
+            event_id = await WebhookEventRepository(session).record(
+                _event_key(event_type, event_data, bytes(body)), event_type, event_data,
+            )
+        if event_id is not None:
+            background_tasks.add_task(_process_event, event_id)
+        else:
+            logger.info("Duplicate Monnify webhook: {}", event_type)
     else:
-        logger.info(f"Ignored webhook event type: {event_type}")
-    
-    # Handle disbursement events
-    if event_type == "SUCCESSFUL_DISBURSEMENT":
-        disbursement_reference = event_data.get("reference")
-        logger.info(f"Processed successful disbursement: {disbursement_reference}")
-        # TODO: Update disbursement status in database
-    
-    elif event_type == "FAILED_DISBURSEMENT":
-        disbursement_reference = event_data.get("reference")
-        failure_reason = event_data.get("responseMessage", "Unknown error")
-        logger.info(f"Processed failed disbursement: {disbursement_reference} - {failure_reason}")
-        # TODO: Update disbursement status in database
-    
-    elif event_type == "REVERSED_DISBURSEMENT":
-        disbursement_reference = event_data.get("reference")
-        logger.info(f"Processed reversed disbursement: {disbursement_reference}")
-        # TODO: Update disbursement status in database
-    
-    # Handle refund events
-    elif event_type == "SUCCESSFUL_REFUND":
-        refund_reference = event_data.get("refundReference")
-        logger.info(f"Processed successful refund: {refund_reference}")
-        # TODO: Update refund status in database
-    
-    elif event_type == "FAILED_REFUND":
-        refund_reference = event_data.get("refundReference")
-        failure_reason = event_data.get("responseMessage", "Unknown error")
-        logger.info(f"Processed failed refund: {refund_reference} - {failure_reason}")
-        # TODO: Update refund status in database
+        logger.info("Ignored webhook event type: {}", event_type)
     
     return {
         "success": True,
-        "message": "Webhook processed successfully",
+        "message": "Webhook received",
     }
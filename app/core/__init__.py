@@ -8,12 +8,16 @@ from app.core.config import Settings, get_settings, settings
 from app.core.security import (
     hash_password,
     verify_password,
+    ahash_password,
+    averify_password,
     create_access_token,
     create_refresh_token,
     create_tokens,
     decode_token,
     verify_access_token,
+    decode_refresh_token,
     verify_refresh_token,
+    hash_refresh_token,
     create_password_reset_token,
     verify_password_reset_token,
 )
@@ -45,6 +49,9 @@ from app.core.constants import (
     NIGERIAN_STATES,
     PRODUCT_CATEGORIES,
     STORE_CATEGORIES,
+    NIGERIAN_STATE_SET,
+    PRODUCT_CATEGORY_SET,
+    STORE_CATEGORY_SET,
     API_V1_PREFIX,
 )
 
@@ -56,12 +63,16 @@ __all__ = [
     # Security
     "hash_password",
     "verify_password",
+    "ahash_password",
+    "averify_password",
     "create_access_token",
     "create_refresh_token",
     "create_tokens",
     "decode_token",
     "verify_access_token",
+    "decode_refresh_token",
     "verify_refresh_token",
+    "hash_refresh_token",
     "create_password_reset_token",
     "verify_password_reset_token",
     # Exceptions
@@ -91,5 +102,8 @@ __all__ = [
     "NIGERIAN_STATES",
     "PRODUCT_CATEGORIES",
     "STORE_CATEGORIES",
+    "NIGERIAN_STATE_SET",
+    "PRODUCT_CATEGORY_SET",
+    "STORE_CATEGORY_SET",
     "API_V1_PREFIX",
 ]
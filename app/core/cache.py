@@ -0,0 +1,136 @@
+"""
+AGM Store Builder - In-Process Cache
+
+Small TTL + LRU cache used for cache-aside lookups of hot, slowly
+changing data. Entries live in the worker process only, so TTLs are
+kept short to bound staleness across workers.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Bounded mapping of string keys to values with per-entry expiry.
+
+    The least recently used entry is evicted once ``maxsize`` is reached.
+    Not thread-safe; intended for use from the event loop.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Optional override of the default TTL in seconds
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove a single key if present."""
+        self._data.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        Remove every key starting with a prefix.
+
+        Args:
+            prefix: Key prefix to invalidate
+
+        Returns:
+            Number of removed entries
+        """
+        keys = [key for key in self._data if key.startswith(prefix)]
+        for key in keys:
+            del self._data[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# Dashboard aggregates, keyed by "analytics:{user_id}:..."
+analytics_cache = TTLCache(maxsize=2048, ttl=120)
+
+
+def invalidate_user_analytics(user_id: str) -> None:
+    """Drop cached analytics for a store owner after order writes."""
+    analytics_cache.delete_prefix(f"analytics:{user_id}:")
+
+
+# Public storefront responses, keyed by "storefront:{username}:..."
+storefront_cache = TTLCache(maxsize=4096, ttl=60)
+
+
+def invalidate_storefront(username: str) -> None:
+    """Drop cached public responses for a store after it or its products change."""
+    storefront_cache.delete_prefix(f"storefront:{username.lower()}:")
+
+
+# Active store (id, owner id, username) tuples for checkout, keyed by lowercased id or username
+checkout_store_cache = TTLCache(maxsize=1024, ttl=30)
+
+
+def invalidate_checkout_store(store_id: str, username: str) -> None:
+    """Drop a store's cached checkout lookup after it is edited, toggled or deleted."""
+    checkout_store_cache.delete(store_id.lower())
+    checkout_store_cache.delete(username.lower())
+
+
+# Ids of each owner's live stores, keyed by user id. Invalidation only
+# reaches the local worker, so the TTL bounds staleness on the others
+user_store_ids_cache = TTLCache(maxsize=4096, ttl=30)
+
+
+def invalidate_user_store_ids(user_id: str) -> None:
+    """Drop a user's cached store ids after a store is created or deleted."""
+    user_store_ids_cache.delete(user_id)
+
+
+# Role of each live user, keyed by user id; roles change rarely
+user_role_cache = TTLCache(maxsize=50000, ttl=60)
+
+
+def invalidate_user_role(user_id: str) -> None:
+    """Drop a user's cached role after it changes or the user is deleted."""
+    user_role_cache.delete(user_id)
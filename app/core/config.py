@@ -4,8 +4,8 @@ AGM Store Builder - Core Configuration Settings
 This module contains all environment-based settings using Pydantic Settings.
 """
 
-from functools import lru_cache
-from typing import List, Optional
+from functools import cached_property, lru_cache
+from typing import Any, List, Optional
 from pydantic import field_validator, AnyHttpUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -15,6 +15,8 @@ class Settings(BaseSettings):
     Application settings loaded from environment variables.
     
     Uses pydantic-settings for automatic validation and type coercion.
+    Values derived from the raw fields are cached on first access, since
+    settings are not modified after startup.
     """
     
     model_config = SettingsConfigDict(
@@ -26,6 +28,7 @@ class Settings(BaseSettings):
     
     # Application
     NODE_ENV: str = "development"
+    HOST: str = "0.0.0.0"
     PORT: int = 8000
     APP_URL: str = "http://localhost:8000"
     FRONTEND_URL: str = "http://localhost:3000"
@@ -37,7 +40,7 @@ class Settings(BaseSettings):
         """Alias for NODE_ENV for backward compatibility."""
         return self.NODE_ENV
     
-    @property
+    @cached_property
     def APP_DEBUG(self) -> bool:
         """Debug mode based on environment."""
         return self.NODE_ENV.lower() != "production"
@@ -49,23 +52,30 @@ class Settings(BaseSettings):
     DB_PASSWORD: str = ""
     DB_NAME: str = "agm_store_builder"
     DB_SSL: bool = False
-    DB_POOL_SIZE: int = 10
-    DB_MAX_OVERFLOW: int = 20
-    DB_POOL_RECYCLE: int = 3600
-    
-    @property
+    DB_DRIVER: str = "aiomysql"  # async DBAPI driver: aiomysql or asyncmy (install separately)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_USE_LIFO: bool = True  # reuse the most recently returned connection first
+    DB_POOL_PRE_PING: bool = False  # SELECT 1 on every checkout; pool_recycle retires idle connections instead
+    DB_USE_NULLPOOL: bool = False  # true when an external pooler (ProxySQL, TiDB gateway) pools instead
+    DB_MAX_EXECUTION_TIME_MS: int = 0  # 0 disables the per-session SELECT timeout
+    DB_QUERY_CACHE_SIZE: int = 1200  # compiled SQL statements cached per engine
+    
+    @cached_property
     def DATABASE_URL(self) -> str:
         """Construct async MySQL connection URL.
         
         Includes SSL parameters when DB_SSL=true (required for TiDB Cloud).
         """
         base = (
-            f"mysql+aiomysql://{self.DB_USER}:{self.DB_PASSWORD}"
+            f"mysql+{self.DB_DRIVER}://{self.DB_USER}:{self.DB_PASSWORD}"
             f"@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
         )
         return base
     
-    @property
+    @cached_property
     def DATABASE_URL_SYNC(self) -> str:
         """Construct sync MySQL connection URL for migrations.
         
@@ -94,7 +104,7 @@ class Settings(BaseSettings):
         """JWT signing algorithm."""
         return "HS256"
     
-    @property
+    @cached_property
     def ACCESS_TOKEN_EXPIRE_MINUTES(self) -> int:
         """Parse JWT_ACCESS_EXPIRY to minutes."""
         expiry = self.JWT_ACCESS_EXPIRY
@@ -106,7 +116,7 @@ class Settings(BaseSettings):
             return int(expiry[:-1]) * 60 * 24
         return 15  # Default 15 minutes
     
-    @property
+    @cached_property
     def REFRESH_TOKEN_EXPIRE_DAYS(self) -> int:
         """Parse JWT_REFRESH_EXPIRY to days."""
         expiry = self.JWT_REFRESH_EXPIRY
@@ -118,6 +128,11 @@ class Settings(BaseSettings):
             return int(expiry[:-1]) // (60 * 24)
         return 7  # Default 7 days
     
+    # Password Hashing
+    # bcrypt work factor (4-31); each +1 doubles hash/verify time (~250ms at 12).
+    # Existing hashes keep the cost they were created with.
+    BCRYPT_ROUNDS: int = 12
+    
     # Monnify Payment Gateway
     MONNIFY_BASE_URL: str = "https://sandbox.monnify.com"
     MONNIFY_API_KEY: str = ""
@@ -126,7 +141,7 @@ class Settings(BaseSettings):
     MONNIFY_WEBHOOK_SECRET: str = ""
     MONNIFY_REDIRECT_URL: str = ""
     
-    @property
+    @cached_property
     def get_monnify_redirect_url(self) -> str:
         """Get Monnify redirect URL, defaulting to frontend callback."""
         if self.MONNIFY_REDIRECT_URL:
@@ -155,11 +170,17 @@ class Settings(BaseSettings):
     RATE_LIMIT_WINDOW: int = 15
     RATE_LIMIT_MAX_REQUESTS: int = 100
     RATE_LIMIT_PER_MINUTE: int = 60
+    AUTH_RATE_LIMIT_PER_MINUTE: int = 10
+    AUTH_RATE_LIMIT_PER_IP_PER_MINUTE: int = 30
+    AUTH_RATE_LIMIT_PER_EMAIL_PER_MINUTE: int = 20
+    # Reverse proxies in front of the app that append to X-Forwarded-For;
+    # 0 means the header is ignored and the socket peer address is used
+    TRUSTED_PROXY_COUNT: int = 0
     
     # CORS
     CORS_ORIGIN: str = "http://localhost:3000"
     
-    @property
+    @cached_property
     def CORS_ORIGINS(self) -> List[str]:
         """Parse CORS_ORIGIN to list of origins."""
         if "," in self.CORS_ORIGIN:
@@ -175,15 +196,21 @@ class Settings(BaseSettings):
     DEFAULT_OTP: str = "123456"
     USE_DEFAULT_OTP: bool = True
     
-    @property
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production environment."""
         return self.NODE_ENV.lower() == "production"
     
-    @property
+    @cached_property
     def is_development(self) -> bool:
         """Check if running in development environment."""
         return self.NODE_ENV.lower() == "development"
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Resolve derived values at load so bad config fails at startup."""
+        for name, value in type(self).__dict__.items():
+            if isinstance(value, cached_property):
+                getattr(self, name)
 
 
 @lru_cache()
@@ -4,6 +4,7 @@ AGM Store Builder - Application Constants
 Centralized constants used throughout the application.
 """
 
+import re
 from enum import Enum
 
 
@@ -62,19 +63,20 @@ class ProfileVisibility(str, Enum):
     PRIVATE = "private"
 
 
-# Order status transitions (valid next statuses)
+# Order status transitions (valid next statuses), keyed by raw status value
+# so lookups and membership tests are plain str hashing
 ORDER_STATUS_TRANSITIONS = {
-    OrderStatus.PENDING: [OrderStatus.CONFIRMED, OrderStatus.CANCELLED],
-    OrderStatus.CONFIRMED: [OrderStatus.PROCESSING, OrderStatus.CANCELLED],
-    OrderStatus.PROCESSING: [OrderStatus.SHIPPED],
-    OrderStatus.SHIPPED: [OrderStatus.DELIVERED],
-    OrderStatus.DELIVERED: [OrderStatus.FULFILLED],
-    OrderStatus.FULFILLED: [],
-    OrderStatus.CANCELLED: [],
+    OrderStatus.PENDING.value: frozenset({OrderStatus.CONFIRMED.value, OrderStatus.CANCELLED.value}),
+    OrderStatus.CONFIRMED.value: frozenset({OrderStatus.PROCESSING.value, OrderStatus.CANCELLED.value}),
+    OrderStatus.PROCESSING.value: frozenset({OrderStatus.SHIPPED.value}),
+    OrderStatus.SHIPPED.value: frozenset({OrderStatus.DELIVERED.value}),
+    OrderStatus.DELIVERED.value: frozenset({OrderStatus.FULFILLED.value}),
+    OrderStatus.FULFILLED.value: frozenset(),
+    OrderStatus.CANCELLED.value: frozenset(),
 }
 
 
-# Nigerian States
+# Nigerian States, in display order
 NIGERIAN_STATES = [
     "Abia", "Adamawa", "Akwa Ibom", "Anambra", "Bauchi", "Bayelsa", "Benue",
     "Borno", "Cross River", "Delta", "Ebonyi", "Edo", "Ekiti", "Enugu",
@@ -84,7 +86,7 @@ NIGERIAN_STATES = [
 ]
 
 
-# Product categories (common e-commerce categories)
+# Product categories (common e-commerce categories), in display order
 PRODUCT_CATEGORIES = [
     "fashion",
     "electronics",
@@ -103,7 +105,7 @@ PRODUCT_CATEGORIES = [
 ]
 
 
-# Store categories
+# Store categories, in display order
 STORE_CATEGORIES = [
     "fashion",
     "electronics",
@@ -116,6 +118,12 @@ STORE_CATEGORIES = [
 ]
 
 
+# Hashed copies of the lists above for membership checks
+NIGERIAN_STATE_SET = frozenset(NIGERIAN_STATES)
+PRODUCT_CATEGORY_SET = frozenset(PRODUCT_CATEGORIES)
+STORE_CATEGORY_SET = frozenset(STORE_CATEGORIES)
+
+
 # File upload limits
 MAX_IMAGE_SIZE_MB = 5
 MAX_IMAGES_PER_PRODUCT = 10
@@ -129,6 +137,7 @@ MAX_PAGE_SIZE = 100
 
 # Nigerian phone number regex
 NIGERIAN_PHONE_REGEX = r"^(\+234|234|0)[789]\d{9}$"
+NIGERIAN_PHONE_PATTERN = re.compile(NIGERIAN_PHONE_REGEX)
 
 
 # Password requirements
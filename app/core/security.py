@@ -4,14 +4,42 @@ AGM Store Builder - Security Utilities
 JWT token handling and password hashing utilities.
 """
 
-from datetime import datetime, timedelta, timezone
+import asyncio
+import hashlib
+import os
+import time
+from uuid import uuid4
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from typing import Any, Dict, Optional, Tuple
 from jose import JWTError, jwt
 import bcrypt
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 from app.core.exceptions import TokenError
 
+# Valid bcrypt hash that no real password matches. Verified against when a
+# login email is unknown, so both branches cost one bcrypt at the same work
+# factor; only hashed at import when BCRYPT_ROUNDS differs from the default.
+DUMMY_PASSWORD_HASH = (
+    "$2b$12$AAMFMmR9SMFjPeCd27xxyuiffgyMkEo04uJy3pqfBOykWk3mjFyvK"
+    if settings.BCRYPT_ROUNDS == 12
+    else bcrypt.hashpw(b"dummy-password", bcrypt.gensalt(settings.BCRYPT_ROUNDS)).decode()
+)
+
+# Verified access tokens -> user ID, so repeat requests with the same
+# bearer token skip the signature check. Entries never outlive the token.
+_ACCESS_TOKEN_CACHE_TTL_SECONDS = 30
+_verified_access_tokens = TTLCache(maxsize=10000, ttl=_ACCESS_TOKEN_CACHE_TTL_SECONDS)
+
+# bcrypt releases the GIL, so a CPU-sized pool hashes in parallel while
+# bounding how many threads a login burst can occupy (excess calls queue)
+_HASH_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4,
+    thread_name_prefix="password-hash",
+)
+
 
 def hash_password(password: str) -> str:
     """
@@ -25,7 +53,7 @@ def hash_password(password: str) -> str:
     """
     # Encode password to bytes and hash using bcrypt directly
     password_bytes = password.encode('utf-8')
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(settings.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode('utf-8')
 
@@ -49,6 +77,37 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
+async def ahash_password(password: str) -> str:
+    """
+    Hash a password off the event loop.
+    
+    Args:
+        password: Plain text password to hash
+        
+    Returns:
+        Hashed password string
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_HASH_POOL, hash_password, password)
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password against its hash off the event loop.
+    
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Previously hashed password
+        
+    Returns:
+        True if password matches, False otherwise
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _HASH_POOL, verify_password, plain_password, hashed_password
+    )
+
+
 def create_access_token(
     data: Dict[str, Any],
     expires_delta: Optional[timedelta] = None,
@@ -65,16 +124,16 @@ def create_access_token(
     """
     to_encode = data.copy()
     
+    # Integer epoch claims: one clock read, no datetime round-trip in jwt.encode
+    now = int(time.time())
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        expire = now + int(expires_delta.total_seconds())
     else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+        expire = now + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
     
     to_encode.update({
         "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "iat": now,
         "token_type": "access",
     })
     
@@ -101,16 +160,17 @@ def create_refresh_token(
     """
     to_encode = data.copy()
     
+    # Integer epoch claims: one clock read, no datetime round-trip in jwt.encode
+    now = int(time.time())
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        expire = now + int(expires_delta.total_seconds())
     else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            days=settings.REFRESH_TOKEN_EXPIRE_DAYS
-        )
+        expire = now + settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
     
     to_encode.update({
         "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "iat": now,
+        "jti": uuid4().hex,
         "token_type": "refresh",
     })
     
@@ -167,6 +227,9 @@ def verify_access_token(token: str) -> str:
     """
     Verify an access token and extract user ID.
     
+    Successful verifications are cached briefly (never past the token's
+    expiry), so only the first request with a token pays for decoding.
+    
     Args:
         token: JWT access token to verify
         
@@ -176,6 +239,10 @@ def verify_access_token(token: str) -> str:
     Raises:
         TokenError: If token is invalid, expired, or not an access token
     """
+    cached = _verified_access_tokens.get(token)
+    if cached is not None:
+        return cached
+    
     payload = decode_token(token)
     
     if payload.get("token_type") != "access":
@@ -185,18 +252,27 @@ def verify_access_token(token: str) -> str:
     if not user_id:
         raise TokenError(message="Invalid token payload")
     
-    return str(user_id)
+    user_id = str(user_id)
+    remaining = float(payload.get("exp", 0)) - time.time()
+    if remaining > 0:
+        _verified_access_tokens.set(
+            token, user_id, ttl=min(remaining, _ACCESS_TOKEN_CACHE_TTL_SECONDS)
+        )
+    return user_id
 
 
-def verify_refresh_token(token: str) -> str:
+def decode_refresh_token(token: str) -> Dict[str, Any]:
     """
-    Verify a refresh token and extract user ID.
+    Decode a refresh token and check its type and subject.
+    
+    Revocation is not checked here; refresh tokens are persisted by hash
+    and revoked through the refresh_tokens table.
     
     Args:
         token: JWT refresh token to verify
         
     Returns:
-        User ID from the token
+        Decoded token payload
         
     Raises:
         TokenError: If token is invalid, expired, or not a refresh token
@@ -210,7 +286,36 @@ def verify_refresh_token(token: str) -> str:
     if not user_id:
         raise TokenError(message="Invalid token payload")
     
-    return str(user_id)
+    return payload
+
+
+def verify_refresh_token(token: str) -> str:
+    """
+    Verify a refresh token and extract user ID.
+    
+    Args:
+        token: JWT refresh token to verify
+        
+    Returns:
+        User ID from the token
+        
+    Raises:
+        TokenError: If token is invalid, expired, or not a refresh token
+    """
+    return str(decode_refresh_token(token)["sub"])
+
+
+def hash_refresh_token(token: str) -> str:
+    """
+    Hash a refresh token for storage and lookup.
+    
+    Args:
+        token: JWT refresh token
+        
+    Returns:
+        Hex SHA-256 digest of the token
+    """
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
 
 
 def create_password_reset_token(user_id: str) -> str:
@@ -223,11 +328,9 @@ def create_password_reset_token(user_id: str) -> str:
     Returns:
         Password reset token (expires in 10 minutes)
     """
-    expire = datetime.now(timezone.utc) + timedelta(minutes=10)
-    
     to_encode = {
         "sub": user_id,
-        "exp": expire,
+        "exp": int(time.time()) + 10 * 60,
         "token_type": "password_reset",
     }
     
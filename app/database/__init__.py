@@ -12,6 +12,7 @@ from app.database.connection import (
 from app.database.session import (
     async_session_maker,
     get_session,
+    get_session_maker,
 )
 from app.database.base import (
     Base,
@@ -28,6 +29,7 @@ __all__ = [
     # Session
     "async_session_maker",
     "get_session",
+    "get_session_maker",
     # Base models
     "Base",
     "BaseModel",
@@ -5,11 +5,16 @@ Base SQLAlchemy model with common mixins for all database models.
 """
 
 from datetime import datetime, timezone
-from typing import Any, Optional
+from functools import partial
+from typing import Any, Callable, Optional
 from sqlalchemy import Column, DateTime, Boolean, String, text
 from sqlalchemy.orm import DeclarativeBase, declared_attr, Mapped, mapped_column
 
 
+# Current UTC time; a partial calls datetime.now directly, with no lambda frame
+utc_now = partial(datetime.now, timezone.utc)
+
+
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
     pass
@@ -18,17 +23,19 @@ class Base(DeclarativeBase):
 class TimestampMixin:
     """Mixin that adds created_at and updated_at timestamp columns."""
     
+    # Also set client-side: MySQL has no RETURNING, so a server-only value
+    # would need a SELECT (or an implicit async lazy load) to be read back
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
         nullable=False,
-        default=lambda: datetime.now(timezone.utc),
+        default=utc_now,
         server_default=text("CURRENT_TIMESTAMP"),
     )
     
     updated_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime,
         nullable=True,
-        onupdate=lambda: datetime.now(timezone.utc),
+        onupdate=utc_now,
         server_onupdate=text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"),
     )
 
@@ -50,13 +57,35 @@ class SoftDeleteMixin:
     
     def soft_delete(self) -> None:
         """Mark the record as soft-deleted."""
-        self.deleted_at = datetime.now(timezone.utc)
+        self.deleted_at = utc_now()
     
     def restore(self) -> None:
         """Restore a soft-deleted record."""
         self.deleted_at = None
 
 
+def _build_to_dict_row(cls: type) -> Callable[[Any], dict[str, Any]]:
+    """
+    Compile a function returning every column of ``cls`` as a dict literal.
+    
+    Column names are inlined, so a call does no table reflection and no
+    per-column loop. DateTime columns are known from the table, so only
+    they are converted to ISO format strings, without a per-value type check.
+    """
+    entries = []
+    for prop in cls.__mapper__.column_attrs:
+        column = prop.columns[0]
+        value = f"self.{prop.key}"
+        if isinstance(column.type, DateTime):
+            value = f"(None if {value} is None else {value}.isoformat())"
+        entries.append(f"    {column.name!r}: {value},")
+    
+    source = "def _to_dict_row(self):\n    return {\n" + "\n".join(entries) + "\n    }\n"
+    namespace: dict[str, Any] = {}
+    exec(compile(source, f"<{cls.__name__}.to_dict>", "exec"), namespace)
+    return namespace["_to_dict_row"]
+
+
 class BaseModel(Base, TimestampMixin, SoftDeleteMixin):
     """
     Base model with UUID primary key, timestamps, and soft delete.
@@ -68,6 +97,12 @@ class BaseModel(Base, TimestampMixin, SoftDeleteMixin):
     
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Generate a specialised to_dict once the subclass is mapped."""
+        super().__init_subclass__(**kwargs)
+        if "__table__" in cls.__dict__:
+            cls._to_dict_row = _build_to_dict_row(cls)
+    
     def to_dict(self, exclude: Optional[list[str]] = None) -> dict[str, Any]:
         """
         Convert model to dictionary.
@@ -78,21 +113,10 @@ class BaseModel(Base, TimestampMixin, SoftDeleteMixin):
         Returns:
             Dictionary representation of the model
         """
-        exclude = exclude or []
-        result = {}
-        
-        for column in self.__table__.columns:
-            if column.name in exclude:
-                continue
-            
-            value = getattr(self, column.name)
-            
-            # Convert datetime to ISO format string
-            if isinstance(value, datetime):
-                value = value.isoformat()
-            
-            result[column.name] = value
-        
+        result = self._to_dict_row()
+        if exclude:
+            excluded = frozenset(exclude)
+            return {name: value for name, value in result.items() if name not in excluded}
         return result
     
     def __repr__(self) -> str:
@@ -4,33 +4,50 @@ AGM Store Builder - Database Connection
 MySQL async connection pool management using SQLAlchemy 2.0.
 """
 
+import asyncio
 import ssl
-from typing import Optional
+from contextlib import AsyncExitStack
+from typing import Dict, Optional
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     create_async_engine,
 )
-from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 from loguru import logger
 
 from app.core.config import settings
 
-# Global engine instance
-_engine: Optional[AsyncEngine] = None
+# Engine per event loop. Pooled connections are bound to the loop that
+# opened them, so a loop (e.g. a second test loop) never reuses another's.
+_engines: Dict[Optional[asyncio.AbstractEventLoop], AsyncEngine] = {}
+
+
+def _current_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Return the running event loop, or None outside of one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
 
 
 def get_engine() -> AsyncEngine:
     """
-    Get or create the async database engine.
+    Get or create the async database engine for the running event loop.
     
-    Uses a singleton pattern to ensure only one engine exists.
+    Each loop gets one engine; engines of closed loops are dropped when
+    a new one is created.
     
     Returns:
         AsyncEngine: SQLAlchemy async engine instance
     """
-    global _engine
+    loop = _current_loop()
+    engine = _engines.get(loop)
     
-    if _engine is None:
+    if engine is None:
+        for stale in [key for key in _engines if key is not None and key.is_closed()]:
+            del _engines[stale]
+        
         connect_args = {}
         if settings.DB_SSL:
             ssl_ctx = ssl.create_default_context()
@@ -38,18 +55,47 @@ def get_engine() -> AsyncEngine:
             ssl_ctx.verify_mode = ssl.CERT_NONE
             connect_args["ssl"] = ssl_ctx
 
-        _engine = create_async_engine(
+        if settings.DB_USE_NULLPOOL:
+            # An external pooler owns connection reuse; a second in-process
+            # pool (and its checkout pings) would only add latency
+            pool_args = {"poolclass": NullPool}
+        else:
+            pool_args = {
+                "poolclass": AsyncAdaptedQueuePool,
+                "pool_size": settings.DB_POOL_SIZE,
+                "max_overflow": settings.DB_MAX_OVERFLOW,
+                "pool_recycle": settings.DB_POOL_RECYCLE,
+                "pool_timeout": settings.DB_POOL_TIMEOUT,
+                "pool_use_lifo": settings.DB_POOL_USE_LIFO,
+                # Off by default: a ping costs a round-trip per checkout, while
+                # pool_recycle drops connections before the server's idle
+                # timeout and aiomysql sets SO_KEEPALIVE on every socket
+                "pool_pre_ping": settings.DB_POOL_PRE_PING,
+            }
+
+        engine = create_async_engine(
             settings.DATABASE_URL,
-            poolclass=AsyncAdaptedQueuePool,
-            pool_size=settings.DB_POOL_SIZE,
-            max_overflow=settings.DB_MAX_OVERFLOW,
-            pool_recycle=settings.DB_POOL_RECYCLE,
-            pool_pre_ping=True,
+            query_cache_size=settings.DB_QUERY_CACHE_SIZE,
             echo=settings.APP_DEBUG and settings.APP_ENV == "development",
             connect_args=connect_args,
+            **pool_args,
         )
+        
+        if settings.DB_MAX_EXECUTION_TIME_MS > 0:
+            event.listen(engine.sync_engine, "connect", _set_session_timeouts)
+        
+        _engines[loop] = engine
     
-    return _engine
+    return engine
+
+
+def _set_session_timeouts(dbapi_connection, connection_record) -> None:
+    """Cap SELECT execution time on every new pooled connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute(
+        f"SET SESSION max_execution_time = {int(settings.DB_MAX_EXECUTION_TIME_MS)}"
+    )
+    cursor.close()
 
 
 async def init_database() -> None:
@@ -57,16 +103,26 @@ async def init_database() -> None:
     Initialize the database connection pool.
     
     Called during application startup to ensure the database
-    is accessible and the connection pool is ready.
+    is accessible and the connection pool is ready. The pool is
+    pre-warmed with DB_POOL_SIZE connections, opened concurrently, so
+    early requests don't pay TCP/TLS/auth setup.
     """
     engine = get_engine()
+    warm_count = 1 if settings.DB_USE_NULLPOOL else settings.DB_POOL_SIZE
     
-    # Test the connection
+    # Hold every connection open at once so each is a new one, then
+    # return them all to the pool
     try:
-        async with engine.connect() as conn:
-            from sqlalchemy import text
-            await conn.execute(text("SELECT 1"))
-        logger.info(f"Connected to database: {settings.DB_NAME}@{settings.DB_HOST}")
+        async with AsyncExitStack() as stack:
+            connections = await asyncio.gather(*(
+                stack.enter_async_context(engine.connect())
+                for _ in range(warm_count)
+            ))
+            await connections[0].execute(text("SELECT 1"))
+        logger.info(
+            f"Connected to database: {settings.DB_NAME}@{settings.DB_HOST} "
+            f"({warm_count} connections warmed)"
+        )
     except Exception as e:
         logger.error(f"Failed to connect to database: {e}")
         raise
@@ -76,11 +132,11 @@ async def close_database() -> None:
     """
     Close the database connection pool.
     
-    Called during application shutdown to properly close all connections.
+    Called during application shutdown to properly close all connections
+    of the running loop's engine.
     """
-    global _engine
+    engine = _engines.pop(_current_loop(), None)
     
-    if _engine is not None:
-        await _engine.dispose()
-        _engine = None
+    if engine is not None:
+        await engine.dispose()
         logger.info("Database connection pool closed")
@@ -4,29 +4,57 @@ AGM Store Builder - Database Session Management
 Async session factory for SQLAlchemy ORM operations.
 """
 
+from typing import Any, Optional
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.database.connection import get_engine
 
+# Session factory, built on first use and rebuilt if the engine is replaced
+_session_maker: Optional[async_sessionmaker[AsyncSession]] = None
+
 
 def get_session_maker() -> async_sessionmaker[AsyncSession]:
     """
-    Create an async session maker factory.
+    Get the async session maker factory for the current engine.
+    
+    Nothing is created at import time; the engine and factory are built
+    by the first session request.
     
     Returns:
         async_sessionmaker: Factory for creating async sessions
     """
-    return async_sessionmaker(
-        bind=get_engine(),
-        class_=AsyncSession,
-        expire_on_commit=False,
-        autocommit=False,
-        autoflush=False,
-    )
+    global _session_maker
+    
+    engine = get_engine()
+    if _session_maker is None or _session_maker.kw["bind"] is not engine:
+        _session_maker = async_sessionmaker(
+            bind=engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autocommit=False,
+            autoflush=False,
+        )
+    return _session_maker
+
+
+class _LazySessionMaker:
+    """
+    Module-level stand-in for the session maker.
+    
+    Calling it or reading an attribute (``begin``, ``configure``, ...)
+    resolves the real factory, so importing this module still builds
+    nothing.
+    """
+    
+    def __call__(self, **local_kw: Any) -> AsyncSession:
+        return get_session_maker()(**local_kw)
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_session_maker(), name)
 
 
-# Create a session maker instance
-async_session_maker = get_session_maker()
+# Session maker instance; use as ``async with async_session_maker() as session``
+async_session_maker: async_sessionmaker[AsyncSession] = _LazySessionMaker()  # type: ignore[assignment]
 
 
 async def get_session() -> AsyncSession:
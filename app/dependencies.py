@@ -5,49 +5,115 @@ FastAPI dependency injection functions for database sessions,
 authentication, rate limiting, and other shared dependencies.
 """
 
-from typing import Annotated, AsyncGenerator, Optional
+from typing import Annotated, AsyncGenerator, List, Optional
 from fastapi import Depends, HTTPException, status, Request
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.security import HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
+from loguru import logger
 
 from app.core.config import settings
 from app.core.security import verify_access_token
 from app.core.exceptions import AuthenticationError, AuthorizationError
 from app.core.constants import UserRole
 from app.database.session import async_session_maker
+from app.repositories.store_repository import StoreRepository
+from app.repositories.user_repository import UserRepository
+from app.services.order_service import OrderService
+from app.services.product_service import ProductService
+from app.services.store_service import StoreService
+from app.services.upload_service import UploadService
+from app.services.user_service import UserService
+from app.utils.helpers import client_ip
+
+
+class BearerToken(HTTPBearer):
+    """
+    HTTP Bearer scheme that yields the raw token string.
+    
+    Documented in OpenAPI like HTTPBearer, but the Authorization header is
+    split directly instead of building an HTTPAuthorizationCredentials
+    model per request. Returns None when no bearer token is sent.
+    """
+    
+    async def __call__(self, request: Request) -> Optional[str]:  # type: ignore[override]
+        authorization = request.headers.get("authorization")
+        if not authorization:
+            return None
+        
+        scheme, _, token = authorization.partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return None
+        return token
+
 
 # HTTP Bearer security scheme
-security = HTTPBearer(auto_error=False)
+security = BearerToken(scheme_name="HTTPBearer", auto_error=False)
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency to get an async database session.
     
-    Yields an async SQLAlchemy session and ensures proper cleanup.
+    Yields an async SQLAlchemy session; leaving the context manager
+    closes it and returns any connection to the pool.
     
     Yields:
         AsyncSession: Database session
     """
     async with async_session_maker() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
 
 
 # Type alias for database session dependency
 DatabaseSession = Annotated[AsyncSession, Depends(get_db)]
 
 
+def get_product_service(db: DatabaseSession) -> ProductService:
+    """Dependency providing a ProductService bound to the request session."""
+    return ProductService(db)
+
+
+def get_store_service(db: DatabaseSession) -> StoreService:
+    """Dependency providing a StoreService bound to the request session."""
+    return StoreService(db)
+
+
+def get_order_service(db: DatabaseSession) -> OrderService:
+    """Dependency providing an OrderService bound to the request session."""
+    return OrderService(db)
+
+
+def get_user_service(db: DatabaseSession) -> UserService:
+    """Dependency providing a UserService bound to the request session."""
+    return UserService(db)
+
+
+# UploadService holds no per-request state, so one instance is shared
+_upload_service = UploadService()
+
+
+def get_upload_service() -> UploadService:
+    """Dependency providing the shared UploadService."""
+    return _upload_service
+
+
+# Type aliases for service dependencies; FastAPI resolves each once per
+# request, so services requested together share one session
+ProductServiceDep = Annotated[ProductService, Depends(get_product_service)]
+StoreServiceDep = Annotated[StoreService, Depends(get_store_service)]
+OrderServiceDep = Annotated[OrderService, Depends(get_order_service)]
+UserServiceDep = Annotated[UserService, Depends(get_user_service)]
+UploadServiceDep = Annotated[UploadService, Depends(get_upload_service)]
+
+
 async def get_current_user_id(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    token: Optional[str] = Depends(security),
 ) -> str:
     """
     Dependency to get the current user's ID from JWT token.
     
     Args:
-        credentials: HTTP Bearer credentials from request
+        token: Bearer token from the Authorization header
         
     Returns:
         User ID string extracted from the token
@@ -55,9 +121,7 @@ async def get_current_user_id(
     Raises:
         HTTPException: If token is missing or invalid
     """
-    from loguru import logger
-    
-    if credentials is None:
+    if token is None:
         logger.warning("Auth failed: No credentials provided")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -66,7 +130,7 @@ async def get_current_user_id(
         )
     
     try:
-        user_id = verify_access_token(credentials.credentials)
+        user_id = verify_access_token(token)
         logger.debug(f"Auth successful for user: {user_id}")
         return user_id
     except Exception as e:
@@ -83,7 +147,7 @@ CurrentUserId = Annotated[str, Depends(get_current_user_id)]
 
 
 async def get_optional_user_id(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    token: Optional[str] = Depends(security),
 ) -> Optional[str]:
     """
     Dependency to optionally get the current user's ID.
@@ -92,16 +156,16 @@ async def get_optional_user_id(
     Useful for endpoints that work for both authenticated and anonymous users.
     
     Args:
-        credentials: HTTP Bearer credentials from request
+        token: Bearer token from the Authorization header
         
     Returns:
         User ID string if authenticated, None otherwise
     """
-    if credentials is None:
+    if token is None:
         return None
     
     try:
-        return verify_access_token(credentials.credentials)
+        return verify_access_token(token)
     except Exception:
         return None
 
@@ -110,6 +174,26 @@ async def get_optional_user_id(
 OptionalUserId = Annotated[Optional[str], Depends(get_optional_user_id)]
 
 
+async def get_user_store_ids(
+    db: DatabaseSession,
+    user_id: CurrentUserId,
+) -> List[str]:
+    """
+    Dependency to get the ids of the current user's stores.
+    
+    FastAPI resolves a dependency once per request, so every consumer in
+    the request shares one lookup; the repository also caches it briefly.
+    
+    Returns:
+        List of store IDs owned by the user
+    """
+    return await StoreRepository(db).get_ids_by_user(user_id)
+
+
+# Type alias for the current user's store ids
+UserStoreIds = Annotated[List[str], Depends(get_user_store_ids)]
+
+
 class RoleChecker:
     """
     Dependency class to check if user has required role(s).
@@ -125,27 +209,29 @@ class RoleChecker:
     
     def __init__(self, allowed_roles: list[UserRole]):
         self.allowed_roles = allowed_roles
+        self._allowed_values = frozenset(role.value for role in allowed_roles)
     
     async def __call__(
         self,
+        request: Request,
         db: DatabaseSession,
         user_id: CurrentUserId,
     ) -> bool:
         """
         Check if the current user has one of the allowed roles.
         
-        This is a placeholder - actual implementation needs the User model.
+        Only the role is fetched, and the repository caches it briefly.
+        It is also kept on request.state, so stacked role checks in one
+        request share a single lookup.
         """
-        # Import here to avoid circular imports
-        from app.repositories.user_repository import UserRepository
-        
-        user_repo = UserRepository(db)
-        user = await user_repo.get_by_id(user_id)
-        
-        if user is None:
-            raise AuthenticationError(message="User not found")
+        role = getattr(request.state, "current_user_role", None)
+        if role is None:
+            role = await UserRepository(db).get_role(user_id)
+            if role is None:
+                raise AuthenticationError(message="User not found")
+            request.state.current_user_role = role
         
-        if user.role not in [role.value for role in self.allowed_roles]:
+        if role not in self._allowed_values:
             raise AuthorizationError(
                 message="You don't have permission to access this resource"
             )
@@ -174,11 +260,7 @@ def get_client_ip(request: Request) -> str:
     Returns:
         Client IP address string
     """
-    forwarded = request.headers.get("X-Forwarded-For")
-    if forwarded:
-        # Return the first IP in the chain (original client)
-        return forwarded.split(",")[0].strip()
-    return request.client.host if request.client else "unknown"
+    return client_ip(request)
 
 
 ClientIP = Annotated[str, Depends(get_client_ip)]
@@ -8,8 +8,7 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, Request, status
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from loguru import logger
 
@@ -17,9 +16,13 @@ from app.core.config import settings
 from app.core.constants import API_V1_PREFIX
 from app.core.exceptions import AGMException
 from app.database.connection import init_database, close_database
+from app.services.monnify_service import close_http_client
 from app.api.v1.router import api_v1_router
+from app.api.v1.webhooks import reprocess_pending_webhooks
+from app.middleware.cors import setup_cors
 from app.middleware.error_handler import setup_exception_handlers
 from app.middleware.logging import setup_logging
+from app.middleware.rate_limit import setup_rate_limiting
 
 
 @asynccontextmanager
@@ -40,11 +43,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await init_database()
     logger.info("✅ Database connection pool initialized")
     
+    # Replay webhook events left unprocessed by a previous run
+    try:
+        replayed = await reprocess_pending_webhooks()
+        if replayed:
+            logger.info(f"Replayed {replayed} pending webhook events")
+    except Exception:
+        logger.exception("Failed to replay pending webhook events")
+    
     yield
     
     # Shutdown
     logger.info("🛑 Shutting down AGM Store Builder API...")
     await close_database()
+    await close_http_client()
     logger.info("✅ Database connections closed")
 
 
@@ -69,21 +81,20 @@ def create_application() -> FastAPI:
         docs_url="/docs" if settings.APP_DEBUG else None,
         redoc_url="/redoc" if settings.APP_DEBUG else None,
         openapi_url="/openapi.json" if settings.APP_DEBUG else None,
+        # orjson-encoded responses for every route unless it overrides this
+        default_response_class=ORJSONResponse,
         lifespan=lifespan,
     )
     
     # Add CORS middleware
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=settings.CORS_ORIGINS,
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    setup_cors(app)
     
     # Setup exception handlers
     setup_exception_handlers(app)
     
+    # Setup rate limiting
+    setup_rate_limiting(app)
+    
     # Include API routers
     app.include_router(api_v1_router, prefix=API_V1_PREFIX)
     
@@ -119,6 +130,7 @@ app = create_application()
 
 # For running with uvicorn directly
 if __name__ == "__main__":
+    import sys
     import uvicorn
     
     uvicorn.run(
@@ -127,4 +139,7 @@ if __name__ == "__main__":
         port=settings.PORT,
         reload=settings.APP_DEBUG,
         log_level=settings.LOG_LEVEL.lower(),
+        # uvloop ships with uvicorn[standard] everywhere except Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
     )
@@ -12,6 +12,7 @@ from app.middleware.logging import setup_logging
 from app.middleware.cors import setup_cors
 from app.middleware.rate_limit import (
     limiter,
+    rate_limit,
     setup_rate_limiting,
     rate_limit_exceeded_handler,
 )
@@ -26,6 +27,7 @@ __all__ = [
     "setup_cors",
     # Rate limiting
     "limiter",
+    "rate_limit",
     "setup_rate_limiting",
     "rate_limit_exceeded_handler",
 ]
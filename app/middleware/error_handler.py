@@ -6,12 +6,13 @@ Centralized exception handling for consistent API error responses.
 
 from typing import Optional
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError as PydanticValidationError
 from sqlalchemy.exc import SQLAlchemyError
 from loguru import logger
 
+from app.core.config import settings
 from app.core.exceptions import AGMException
 
 
@@ -19,7 +20,8 @@ def create_error_response(
     status_code: int,
     message: str,
     details: Optional[dict] = None,
-) -> JSONResponse:
+    headers: Optional[dict] = None,
+) -> ORJSONResponse:
     """
     Create a standardized error response.
     
@@ -27,9 +29,10 @@ def create_error_response(
         status_code: HTTP status code
         message: Error message
         details: Optional additional error details
+        headers: Optional extra response headers
         
     Returns:
-        JSONResponse with standardized error format
+        ORJSONResponse with standardized error format
     """
     content = {
         "success": False,
@@ -40,20 +43,40 @@ def create_error_response(
     if details:
         content["details"] = details
     
-    # Include CORS headers in error responses
-    headers = {
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Methods": "GET, POST, PUT, PATCH, DELETE, OPTIONS",
-        "Access-Control-Allow-Headers": "*",
-    }
-    
-    return JSONResponse(
+    # CORS headers are added by CORSMiddleware, which wraps these responses
+    # (except the catch-all 500, see cors_error_headers)
+    return ORJSONResponse(
         status_code=status_code,
         content=content,
         headers=headers,
     )
 
 
+def cors_error_headers(request: Request) -> dict:
+    """
+    CORS headers for a response that bypasses CORSMiddleware.
+    
+    The Exception handler runs in Starlette's ServerErrorMiddleware, which
+    sits outside CORSMiddleware; without these a browser reports the 500
+    as an opaque CORS failure.
+    
+    Args:
+        request: Incoming request
+        
+    Returns:
+        Headers allowing the request's origin, or {} if it is not allowed
+    """
+    origin = request.headers.get("origin")
+    if not origin or origin not in settings.CORS_ORIGINS:
+        return {}
+    
+    return {
+        "Access-Control-Allow-Origin": origin,
+        "Access-Control-Allow-Credentials": "true",
+        "Vary": "Origin",
+    }
+
+
 def setup_exception_handlers(app: FastAPI) -> None:
     """
     Configure exception handlers for the FastAPI application.
@@ -66,14 +89,13 @@ def setup_exception_handlers(app: FastAPI) -> None:
     async def agm_exception_handler(request: Request, exc: AGMException):
         """Handle custom AGM exceptions."""
         logger.warning(
-            f"AGMException: {exc.message} | "
-            f"Status: {exc.status_code} | "
-            f"Path: {request.url.path}"
+            "AGMException: {} | Status: {} | Path: {}",
+            exc.message, exc.status_code, request.url.path,
         )
         return create_error_response(
             status_code=exc.status_code,
             message=exc.message,
-            details=exc.details if exc.details else None,
+            details=exc.details,
         )
     
     @app.exception_handler(RequestValidationError)
@@ -82,16 +104,14 @@ def setup_exception_handlers(app: FastAPI) -> None:
         exc: RequestValidationError,
     ):
         """Handle Pydantic validation errors from request parsing."""
-        errors = {}
-        for error in exc.errors():
-            field = ".".join(str(loc) for loc in error["loc"][1:])  # Skip 'body'
-            if field:
-                errors[field] = error["msg"]
-            else:
-                errors["body"] = error["msg"]
+        # Skip the leading 'body'/'query' location; whole-body errors key as "body"
+        errors = {
+            ".".join(map(str, error["loc"][1:])) or "body": error["msg"]
+            for error in exc.errors()
+        }
         
         logger.warning(
-            f"Validation Error | Path: {request.url.path} | Errors: {errors}"
+            "Validation Error | Path: {} | Errors: {}", request.url.path, errors
         )
         
         return create_error_response(
@@ -106,10 +126,10 @@ def setup_exception_handlers(app: FastAPI) -> None:
         exc: PydanticValidationError,
     ):
         """Handle Pydantic validation errors from data processing."""
-        errors = {}
-        for error in exc.errors():
-            field = ".".join(str(loc) for loc in error["loc"])
-            errors[field] = error["msg"]
+        errors = {
+            ".".join(map(str, error["loc"])): error["msg"]
+            for error in exc.errors()
+        }
         
         return create_error_response(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -123,8 +143,11 @@ def setup_exception_handlers(app: FastAPI) -> None:
         exc: SQLAlchemyError,
     ):
         """Handle database errors."""
+        # Log the driver error rather than str(exc), which renders the full
+        # SQL statement and bound parameters
         logger.error(
-            f"Database Error | Path: {request.url.path} | Error: {str(exc)}"
+            "Database Error | Path: {} | Error: {}: {}",
+            request.url.path, type(exc).__name__, getattr(exc, "orig", None) or exc,
         )
         
         return create_error_response(
@@ -136,10 +159,11 @@ def setup_exception_handlers(app: FastAPI) -> None:
     async def general_exception_handler(request: Request, exc: Exception):
         """Handle all unhandled exceptions."""
         logger.exception(
-            f"Unhandled Exception | Path: {request.url.path} | Error: {str(exc)}"
+            "Unhandled Exception | Path: {} | Error: {}", request.url.path, exc
         )
         
         return create_error_response(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             message="An unexpected error occurred",
+            headers=cors_error_headers(request),
         )
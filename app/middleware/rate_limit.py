@@ -4,66 +4,162 @@ AGM Store Builder - Rate Limiting Middleware
 Rate limiting using SlowAPI for request throttling.
 """
 
+from typing import Callable, Awaitable
+
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from slowapi.util import get_remote_address
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.exceptions import RateLimitError
+
+
+def get_rate_limit_key(request: Request) -> str:
+    """
+    Get the rate limit key for a request.
+    
+    X-Forwarded-For is client-controlled, so it is only read when
+    TRUSTED_PROXY_COUNT proxies are configured; the client address is
+    then the entry those proxies appended, counted from the right.
+    Otherwise the socket peer address is used.
+    
+    Args:
+        request: FastAPI Request object
+        
+    Returns:
+        Rate limit key string
+    """
+    hops = settings.TRUSTED_PROXY_COUNT
+    if hops > 0:
+        forwarded = [ip.strip() for ip in request.headers.get("X-Forwarded-For", "").split(",") if ip.strip()]
+        if len(forwarded) >= hops:
+            return forwarded[-hops]
+    return request.client.host if request.client else "unknown"
 
 
 # Create limiter instance
 limiter = Limiter(
-    key_func=get_remote_address,
+    key_func=get_rate_limit_key,
     default_limits=[f"{settings.RATE_LIMIT_PER_MINUTE}/minute"],
 )
 
+# Fixed-window hit counters for sensitive endpoints, keyed "rl:{scope}:..."
+_endpoint_hits = TTLCache(maxsize=50000, ttl=60)
 
-def get_rate_limit_key(request: Request) -> str:
+
+async def get_request_email(request: Request) -> str:
     """
-    Get the rate limit key for a request.
+    Get the normalized email from a request's JSON body.
     
-    Uses the client's IP address as the key.
-    For authenticated users, could use user ID.
+    FastAPI has already read and parsed the body for the endpoint, and
+    Starlette caches it on the request, so this does not read it again.
     
     Args:
         request: FastAPI Request object
         
     Returns:
-        Rate limit key string
+        Lowercased email, or an empty string if the body has none
     """
-    # Get client IP
-    forwarded = request.headers.get("X-Forwarded-For")
-    if forwarded:
-        return forwarded.split(",")[0].strip()
-    return request.client.host if request.client else "unknown"
+    try:
+        body = await request.json()
+    except ValueError:
+        return ""
+    
+    email = body.get("email") if isinstance(body, dict) else None
+    return email.strip().lower() if isinstance(email, str) else ""
+
+
+def _hit(key: str, limit: int, window: int) -> bool:
+    """Count a request against a bucket; False once the bucket is over its limit."""
+    hits = _endpoint_hits.get(key)
+    if hits is None:
+        # The window starts at the first hit and expires with the entry
+        _endpoint_hits.set(key, [1], ttl=window)
+        return limit >= 1
+    
+    hits[0] += 1
+    return hits[0] <= limit
+
+
+def rate_limit(
+    scope: str,
+    limit: int = settings.AUTH_RATE_LIMIT_PER_MINUTE,
+    window: int = 60,
+    ip_limit: int = settings.AUTH_RATE_LIMIT_PER_IP_PER_MINUTE,
+    email_limit: int = settings.AUTH_RATE_LIMIT_PER_EMAIL_PER_MINUTE,
+) -> Callable[[Request], Awaitable[None]]:
+    """
+    Build a dependency that limits requests per client IP and per email.
+    
+    Rejects requests before any DB or password-hashing work is done.
+    Three buckets are counted: IP and email together (``limit``), the IP
+    across all emails (``ip_limit``, against credential stuffing), and the
+    email across all IPs (``email_limit``, against distributed guessing).
+    Counters are kept in-process, so each worker enforces its own limit.
+    
+    Args:
+        scope: Name of the protected action (e.g. "login")
+        limit: Maximum requests per IP and email per window
+        window: Window length in seconds
+        ip_limit: Maximum requests per IP per window
+        email_limit: Maximum requests per email per window
+        
+    Returns:
+        FastAPI dependency callable
+        
+    Raises:
+        RateLimitError: When the client exceeds the limit
+    """
+    async def dependency(request: Request) -> None:
+        ip = get_rate_limit_key(request)
+        email = await get_request_email(request)
+        
+        # Every bucket is counted, so hitting one limit does not pause the others
+        allowed = _hit(f"rl:{scope}:ip:{ip}", ip_limit, window)
+        if email:
+            allowed = _hit(f"rl:{scope}:{ip}:{email}", limit, window) and allowed
+            allowed = _hit(f"rl:{scope}:email:{email}", email_limit, window) and allowed
+        else:
+            allowed = _hit(f"rl:{scope}:{ip}:", limit, window) and allowed
+        
+        if not allowed:
+            raise RateLimitError(retry_after=window)
+    
+    return dependency
+
+
+# The 429 body and headers never vary, so they are built once; responses
+# only read them when rendering
+_RATE_LIMIT_EXCEEDED_CONTENT = {
+    "success": False,
+    "message": "Too many requests. Please try again later.",
+    "statusCode": 429,
+    "details": {
+        "retry_after": 60,
+    },
+}
+_RATE_LIMIT_EXCEEDED_HEADERS = {
+    "Retry-After": "60",
+    "X-RateLimit-Limit": str(settings.RATE_LIMIT_PER_MINUTE),
+    "X-RateLimit-Remaining": "0",
+}
 
 
 async def rate_limit_exceeded_handler(
     request: Request,
     exc: RateLimitExceeded,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Custom handler for rate limit exceeded errors.
     
     Returns a JSON response with retry information.
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=429,
-        content={
-            "success": False,
-            "message": "Too many requests. Please try again later.",
-            "statusCode": 429,
-            "details": {
-                "retry_after": 60,
-            },
-        },
-        headers={
-            "Retry-After": "60",
-            "X-RateLimit-Limit": str(settings.RATE_LIMIT_PER_MINUTE),
-            "X-RateLimit-Remaining": "0",
-        },
+        content=_RATE_LIMIT_EXCEEDED_CONTENT,
+        headers=_RATE_LIMIT_EXCEEDED_HEADERS,
     )
 
 
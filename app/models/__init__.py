@@ -18,6 +18,7 @@ from app.models.otp_verification import OTPVerification
 from app.models.refresh_token import RefreshToken
 from app.models.disbursement import Disbursement
 from app.models.refund import Refund
+from app.models.webhook_event import WebhookEvent
 
 __all__ = [
     "Base",
@@ -33,4 +34,5 @@ __all__ = [
     "RefreshToken",
     "Disbursement",
     "Refund",
+    "WebhookEvent",
 ]
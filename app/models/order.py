@@ -6,7 +6,7 @@ SQLAlchemy model for the orders table.
 
 from typing import Optional, Any, TYPE_CHECKING, List
 from decimal import Decimal
-from sqlalchemy import String, Text, DECIMAL, ForeignKey, JSON
+from sqlalchemy import String, Text, DECIMAL, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 from app.database.base import Base, TimestampMixin, SoftDeleteMixin
@@ -42,6 +42,14 @@ class Order(Base, TimestampMixin, SoftDeleteMixin):
     payment_status: Mapped[str] = mapped_column(String(20), default='pending', nullable=False, index=True)
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
+    # Cover the dashboard customer aggregation (per-store GROUP BY phone)
+    # and keyset paging of order lists on (created_at, id)
+    __table_args__ = (
+        Index('ix_orders_store_customer_phone_created', 'store_id', 'customer_phone', 'created_at'),
+        Index('ix_orders_store_created_id', 'store_id', 'created_at', 'id'),
+        Index('ix_orders_store_payment_status_created', 'store_id', 'payment_status', 'created_at'),
+    )
+    
     # Relationships
     store: Mapped["Store"] = relationship("Store", back_populates="orders")
     payment: Mapped[Optional["Payment"]] = relationship("Payment", back_populates="order", uselist=False)
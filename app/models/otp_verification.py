@@ -5,11 +5,11 @@ SQLAlchemy model for the otp_verifications table.
 """
 
 from typing import Optional
-from datetime import datetime, timezone
-from sqlalchemy import String, Boolean, DateTime
+from datetime import datetime
+from sqlalchemy import String, Boolean, DateTime, Index, func
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.database.base import Base
+from app.database.base import Base, utc_now
 
 
 class OTPVerification(Base):
@@ -20,14 +20,23 @@ class OTPVerification(Base):
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     email: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
     phone: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, index=True)
-    code: Mapped[str] = mapped_column(String(6), nullable=False, index=True)
+    code: Mapped[str] = mapped_column(String(6), nullable=False)
     otp_type: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
-    verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False, index=True)
+    verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    # Set client-side too, so the value is loaded without a refresh;
+    # the server default covers rows inserted outside the ORM
     created_at: Mapped[datetime] = mapped_column(
         DateTime, 
         nullable=False, 
-        default=lambda: datetime.now(timezone.utc)
+        default=utc_now,
+        server_default=func.now()
+    )
+    
+    # MySQL has no partial indexes; leading with code and verified keeps
+    # the live-OTP lookup (code, unverified, unexpired) to one range scan
+    __table_args__ = (
+        Index('ix_otp_verifications_code_verified_expires', 'code', 'verified', 'expires_at'),
     )
     
     def __repr__(self) -> str:
@@ -6,7 +6,7 @@ SQLAlchemy model for the products table.
 
 from typing import Optional, Any, TYPE_CHECKING
 from decimal import Decimal
-from sqlalchemy import String, Text, Boolean, Integer, DECIMAL, ForeignKey, JSON
+from sqlalchemy import String, Text, Boolean, Integer, DECIMAL, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 from app.database.base import Base, TimestampMixin, SoftDeleteMixin
@@ -41,6 +41,12 @@ class Product(Base, TimestampMixin, SoftDeleteMixin):
     is_featured: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False, index=True)
     view_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     
+    # Keyset paging of product lists on (created_at, id) within a store
+    __table_args__ = (
+        Index('ix_products_store_created_id', 'store_id', 'created_at', 'id'),
+        Index('ix_products_store_active_stock', 'store_id', 'is_active', 'stock_quantity'),
+    )
+    
     # Relationships
     store: Mapped["Store"] = relationship("Store", back_populates="products")
     
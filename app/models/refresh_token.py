@@ -5,11 +5,11 @@ SQLAlchemy model for the refresh_tokens table.
 """
 
 from typing import Optional
-from datetime import datetime, timezone
-from sqlalchemy import String, Boolean, ForeignKey, DateTime
+from datetime import datetime
+from sqlalchemy import String, Boolean, ForeignKey, DateTime, Index, func
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.database.base import Base
+from app.database.base import Base, utc_now
 
 
 class RefreshToken(Base):
@@ -18,15 +18,23 @@ class RefreshToken(Base):
     __tablename__ = "refresh_tokens"
     
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     token_hash: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
-    revoked: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False, index=True)
+    revoked: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     revoked_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # Set client-side too, so the value is loaded without a refresh;
+    # the server default covers rows inserted outside the ORM
     created_at: Mapped[datetime] = mapped_column(
         DateTime, 
         nullable=False, 
-        default=lambda: datetime.now(timezone.utc)
+        default=utc_now,
+        server_default=func.now()
+    )
+    
+    # Serves a user's live (unrevoked) tokens and the user_id foreign key
+    __table_args__ = (
+        Index('ix_refresh_tokens_user_revoked', 'user_id', 'revoked'),
     )
     
     def __repr__(self) -> str:
@@ -7,7 +7,7 @@ SQLAlchemy model for the refunds table.
 from typing import Optional, Any, TYPE_CHECKING
 from datetime import datetime
 from decimal import Decimal
-from sqlalchemy import String, DECIMAL, ForeignKey, JSON, DateTime
+from sqlalchemy import String, DECIMAL, ForeignKey, JSON, DateTime, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 from app.database.base import Base, TimestampMixin
@@ -45,6 +45,10 @@ class Refund(Base, TimestampMixin):
     failed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     failure_reason: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     
+    __table_args__ = (
+        Index('ix_refunds_payment_status', 'payment_id', 'status'),
+    )
+    
     # Relationships
     payment: Mapped["Payment"] = relationship("Payment", back_populates="refunds")
     order: Mapped["Order"] = relationship("Order", back_populates="refunds")
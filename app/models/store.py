@@ -37,8 +37,8 @@ class Store(Base, TimestampMixin, SoftDeleteMixin):
     
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="stores")
-    products: Mapped[list["Product"]] = relationship("Product", back_populates="store", lazy="dynamic")
-    orders: Mapped[list["Order"]] = relationship("Order", back_populates="store", lazy="dynamic")
+    products: Mapped[list["Product"]] = relationship("Product", back_populates="store")
+    orders: Mapped[list["Order"]] = relationship("Order", back_populates="store")
     
     def __repr__(self) -> str:
         return f"<Store(id={self.id}, username={self.username})>"
@@ -36,8 +36,8 @@ class User(Base, TimestampMixin, SoftDeleteMixin):
     last_login_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     
     # Relationships
-    stores: Mapped[list["Store"]] = relationship("Store", back_populates="user", lazy="dynamic")
-    bank_accounts: Mapped[list["BankAccount"]] = relationship("BankAccount", back_populates="user", lazy="dynamic")
+    stores: Mapped[list["Store"]] = relationship("Store", back_populates="user")
+    bank_accounts: Mapped[list["BankAccount"]] = relationship("BankAccount", back_populates="user")
     disbursements: Mapped[List["Disbursement"]] = relationship("Disbursement", back_populates="user", cascade="all, delete-orphan")
     
     def __repr__(self) -> str:
@@ -4,7 +4,7 @@ AGM Store Builder - User Settings Model
 SQLAlchemy model for the user_settings table.
 """
 
-from sqlalchemy import String, Boolean, ForeignKey
+from sqlalchemy import String, Boolean, ForeignKey, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database.base import Base, TimestampMixin
@@ -15,7 +15,8 @@ class UserSettings(Base, TimestampMixin):
     
     __tablename__ = "user_settings"
     
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    # Generated by the database so upserts need not send an id
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, server_default=text("(UUID())"))
     user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, unique=True, index=True)
     
     # Notification preferences
@@ -0,0 +1,41 @@
+"""
+AGM Store Builder - Webhook Event Model
+
+SQLAlchemy model for the webhook_events table.
+"""
+
+from typing import Optional, Any
+from datetime import datetime
+from sqlalchemy import String, JSON, DateTime, Index, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database.base import Base, utc_now
+
+
+class WebhookEvent(Base):
+    """Received webhook event, kept until it has been processed."""
+    
+    __tablename__ = "webhook_events"
+    
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    # "<eventType>:<reference>", so a redelivered event maps to the same row
+    event_key: Mapped[str] = mapped_column(String(160), nullable=False, unique=True)
+    event_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    event_data: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    # Set when a worker takes the event; cleared again if processing fails
+    claimed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    processed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=utc_now,
+        server_default=func.now()
+    )
+    
+    # Serves the replay scan for unprocessed, unclaimed events
+    __table_args__ = (
+        Index('ix_webhook_events_processed_claimed', 'processed_at', 'claimed_at'),
+    )
+    
+    def __repr__(self) -> str:
+        return f"<WebhookEvent(id={self.id}, key={self.event_key})>"
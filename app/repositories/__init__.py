@@ -10,6 +10,8 @@ from app.repositories.store_repository import StoreRepository
 from app.repositories.product_repository import ProductRepository
 from app.repositories.order_repository import OrderRepository
 from app.repositories.payment_repository import PaymentRepository, BankAccountRepository
+from app.repositories.refresh_token_repository import RefreshTokenRepository
+from app.repositories.webhook_event_repository import WebhookEventRepository
 
 __all__ = [
     "BaseRepository",
@@ -19,4 +21,6 @@ __all__ = [
     "OrderRepository",
     "PaymentRepository",
     "BankAccountRepository",
+    "RefreshTokenRepository",
+    "WebhookEventRepository",
 ]
@@ -4,11 +4,12 @@ AGM Store Builder - Base Repository
 Base repository class with common CRUD operations.
 """
 
-from typing import Generic, TypeVar, Optional, List, Type, Any
+from typing import Generic, TypeVar, Optional, List, Sequence, Type, Any
 from uuid import uuid4
 from datetime import datetime, timezone
-from sqlalchemy import select, update, func
+from sqlalchemy import func, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.base import ExecutableOption
 
 from app.database.base import Base
 
@@ -50,6 +51,29 @@ class BaseRepository(Generic[T]):
         await self.db.refresh(entity)
         return entity
     
+    async def create_many(self, rows: Sequence[dict[str, Any]]) -> List[T]:
+        """
+        Create several entities with one batched INSERT.
+        
+        Ids are generated up front, so the ORM needs nothing back from
+        MySQL and sends the rows as a single executemany, which the driver
+        rewrites into one multi-row INSERT. Unlike create, entities are not
+        refreshed, so server-generated values are not loaded.
+        
+        Args:
+            rows: Field values for each entity
+            
+        Returns:
+            Created entities, in the order given
+        """
+        entities = [self.model(**{"id": self.generate_id(), **row}) for row in rows]
+        if not entities:
+            return entities
+        
+        self.db.add_all(entities)
+        await self.db.commit()
+        return entities
+    
     async def get_by_id(self, entity_id: str) -> Optional[T]:
         """
         Get entity by ID.
@@ -60,11 +84,14 @@ class BaseRepository(Generic[T]):
         Returns:
             Entity or None if not found
         """
-        query = select(self.model).where(self.model.id == entity_id)  # type: ignore
+        model = self.model
+        # lambda_stmt caches the statement by lambda and model, so repeat
+        # lookups skip building the select; entity_id becomes a bound parameter
+        query = lambda_stmt(lambda: select(model).where(model.id == entity_id))  # type: ignore
         
         # Check for soft delete
-        if hasattr(self.model, 'deleted_at'):
-            query = query.where(self.model.deleted_at.is_(None))  # type: ignore
+        if hasattr(model, 'deleted_at'):
+            query += lambda q: q.where(model.deleted_at.is_(None))  # type: ignore
         
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
@@ -73,6 +100,7 @@ class BaseRepository(Generic[T]):
         self,
         skip: int = 0,
         limit: int = 100,
+        options: Optional[Sequence[ExecutableOption]] = None,
     ) -> List[T]:
         """
         Get all entities with pagination.
@@ -80,11 +108,15 @@ class BaseRepository(Generic[T]):
         Args:
             skip: Number of records to skip
             limit: Maximum number of records
+            options: Loader options, e.g. selectinload() to fetch a
+                relationship for every row in one extra query
             
         Returns:
             List of entities
         """
         query = select(self.model)
+        if options:
+            query = query.options(*options)
         
         if hasattr(self.model, 'deleted_at'):
             query = query.where(self.model.deleted_at.is_(None))  # type: ignore
@@ -142,7 +174,9 @@ class BaseRepository(Generic[T]):
         Returns:
             Total count
         """
-        query = select(func.count(self.model.id))  # type: ignore
+        # COUNT(*) lets the optimizer count from the smallest index covering
+        # the filter (deleted_at is indexed) instead of reading the rows
+        query = select(func.count()).select_from(self.model)
         
         if hasattr(self.model, 'deleted_at'):
             query = query.where(self.model.deleted_at.is_(None))  # type: ignore
@@ -4,16 +4,20 @@ AGM Store Builder - Order Repository
 Data access layer for order operations.
 """
 
-from typing import Optional, List, Dict, Any
+import random
+from typing import Optional, List, Dict, Any, AsyncIterator
 from datetime import datetime, timezone
-from sqlalchemy import select, func, update, or_
+from sqlalchemy import select, func, update, or_, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.exceptions import BadRequestError
+from app.database.session import async_session_maker
 from app.models.order import Order
 from app.models.store import Store
 from app.models.payment import Payment
 from app.repositories.base import BaseRepository
+from app.utils.helpers import encode_cursor, decode_cursor
 
 
 class OrderRepository(BaseRepository[Order]):
@@ -44,19 +48,17 @@ class OrderRepository(BaseRepository[Order]):
         )
         return result.scalar_one_or_none()
     
-    async def get_user_orders(
+    def _user_orders_query(
         self,
         user_id: str,
         store_id: Optional[str] = None,
         status: Optional[str] = None,
         payment_status: Optional[str] = None,
-        page: int = 1,
-        limit: int = 20,
         search: Optional[str] = None,
         date_from: Optional[str] = None,
         date_to: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        """Get all orders for a user's stores."""
+    ):
+        """Build the filtered orders-with-store-name query for a user's stores."""
         query = (
             select(Order, Store.display_name.label("store_name"))
             .join(Store, Order.store_id == Store.id)
@@ -91,35 +93,94 @@ class OrderRepository(BaseRepository[Order]):
         if date_to:
             query = query.where(Order.created_at <= date_to)
         
-        # Get total count
+        return query
+    
+    @staticmethod
+    def _order_row_to_dict(order: Order, store_name: Optional[str]) -> Dict[str, Any]:
+        """Convert an order list row to a dictionary."""
+        return {
+            "id": order.id,
+            "order_number": order.order_number,
+            "store_id": order.store_id,
+            "store_name": store_name,
+            "customer_name": order.customer_name,
+            "customer_email": order.customer_email,
+            "customer_phone": order.customer_phone,
+            "total": float(order.total),
+            "status": order.status,
+            "payment_status": order.payment_status,
+            "created_at": str(order.created_at),
+        }
+    
+    async def get_user_orders(
+        self,
+        user_id: str,
+        store_id: Optional[str] = None,
+        status: Optional[str] = None,
+        payment_status: Optional[str] = None,
+        page: int = 1,
+        limit: int = 20,
+        search: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get all orders for a user's stores.
+        
+        Pages by offset, or by keyset on (created_at, id) when a cursor
+        from a previous page's ``nextCursor`` is given.
+        """
+        query = self._user_orders_query(
+            user_id, store_id, status, payment_status, search, date_from, date_to,
+        )
         count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar() or 0
         
-        # Apply pagination
-        offset = (page - 1) * limit
-        query = query.order_by(Order.created_at.desc()).offset(offset).limit(limit)
+        # Offset pages carry the filtered total on every row, so the count
+        # rides along with the page instead of costing a second round trip
+        total = None
+        if not cursor:
+            query = query.add_columns(func.count().over().label("total"))
+        else:
+            total = (await self.db.execute(count_query)).scalar() or 0
+        
+        # Apply pagination (one extra row tells whether another page exists)
+        query = query.order_by(Order.created_at.desc(), Order.id.desc()).limit(limit + 1)
+        if cursor:
+            values = decode_cursor(cursor, 2)
+            try:
+                last_created_at = datetime.fromisoformat(values[0]) if values else None
+            except ValueError:
+                last_created_at = None
+            if last_created_at is None:
+                raise BadRequestError(message="Invalid pagination cursor")
+            last_id = values[1]
+            query = query.where(
+                or_(
+                    Order.created_at < last_created_at,
+                    and_(Order.created_at == last_created_at, Order.id < last_id),
+                )
+            )
+        else:
+            query = query.offset((page - 1) * limit)
         
         result = await self.db.execute(query)
         rows = result.all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        orders = [self._order_row_to_dict(row[0], row[1]) for row in rows]
         
-        orders = []
-        for row in rows:
-            order = row[0]
-            store_name = row[1]
-            orders.append({
-                "id": order.id,
-                "order_number": order.order_number,
-                "store_id": order.store_id,
-                "store_name": store_name,
-                "customer_name": order.customer_name,
-                "customer_email": order.customer_email,
-                "customer_phone": order.customer_phone,
-                "total": float(order.total),
-                "status": order.status,
-                "payment_status": order.payment_status,
-                "created_at": str(order.created_at),
-            })
+        if total is None:
+            if rows:
+                total = rows[0].total
+            else:
+                # Past the last page there is no row to read the total from
+                total = (await self.db.execute(count_query)).scalar() or 0
+        
+        next_cursor = None
+        if has_more:
+            last_order = rows[-1][0]
+            next_cursor = encode_cursor(last_order.created_at.isoformat(), last_order.id)
         
         return {
             "orders": orders,
@@ -128,13 +189,34 @@ class OrderRepository(BaseRepository[Order]):
                 "limit": limit,
                 "total": total,
                 "pages": (total + limit - 1) // limit,
-                "hasMore": offset + len(orders) < total,
+                "hasMore": has_more,
+                "nextCursor": next_cursor,
             },
         }
     
+    async def stream_user_orders(
+        self,
+        user_id: str,
+        store_id: Optional[str] = None,
+        status: Optional[str] = None,
+        payment_status: Optional[str] = None,
+        search: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream every matching order for export, one row at a time."""
+        query = self._user_orders_query(
+            user_id, store_id, status, payment_status, search, date_from, date_to,
+        ).order_by(Order.created_at.desc(), Order.id.desc()).execution_options(yield_per=100)
+        
+        # Own session so the stream outlives the request-scoped one
+        async with async_session_maker() as session:
+            result = await session.stream(query)
+            async for order, store_name in result:
+                yield self._order_row_to_dict(order, store_name)
+    
     async def generate_order_number(self) -> str:
         """Generate a unique order number."""
-        import random
         now = datetime.now(timezone.utc)
         date_part = now.strftime("%Y%m%d")
         random_part = random.randint(10000, 99999)
@@ -6,7 +6,7 @@ Data access layer for payment operations.
 
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timezone
-from sqlalchemy import select, update
+from sqlalchemy import select, update, case
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.payment import Payment
@@ -105,22 +105,11 @@ class BankAccountRepository(BaseRepository[BankAccount]):
         return result.scalar_one_or_none()
     
     async def set_primary(self, account_id: str, user_id: str) -> Optional[BankAccount]:
-        """Set a bank account as primary."""
-        # First, unset all primary flags for user
+        """Set a bank account as primary (and unset the others) in one UPDATE."""
         await self.db.execute(
             update(BankAccount)
             .where(BankAccount.user_id == user_id)
-            .values(is_primary=False)
-        )
-        
-        # Set the specified account as primary
-        await self.db.execute(
-            update(BankAccount)
-            .where(
-                BankAccount.id == account_id,
-                BankAccount.user_id == user_id,
-            )
-            .values(is_primary=True)
+            .values(is_primary=case((BankAccount.id == account_id, True), else_=False))
         )
         await self.db.commit()
         
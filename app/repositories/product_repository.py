@@ -4,13 +4,112 @@ AGM Store Builder - Product Repository
 Data access layer for product operations.
 """
 
-from typing import Optional, List, Dict, Any
-from sqlalchemy import select, func, update, or_
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Optional, List, Dict, Any, Sequence
+from sqlalchemy import select, func, update, or_, and_, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, raiseload
+from sqlalchemy.orm.interfaces import LoaderOption
 
+from app.core.exceptions import AuthorizationError, BadRequestError
 from app.models.product import Product
 from app.models.store import Store
 from app.repositories.base import BaseRepository
+from app.utils.helpers import encode_cursor, decode_cursor
+
+# Max product ids per UPDATE in bulk_update
+BULK_UPDATE_BATCH_SIZE = 1000
+
+# Listings only read these columns, and never touch relationships; raiseload
+# turns any accidental per-row lazy load into an error instead of an N+1
+_USER_LIST_OPTIONS = (
+    load_only(
+        Product.id,
+        Product.store_id,
+        Product.name,
+        Product.price,
+        Product.stock_quantity,
+        Product.images,
+        Product.is_active,
+        Product.created_at,
+    ),
+    raiseload("*"),
+)
+
+# Sort key -> (column, descending, parser for the cursor value); id breaks ties
+_SORT_KEYS = {
+    "newest": (Product.created_at, True, datetime.fromisoformat),
+    "price_asc": (Product.price, False, Decimal),
+    "price_desc": (Product.price, True, Decimal),
+    "name_asc": (Product.name, False, str),
+    "name_desc": (Product.name, True, str),
+    "popular": (Product.view_count, True, int),
+}
+
+
+def _apply_keyset_page(query, sort: str, page: int, limit: int, cursor: Optional[str]):
+    """
+    Order a product query by a sort key and page it.
+    
+    Seeks past the cursor's (sort value, id) when given, otherwise uses
+    offset paging. One extra row is fetched to tell whether more exist.
+    """
+    column, descending, parse = _SORT_KEYS.get(sort, _SORT_KEYS["newest"])
+    
+    if descending:
+        query = query.order_by(column.desc(), Product.id.desc())
+    else:
+        query = query.order_by(column.asc(), Product.id.asc())
+    query = query.limit(limit + 1)
+    
+    if not cursor:
+        return query.offset((page - 1) * limit)
+    
+    values = decode_cursor(cursor, 2)
+    try:
+        last_value = parse(values[0]) if values else None
+    except (ValueError, InvalidOperation):
+        last_value = None
+    if last_value is None:
+        raise BadRequestError(message="Invalid pagination cursor")
+    last_id = values[1]
+    
+    if descending:
+        return query.where(
+            or_(column < last_value, and_(column == last_value, Product.id < last_id))
+        )
+    return query.where(
+        or_(column > last_value, and_(column == last_value, Product.id > last_id))
+    )
+
+
+def _next_cursor(product: Product, sort: str) -> str:
+    """Build the cursor that resumes a listing after this product."""
+    column = _SORT_KEYS.get(sort, _SORT_KEYS["newest"])[0]
+    value = getattr(product, column.key)
+    value = value.isoformat() if isinstance(value, datetime) else str(value)
+    return encode_cursor(value, product.id)
+
+
+_STOREFRONT_LIST_OPTIONS = (
+    load_only(
+        Product.id,
+        Product.store_id,
+        Product.name,
+        Product.description,
+        Product.price,
+        Product.compare_at_price,
+        Product.stock_quantity,
+        Product.images,
+        Product.category,
+        Product.is_active,
+        Product.is_featured,
+        Product.view_count,
+        Product.created_at,
+    ),
+    raiseload("*"),
+)
 
 
 class ProductRepository(BaseRepository[Product]):
@@ -31,8 +130,15 @@ class ProductRepository(BaseRepository[Product]):
         max_price: Optional[float] = None,
         in_stock: Optional[bool] = None,
         featured: Optional[bool] = None,
+        options: Sequence[LoaderOption] = (),
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Get products by store with filters and pagination."""
+        """
+        Get products by store with filters and pagination.
+        
+        Pages by offset, or by keyset on (sort value, id) when a cursor
+        from a previous page's ``nextCursor`` is given.
+        """
         query = select(Product).where(
             Product.store_id == store_id,
             Product.deleted_at.is_(None),
@@ -72,26 +178,13 @@ class ProductRepository(BaseRepository[Product]):
         total_result = await self.db.execute(count_query)
         total = total_result.scalar() or 0
         
-        # Apply sorting
-        if sort == "price_asc":
-            query = query.order_by(Product.price.asc())
-        elif sort == "price_desc":
-            query = query.order_by(Product.price.desc())
-        elif sort == "name_asc":
-            query = query.order_by(Product.name.asc())
-        elif sort == "name_desc":
-            query = query.order_by(Product.name.desc())
-        elif sort == "popular":
-            query = query.order_by(Product.view_count.desc())
-        else:  # newest
-            query = query.order_by(Product.created_at.desc())
-        
-        # Apply pagination
-        offset = (page - 1) * limit
-        query = query.offset(offset).limit(limit)
+        # Apply sorting and pagination
+        query = _apply_keyset_page(query.options(*options), sort, page, limit, cursor)
         
         result = await self.db.execute(query)
         products = list(result.scalars().all())
+        has_more = len(products) > limit
+        products = products[:limit]
         
         return {
             "products": products,
@@ -100,7 +193,8 @@ class ProductRepository(BaseRepository[Product]):
                 "limit": limit,
                 "total": total,
                 "pages": (total + limit - 1) // limit,
-                "hasMore": offset + len(products) < total,
+                "hasMore": has_more,
+                "nextCursor": _next_cursor(products[-1], sort) if has_more else None,
             },
         }
     
@@ -113,8 +207,14 @@ class ProductRepository(BaseRepository[Product]):
         search: Optional[str] = None,
         category: Optional[str] = None,
         product_status: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Get all products for a user's stores."""
+        """
+        Get all products for a user's stores.
+        
+        Pages by offset, or by keyset on (created_at, id) when a cursor
+        from a previous page's ``nextCursor`` is given.
+        """
         # Build base query with store join
         query = (
             select(Product, Store.display_name.label("store_name"))
@@ -149,11 +249,14 @@ class ProductRepository(BaseRepository[Product]):
         total = total_result.scalar() or 0
         
         # Apply pagination
-        offset = (page - 1) * limit
-        query = query.order_by(Product.created_at.desc()).offset(offset).limit(limit)
+        query = _apply_keyset_page(
+            query.options(*_USER_LIST_OPTIONS), "newest", page, limit, cursor,
+        )
         
         result = await self.db.execute(query)
         rows = result.all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
         
         products = []
         for row in rows:
@@ -178,7 +281,8 @@ class ProductRepository(BaseRepository[Product]):
                 "limit": limit,
                 "total": total,
                 "pages": (total + limit - 1) // limit,
-                "hasMore": offset + len(products) < total,
+                "hasMore": has_more,
+                "nextCursor": _next_cursor(rows[-1][0], "newest") if has_more else None,
             },
         }
     
@@ -190,6 +294,7 @@ class ProductRepository(BaseRepository[Product]):
         search: Optional[str] = None,
         category: Optional[str] = None,
         sort_by: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Get public products for a store (wrapper for get_by_store)."""
         # Map sort_by to sort parameter
@@ -209,6 +314,8 @@ class ProductRepository(BaseRepository[Product]):
             search=search,
             category=category,
             sort=sort,
+            options=_STOREFRONT_LIST_OPTIONS,
+            cursor=cursor,
         )
         
         # Convert products to dicts for JSON serialization
@@ -234,6 +341,54 @@ class ProductRepository(BaseRepository[Product]):
             "pagination": result["pagination"],
         }
     
+    async def get_by_ids(
+        self,
+        product_ids: List[str],
+        for_update: bool = False,
+    ) -> Dict[str, Product]:
+        """Get products by IDs in one query, keyed by ID."""
+        if not product_ids:
+            return {}
+        
+        query = select(Product).where(
+            Product.id.in_(product_ids),
+            Product.deleted_at.is_(None),
+        )
+        if for_update:
+            query = query.with_for_update()
+        
+        result = await self.db.execute(query)
+        return {product.id: product for product in result.scalars().all()}
+    
+    async def adjust_stock_many(self, deltas: Dict[str, int]) -> None:
+        """
+        Apply stock deltas to many products with one executemany UPDATE.
+        
+        Positive deltas increment, negative deltas decrement; stock is
+        clamped at zero like ``update_stock``.
+        """
+        if not deltas:
+            return
+        
+        products = Product.__table__
+        stmt = (
+            update(products)
+            .where(products.c.id == bindparam("pid"))
+            .values(
+                stock_quantity=func.greatest(
+                    products.c.stock_quantity + bindparam("delta"), 0
+                )
+            )
+        )
+        # Core-level execute so the statement runs as a plain executemany
+        # rather than ORM bulk-update-by-primary-key
+        conn = await self.db.connection()
+        await conn.execute(
+            stmt,
+            [{"pid": pid, "delta": delta} for pid, delta in deltas.items()],
+        )
+        await self.db.commit()
+    
     async def update_stock(
         self,
         product_id: str,
@@ -278,28 +433,55 @@ class ProductRepository(BaseRepository[Product]):
         user_id: str,
         updates: Dict[str, Any],
     ) -> int:
-        """Bulk update multiple products."""
-        # Verify ownership through stores
-        query = (
-            select(Product.id)
-            .join(Store, Product.store_id == Store.id)
-            .where(
-                Product.id.in_(product_ids),
-                Store.user_id == user_id,
+        """
+        Bulk update multiple products in set-based UPDATEs (ownership checked first).
+        
+        All or nothing: if any id is missing or not owned by the user,
+        nothing is changed and AuthorizationError is raised.
+        """
+        if not product_ids or not updates:
+            return 0
+        
+        product_ids = list(dict.fromkeys(product_ids))
+        owned_store_ids = select(Store.id).where(Store.user_id == user_id)
+        batches = [
+            product_ids[start:start + BULK_UPDATE_BATCH_SIZE]
+            for start in range(0, len(product_ids), BULK_UPDATE_BATCH_SIZE)
+        ]
+        
+        def owned(batch: List[str]):
+            return (
+                Product.id.in_(batch),
+                Product.store_id.in_(owned_store_ids),
                 Product.deleted_at.is_(None),
             )
-        )
-        result = await self.db.execute(query)
-        valid_ids = [row[0] for row in result.all()]
         
-        if not valid_ids:
-            return 0
+        # Count and lock the owned rows instead of trusting UPDATE's rowcount,
+        # which on MySQL skips rows whose values are already the new ones
+        # unless the connection sets FOUND_ROWS
+        found = 0
+        for batch in batches:
+            result = await self.db.execute(
+                select(Product.id).where(*owned(batch)).with_for_update()
+            )
+            found += len(result.scalars().all())
+        
+        if found != len(product_ids):
+            await self.db.rollback()
+            raise AuthorizationError(
+                message="Some products were not found or do not belong to you",
+            )
+        
+        # One statement per batch keeps the IN list within sane parameter counts;
+        # all batches share one transaction
+        for batch in batches:
+            await self.db.execute(
+                update(Product)
+                .where(*owned(batch))
+                .values(**updates)
+                .execution_options(synchronize_session=False)
+            )
         
-        await self.db.execute(
-            update(Product)
-            .where(Product.id.in_(valid_ids))
-            .values(**updates)
-        )
         await self.db.commit()
         
-        return len(valid_ids)
+        return found
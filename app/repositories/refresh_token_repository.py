@@ -0,0 +1,63 @@
+"""
+AGM Store Builder - Refresh Token Repository
+
+Data access layer for issued refresh tokens.
+"""
+
+from datetime import datetime, timezone
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.refresh_token import RefreshToken
+from app.repositories.base import BaseRepository
+
+
+class RefreshTokenRepository(BaseRepository[RefreshToken]):
+    """Repository for refresh token data operations."""
+    
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, RefreshToken)
+    
+    async def add(self, user_id: str, token_hash: str, expires_at: datetime) -> None:
+        """Record an issued refresh token."""
+        self.db.add(
+            RefreshToken(
+                id=self.generate_id(),
+                user_id=user_id,
+                token_hash=token_hash,
+                expires_at=expires_at,
+            )
+        )
+        await self.db.commit()
+    
+    async def revoke(self, token_hash: str, user_id: str) -> bool:
+        """
+        Revoke a live token; False if it is unknown, expired or already revoked.
+    
+        A single conditional UPDATE, so two concurrent uses of the same
+        token cannot both succeed.
+        """
+        now = datetime.now(timezone.utc)
+        result = await self.db.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == token_hash,
+                RefreshToken.user_id == user_id,
+                RefreshToken.revoked.is_(False),
+                RefreshToken.expires_at > now,
+            )
+            .values(revoked=True, revoked_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+        return result.rowcount == 1
+    
+    async def revoke_all_for_user(self, user_id: str) -> None:
+        """Revoke every live token issued to a user."""
+        await self.db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.user_id == user_id, RefreshToken.revoked.is_(False))
+            .values(revoked=True, revoked_at=datetime.now(timezone.utc))
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
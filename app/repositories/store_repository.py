@@ -4,10 +4,11 @@ AGM Store Builder - Store Repository
 Data access layer for store operations.
 """
 
-from typing import Optional, List
-from sqlalchemy import select, func
+from typing import Optional, List, Tuple
+from sqlalchemy import select, func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import checkout_store_cache, user_store_ids_cache
 from app.models.store import Store
 from app.models.product import Product
 from app.models.order import Order
@@ -30,6 +31,25 @@ class StoreRepository(BaseRepository[Store]):
         )
         return result.scalar_one_or_none()
     
+    async def get_checkout_store(self, value: str) -> Optional[Tuple[str, str, str]]:
+        """Get (store id, owner id, username) of an active store by ID or username (cached briefly)."""
+        key = value.lower()
+        store = checkout_store_cache.get(key)
+        if store is None:
+            result = await self.db.execute(
+                select(Store.id, Store.user_id, Store.username).where(
+                    or_(Store.id == value, Store.username == key),
+                    Store.is_active.is_(True),
+                    Store.deleted_at.is_(None),
+                ).limit(1)
+            )
+            row = result.first()
+            if row is None:
+                return None
+            store = tuple(row)
+            checkout_store_cache.set(key, store)
+        return store
+    
     async def get_by_user_id(self, user_id: str) -> List[Store]:
         """Get all stores owned by a user."""
         result = await self.db.execute(
@@ -40,6 +60,20 @@ class StoreRepository(BaseRepository[Store]):
         )
         return list(result.scalars().all())
     
+    async def get_ids_by_user(self, user_id: str) -> List[str]:
+        """Get ids of all stores owned by a user (cached briefly)."""
+        store_ids = user_store_ids_cache.get(user_id)
+        if store_ids is None:
+            result = await self.db.execute(
+                select(Store.id).where(
+                    Store.user_id == user_id,
+                    Store.deleted_at.is_(None),
+                )
+            )
+            store_ids = list(result.scalars().all())
+            user_store_ids_cache.set(user_id, store_ids)
+        return list(store_ids)
+    
     async def username_exists(self, username: str, exclude_id: Optional[str] = None) -> bool:
         """Check if username already exists."""
         query = select(Store.id).where(
@@ -97,18 +131,14 @@ class StoreRepository(BaseRepository[Store]):
         return result
     
     async def generate_username_suggestions(self, base_username: str, count: int = 3) -> List[str]:
-        """Generate available username suggestions."""
-        suggestions: List[str] = []
-        suffix = 1
-        
-        while len(suggestions) < count:
-            candidate = f"{base_username}{suffix}"
-            if not await self.username_exists(candidate):
-                suggestions.append(candidate)
-            suffix += 1
-            
-            # Safety limit
-            if suffix > 100:
-                break
+        """Generate available username suggestions with a single query."""
+        candidates = [f"{base_username}{suffix}" for suffix in range(1, 51)]
+        result = await self.db.execute(
+            select(Store.username).where(
+                Store.username.in_(candidates),
+                Store.deleted_at.is_(None),
+            )
+        )
+        taken = set(result.scalars().all())
         
-        return suggestions
+        return [candidate for candidate in candidates if candidate not in taken][:count]
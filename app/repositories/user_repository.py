@@ -10,6 +10,7 @@ from uuid import uuid4
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import user_role_cache
 from app.models.user import User
 
 
@@ -46,6 +47,18 @@ class UserRepository:
         )
         return result.scalar_one_or_none()
     
+    async def get_role(self, user_id: str) -> Optional[str]:
+        """Get a live user's role, cached briefly."""
+        role = user_role_cache.get(user_id)
+        if role is None:
+            result = await self.db.execute(
+                select(User.role).where(User.id == user_id, User.deleted_at.is_(None))
+            )
+            role = result.scalar_one_or_none()
+            if role is not None:
+                user_role_cache.set(user_id, role)
+        return role
+    
     async def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email."""
         result = await self.db.execute(
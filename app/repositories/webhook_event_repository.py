@@ -0,0 +1,103 @@
+"""
+AGM Store Builder - Webhook Event Repository
+
+Data access layer for received webhook events.
+"""
+
+from typing import Optional, List, Dict, Any
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select, update, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.webhook_event import WebhookEvent
+from app.repositories.base import BaseRepository
+
+# A claim older than this is assumed to belong to a worker that died
+CLAIM_TIMEOUT = timedelta(minutes=10)
+
+
+class WebhookEventRepository(BaseRepository[WebhookEvent]):
+    """Repository for webhook event operations."""
+    
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, WebhookEvent)
+    
+    async def record(
+        self,
+        event_key: str,
+        event_type: str,
+        event_data: Dict[str, Any],
+    ) -> Optional[str]:
+        """Store an event; returns its id, or None if it was already stored."""
+        event = WebhookEvent(
+            id=self.generate_id(),
+            event_key=event_key,
+            event_type=event_type,
+            event_data=event_data,
+        )
+        self.db.add(event)
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            # Redelivery of an event already stored; its own row is processed
+            await self.db.rollback()
+            return None
+        return event.id
+    
+    async def claim(self, event_id: str) -> Optional[WebhookEvent]:
+        """
+        Take an unprocessed event for processing; None if another worker has it.
+        
+        A single conditional UPDATE, so only one worker can win the claim.
+        """
+        now = datetime.now(timezone.utc)
+        result = await self.db.execute(
+            update(WebhookEvent)
+            .where(
+                WebhookEvent.id == event_id,
+                WebhookEvent.processed_at.is_(None),
+                or_(
+                    WebhookEvent.claimed_at.is_(None),
+                    WebhookEvent.claimed_at < now - CLAIM_TIMEOUT,
+                ),
+            )
+            .values(claimed_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+        if result.rowcount != 1:
+            return None
+        return await self.get_by_id(event_id)
+    
+    async def mark_processed(self, event_id: str) -> None:
+        """Mark a claimed event as processed."""
+        await self.db.execute(
+            update(WebhookEvent)
+            .where(WebhookEvent.id == event_id)
+            .values(processed_at=datetime.now(timezone.utc))
+        )
+        await self.db.commit()
+    
+    async def release(self, event_id: str) -> None:
+        """Give up a claim so the event can be replayed."""
+        await self.db.execute(
+            update(WebhookEvent)
+            .where(WebhookEvent.id == event_id, WebhookEvent.processed_at.is_(None))
+            .values(claimed_at=None)
+        )
+        await self.db.commit()
+    
+    async def get_unprocessed_ids(self, limit: int = 100) -> List[str]:
+        """Get ids of unprocessed events that no live worker has claimed."""
+        stale = datetime.now(timezone.utc) - CLAIM_TIMEOUT
+        result = await self.db.execute(
+            select(WebhookEvent.id)
+            .where(
+                WebhookEvent.processed_at.is_(None),
+                or_(WebhookEvent.claimed_at.is_(None), WebhookEvent.claimed_at < stale),
+            )
+            .order_by(WebhookEvent.created_at)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
@@ -4,13 +4,25 @@ AGM Store Builder - Authentication Schemas
 Pydantic schemas for authentication requests and responses.
 """
 
-from typing import Optional, Dict, Any
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from typing import Annotated, Optional, Dict, Any
+from pydantic import BaseModel, EmailStr, Field, StringConstraints, field_validator
 import re
 
 from app.core.constants import OTPType
 
 
+# Plain pattern check for the polled OTP endpoints; full EmailStr
+# validation (email-validator) is kept for registration and login
+FastEmail = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True,
+        max_length=254,
+        pattern=r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$",
+    ),
+]
+
+
 class RegisterRequest(BaseModel):
     """User registration request."""
     email: EmailStr
@@ -43,12 +55,12 @@ class RefreshTokenRequest(BaseModel):
 
 class ForgotPasswordRequest(BaseModel):
     """Password reset request."""
-    email: EmailStr
+    email: FastEmail
 
 
 class VerifyOTPRequest(BaseModel):
     """OTP verification request."""
-    email: EmailStr
+    email: FastEmail
     otp: str = Field(min_length=6, max_length=6)
     type: str = Field(default="email")
 
@@ -72,7 +84,7 @@ class ResetPasswordRequest(BaseModel):
 
 class ResendVerificationRequest(BaseModel):
     """Resend verification OTP request."""
-    email: EmailStr
+    email: FastEmail
 
 
 class TokenData(BaseModel):
@@ -43,6 +43,7 @@ class PaginationMeta(BaseModel):
     total: int
     pages: int
     hasMore: bool = False
+    nextCursor: Optional[str] = None
 
 
 class PaginatedResponse(BaseResponse, Generic[T]):
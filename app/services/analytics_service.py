@@ -4,11 +4,13 @@ AGM Store Builder - Analytics Service
 Business logic for dashboard analytics and reporting.
 """
 
+from functools import wraps
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timezone, timedelta
 from sqlalchemy import select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import analytics_cache
 from app.models.order import Order
 from app.models.product import Product
 from app.models.store import Store
@@ -17,6 +19,31 @@ from app.repositories.order_repository import OrderRepository
 from app.repositories.product_repository import ProductRepository
 
 
+def _cached(name: str):
+    """
+    Cache-aside wrapper for per-user analytics queries.
+    
+    Results are keyed by user and call arguments so that
+    ``invalidate_user_analytics`` can drop one owner's entries.
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(self, user_id: str, *args, **kwargs):
+            params = ":".join(
+                [repr(a) for a in args] + [f"{k}={v}" for k, v in sorted(kwargs.items())]
+            )
+            key = f"analytics:{user_id}:{name}:{params}"
+            cached = analytics_cache.get(key)
+            if cached is not None:
+                return cached
+            
+            result = await func(self, user_id, *args, **kwargs)
+            analytics_cache.set(key, result)
+            return result
+        return wrapper
+    return decorator
+
+
 class AnalyticsService:
     """Analytics service for dashboard and reporting."""
     
@@ -56,6 +83,19 @@ class AnalyticsService:
         
         return start, end
     
+    async def _scoped_store_ids(
+        self,
+        user_id: str,
+        store_id: Optional[str] = None,
+    ) -> List[str]:
+        """Get the user's store ids, narrowed to store_id if given."""
+        store_ids = await self.store_repo.get_ids_by_user(user_id)
+        
+        if store_id:
+            return [store_id] if store_id in store_ids else []
+        return store_ids
+    
+    @_cached("dashboard")
     async def get_dashboard_analytics(
         self,
         user_id: str,
@@ -255,6 +295,7 @@ class AnalyticsService:
             "stores": [],
         }
     
+    @_cached("revenue")
     async def get_revenue_stats(
         self,
         user_id: str,
@@ -264,11 +305,7 @@ class AnalyticsService:
     ) -> Dict[str, Any]:
         """Get revenue statistics with chart data."""
         start_date, end_date = self._get_date_range(period)
-        stores = await self.store_repo.get_by_user_id(user_id)
-        store_ids = [s.id for s in stores]
-        
-        if store_id:
-            store_ids = [store_id] if store_id in store_ids else []
+        store_ids = await self._scoped_store_ids(user_id, store_id)
         
         if not store_ids:
             return {"total": 0, "paid": 0, "pending": 0, "chartData": []}
@@ -298,6 +335,7 @@ class AnalyticsService:
             "chartData": [],
         }
     
+    @_cached("orders")
     async def get_order_stats(
         self,
         user_id: str,
@@ -306,11 +344,7 @@ class AnalyticsService:
     ) -> Dict[str, Any]:
         """Get order statistics."""
         start_date, end_date = self._get_date_range(period)
-        stores = await self.store_repo.get_by_user_id(user_id)
-        store_ids = [s.id for s in stores]
-        
-        if store_id:
-            store_ids = [store_id] if store_id in store_ids else []
+        store_ids = await self._scoped_store_ids(user_id, store_id)
         
         if not store_ids:
             return {"total": 0, "averageOrderValue": 0, "chartData": []}
@@ -340,6 +374,7 @@ class AnalyticsService:
             "chartData": [],
         }
     
+    @_cached("products")
     async def get_product_performance(
         self,
         user_id: str,
@@ -348,11 +383,7 @@ class AnalyticsService:
         limit: int = 10,
     ) -> Dict[str, Any]:
         """Get product performance analytics."""
-        stores = await self.store_repo.get_by_user_id(user_id)
-        store_ids = [s.id for s in stores]
-        
-        if store_id:
-            store_ids = [store_id] if store_id in store_ids else []
+        store_ids = await self._scoped_store_ids(user_id, store_id)
         
         if not store_ids:
             return {"totalProducts": 0, "activeProducts": 0, "topSelling": []}
@@ -379,6 +410,7 @@ class AnalyticsService:
             "recentlyAdded": [],
         }
     
+    @_cached("customers")
     async def get_customer_analytics(
         self,
         user_id: str,
@@ -387,11 +419,7 @@ class AnalyticsService:
     ) -> Dict[str, Any]:
         """Get customer analytics."""
         start_date, end_date = self._get_date_range(period)
-        stores = await self.store_repo.get_by_user_id(user_id)
-        store_ids = [s.id for s in stores]
-        
-        if store_id:
-            store_ids = [store_id] if store_id in store_ids else []
+        store_ids = await self._scoped_store_ids(user_id, store_id)
         
         if not store_ids:
             return {"totalCustomers": 0, "newCustomers": 0, "topCustomers": []}
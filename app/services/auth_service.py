@@ -4,15 +4,19 @@ AGM Store Builder - Authentication Service
 Business logic for user authentication, registration, and token management.
 """
 
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from loguru import logger
 
+from app.core.config import settings
 from app.core.security import (
-    hash_password,
-    verify_password,
+    DUMMY_PASSWORD_HASH,
+    ahash_password,
+    averify_password,
     create_tokens,
-    verify_refresh_token,
+    decode_refresh_token,
+    hash_refresh_token,
     create_password_reset_token,
     verify_password_reset_token,
 )
@@ -23,6 +27,7 @@ from app.core.exceptions import (
     OTPError,
     BadRequestError,
 )
+from app.repositories.refresh_token_repository import RefreshTokenRepository
 from app.repositories.user_repository import UserRepository
 from app.services.otp_service import OTPService
 
@@ -35,6 +40,7 @@ class AuthService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.user_repo = UserRepository(db)
+        self.refresh_token_repo = RefreshTokenRepository(db)
         self.otp_service = OTPService(db)
     
     async def register(
@@ -71,7 +77,7 @@ class AuthService:
                 raise ConflictError(message="Phone number already registered")
         
         # Hash password
-        password_hash = hash_password(password)
+        password_hash = await ahash_password(password)
         
         # Create user
         user = await self.user_repo.create(
@@ -82,7 +88,7 @@ class AuthService:
         )
         
         # Create tokens
-        tokens = create_tokens(user.id)
+        tokens = await self._issue_tokens(user.id)
         
         # Send verification OTP
         await self.otp_service.send_email_verification(email)
@@ -115,10 +121,13 @@ class AuthService:
         # Get user
         user = await self.user_repo.get_by_email(email)
         if not user:
+            # Spend the same bcrypt time as a real check so response timing
+            # does not reveal whether the email is registered
+            await averify_password(password, DUMMY_PASSWORD_HASH)
             raise AuthenticationError(message="Invalid email or password")
         
         # Verify password
-        if not verify_password(password, user.password_hash):
+        if not await averify_password(password, user.password_hash):
             raise AuthenticationError(message="Invalid email or password")
         
         # Check if user is active
@@ -129,7 +138,7 @@ class AuthService:
         await self.user_repo.update_last_login(user.id)
         
         # Create tokens
-        tokens = create_tokens(user.id)
+        tokens = await self._issue_tokens(user.id)
         
         logger.info(f"User logged in: {email}")
         
@@ -152,30 +161,37 @@ class AuthService:
             AuthenticationError: If refresh token is invalid
         """
         try:
-            user_id = verify_refresh_token(refresh_token)
+            payload = decode_refresh_token(refresh_token)
         except Exception:
             raise AuthenticationError(message="Invalid refresh token")
         
-        # Verify user exists and is active
+        user_id = str(payload["sub"])
         user = await self.user_repo.get_by_id(user_id)
         if not user or not user.is_active:
             raise AuthenticationError(message="User not found or inactive")
         
-        # Create new tokens
-        tokens = create_tokens(user_id)
+        # Rotate: revoking is a conditional UPDATE, so a replayed or
+        # concurrently reused token fails here on every worker
+        if not await self.refresh_token_repo.revoke(hash_refresh_token(refresh_token), user_id):
+            raise AuthenticationError(message="Invalid refresh token")
         
-        return tokens
+        return await self._issue_tokens(user_id)
     
-    async def logout(self, user_id: str) -> None:
+    async def logout(self, user_id: str, refresh_token: Optional[str] = None) -> None:
         """
-        Logout a user by invalidating their tokens.
+        Logout a user by revoking their refresh token.
+        
+        Only the presented token is revoked, so other devices stay signed
+        in. Without one, every refresh token the user holds is revoked.
         
         Args:
             user_id: User's ID
+            refresh_token: Refresh token of the session being closed
         """
-        # In a production system, you would:
-        # - Add the tokens to a blacklist
-        # - Revoke refresh tokens in the database
+        if refresh_token:
+            await self.refresh_token_repo.revoke(hash_refresh_token(refresh_token), user_id)
+        else:
+            await self.refresh_token_repo.revoke_all_for_user(user_id)
         logger.info(f"User logged out: {user_id}")
     
     async def send_password_reset_otp(self, email: str) -> None:
@@ -272,10 +288,11 @@ class AuthService:
             raise AuthenticationError(message="Invalid or expired reset token")
         
         # Hash new password
-        password_hash = hash_password(new_password)
+        password_hash = await ahash_password(new_password)
         
         # Update password
         await self.user_repo.update_password(user_id, password_hash)
+        await self.refresh_token_repo.revoke_all_for_user(user_id)
         
         logger.info(f"Password reset for user: {user_id}")
     
@@ -297,6 +314,17 @@ class AuthService:
         await self.otp_service.send_email_verification(email)
         logger.info(f"Verification OTP resent to: {email}")
     
+    async def _issue_tokens(self, user_id: str) -> Dict[str, str]:
+        """Create tokens for a user and record the refresh token."""
+        tokens = create_tokens(user_id)
+        await self.refresh_token_repo.add(
+            user_id=user_id,
+            token_hash=hash_refresh_token(tokens["refreshToken"]),
+            expires_at=datetime.now(timezone.utc)
+            + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        )
+        return tokens
+    
     def _user_to_dict(self, user) -> Dict[str, Any]:
         """Convert user model to dictionary."""
         return {
@@ -11,8 +11,37 @@ import httpx
 import base64
 from loguru import logger
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 
+# Shared outbound client so TCP/TLS connections to Monnify are reused
+_http_client: Optional[httpx.AsyncClient] = None
+
+# Monnify access tokens live 5 minutes; share one across service instances
+_token_cache = TTLCache(maxsize=1, ttl=240)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared Monnify HTTP client."""
+    global _http_client
+    
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+    
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared Monnify HTTP client on shutdown."""
+    global _http_client
+    
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 class MonnifyService:
     """Monnify payment gateway integration."""
@@ -23,38 +52,35 @@ class MonnifyService:
         self.secret_key = settings.MONNIFY_SECRET_KEY
         self.contract_code = settings.MONNIFY_CONTRACT_CODE
         self.redirect_url = settings.get_monnify_redirect_url
-        self._access_token: Optional[str] = None
-        self._token_expires: Optional[datetime] = None
     
     async def _get_access_token(self) -> str:
         """Get or refresh Monnify access token."""
-        if self._access_token and self._token_expires:
-            if datetime.now(timezone.utc) < self._token_expires:
-                return self._access_token
+        cached_token: Optional[str] = _token_cache.get(self.api_key)
+        if cached_token:
+            return cached_token
         
         # Generate auth credentials
         credentials = f"{self.api_key}:{self.secret_key}"
         encoded = base64.b64encode(credentials.encode()).decode()
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/auth/login",
-                headers={
-                    "Authorization": f"Basic {encoded}",
-                    "Content-Type": "application/json",
-                },
-            )
-            
-            if response.status_code != 200:
-                logger.error(f"Monnify auth failed: {response.text}")
-                raise Exception("Failed to authenticate with Monnify")
-            
-            data = response.json()
-            self._access_token = data["responseBody"]["accessToken"]
-            # Token expires in 5 minutes, refresh at 4 minutes
-            self._token_expires = datetime.now(timezone.utc) + timedelta(minutes=4)
-            
-            return self._access_token
+        response = await get_http_client().post(
+            f"{self.base_url}/api/v1/auth/login",
+            headers={
+                "Authorization": f"Basic {encoded}",
+                "Content-Type": "application/json",
+            },
+        )
+        
+        if response.status_code != 200:
+            logger.error(f"Monnify auth failed: {response.text}")
+            raise Exception("Failed to authenticate with Monnify")
+        
+        data = response.json()
+        access_token: str = data["responseBody"]["accessToken"]
+        # Token expires in 5 minutes, refresh at 4 minutes (cache TTL)
+        _token_cache.set(self.api_key, access_token)
+        
+        return access_token
     
     async def _make_request(
         self,
@@ -65,19 +91,18 @@ class MonnifyService:
         """Make authenticated request to Monnify API."""
         token = await self._get_access_token()
         
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
-                method=method,
-                url=f"{self.base_url}{endpoint}",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json",
-                },
-                json=data,
-            )
-            
-            result: Dict[str, Any] = response.json()
-            return result
+        response = await get_http_client().request(
+            method=method,
+            url=f"{self.base_url}{endpoint}",
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+            },
+            json=data,
+        )
+        
+        result: Dict[str, Any] = response.json()
+        return result
     
     async def create_payment(
         self,
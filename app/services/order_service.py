@@ -4,13 +4,14 @@ AGM Store Builder - Order Service
 Business logic for order management.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, AsyncIterator
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from loguru import logger
 
+from app.core.cache import invalidate_storefront, invalidate_user_analytics
 from app.core.config import settings
-from app.core.constants import ORDER_STATUS_TRANSITIONS, OrderStatus
+from app.core.constants import ORDER_STATUS_TRANSITIONS
 from app.core.exceptions import NotFoundError, AuthorizationError, BadRequestError
 from app.repositories.order_repository import OrderRepository
 from app.repositories.store_repository import StoreRepository
@@ -45,28 +46,38 @@ class OrderService:
         shipping_fee: float = 0,
     ) -> Dict[str, Any]:
         """Create a new order with payment initialization."""
-        # Get store
-        store = await self.store_repo.get_by_username(store_username)
-        if not store or not store.is_active:
+        # Get store (checkout links may carry the store ID instead of the username)
+        store = await self.store_repo.get_checkout_store(store_username)
+        if store is None:
             raise NotFoundError(message="Store not found", resource_type="Store")
+        store_id, store_owner_id, store_username = store
+        
+        # Fetch and lock every ordered product in a single query
+        products = await self.product_repo.get_by_ids(
+            [item["product_id"] for item in items],
+            for_update=True,
+        )
         
         # Process items and calculate totals
         order_items = []
         subtotal = 0
+        quantities: Dict[str, int] = {}
         
         for item in items:
-            product = await self.product_repo.get_by_id(item["product_id"])
-            if not product or product.store_id != store.id:
+            product = products.get(item["product_id"])
+            if not product or product.store_id != store_id:
                 raise BadRequestError(message=f"Product not found: {item['product_id']}")
             
             if not product.is_active:
                 raise BadRequestError(message=f"Product is not available: {product.name}")
             
-            if product.stock_quantity < item["quantity"]:
+            quantity = quantities.get(product.id, 0) + item["quantity"]
+            if product.stock_quantity < quantity:
                 raise BadRequestError(
                     message=f"Insufficient stock for {product.name}",
                     details={"available": product.stock_quantity},
                 )
+            quantities[product.id] = quantity
             
             item_subtotal = float(product.price) * item["quantity"]
             subtotal += item_subtotal
@@ -81,65 +92,77 @@ class OrderService:
                 "variant_selection": item.get("variant_selection"),
             })
         
-        # Calculate AGM fee and total
-        agm_fee = subtotal * (settings.AGM_FEE_PERCENTAGE / 100)
-        total = subtotal - discount + shipping_fee + agm_fee
-        
-        # Generate order number
-        order_number = await self.order_repo.generate_order_number()
-        
-        # Create order (items are stored as JSON in the Order model)
-        order = await self.order_repo.create(
-            store_id=store.id,
-            order_number=order_number,
-            customer_name=customer_name,
-            customer_email=customer_email,
-            customer_phone=customer_phone,
-            delivery_address=delivery_address,
-            delivery_state=delivery_state,
-            delivery_lga=delivery_lga,
-            items=order_items,  # JSON field
-            subtotal=subtotal,
-            discount=discount,
-            shipping_fee=shipping_fee,
-            agm_fee=agm_fee,
-            total=total,
-            notes=notes,
+        # Decrement stock while the rows are still locked; the commit ends
+        # the locking transaction, so check and decrement are one unit
+        await self.product_repo.adjust_stock_many(
+            {product_id: -quantity for product_id, quantity in quantities.items()}
         )
         
-        # Initialize payment with Monnify
-        payment_data = await self.monnify.create_payment(
-            order_id=order.id,
-            user_id=store.user_id,
-            amount=total,
-            customer_name=customer_name,
-            customer_email=customer_email,
-        )
-        
-        # Save payment record to database
-        await self.payment_repo.create(
-            order_id=order.id,
-            amount=total,
-            currency="NGN",
-            status="pending",
-            payment_reference=payment_data["payment_reference"],
-            monnify_reference=payment_data.get("transaction_reference"),
-            transaction_reference=payment_data.get("transaction_reference"),
-            checkout_url=payment_data.get("checkout_url"),
-            account_number=payment_data["accountDetails"]["accountNumber"],
-            account_name=payment_data["accountDetails"]["accountName"],
-            bank_name=payment_data["accountDetails"]["bankName"],
-            expires_at=datetime.fromisoformat(payment_data["expires_at"]) if payment_data.get("expires_at") else None,
-        )
-        
-        # Decrement stock
-        for item in order_items:
-            await self.product_repo.update_stock(
-                item["product_id"],
-                item["quantity"],
-                "decrement",
+        order = None
+        try:
+            # Calculate AGM fee and total
+            agm_fee = subtotal * (settings.AGM_FEE_PERCENTAGE / 100)
+            total = subtotal - discount + shipping_fee + agm_fee
+            
+            # Generate order number
+            order_number = await self.order_repo.generate_order_number()
+            
+            # Create order (items are stored as JSON in the Order model)
+            order = await self.order_repo.create(
+                store_id=store_id,
+                order_number=order_number,
+                customer_name=customer_name,
+                customer_email=customer_email,
+                customer_phone=customer_phone,
+                delivery_address=delivery_address,
+                delivery_state=delivery_state,
+                delivery_lga=delivery_lga,
+                items=order_items,  # JSON field
+                subtotal=subtotal,
+                discount=discount,
+                shipping_fee=shipping_fee,
+                agm_fee=agm_fee,
+                total=total,
+                notes=notes,
+            )
+            
+            # Initialize payment with Monnify
+            payment_data = await self.monnify.create_payment(
+                order_id=order.id,
+                user_id=store_owner_id,
+                amount=total,
+                customer_name=customer_name,
+                customer_email=customer_email,
+            )
+            
+            # Save payment record to database
+            await self.payment_repo.create(
+                order_id=order.id,
+                amount=total,
+                currency="NGN",
+                status="pending",
+                payment_reference=payment_data["payment_reference"],
+                monnify_reference=payment_data.get("transaction_reference"),
+                transaction_reference=payment_data.get("transaction_reference"),
+                checkout_url=payment_data.get("checkout_url"),
+                account_number=payment_data["accountDetails"]["accountNumber"],
+                account_name=payment_data["accountDetails"]["accountName"],
+                bank_name=payment_data["accountDetails"]["bankName"],
+                expires_at=datetime.fromisoformat(payment_data["expires_at"]) if payment_data.get("expires_at") else None,
             )
+        except Exception:
+            # The order row is already committed, so delete it and give the
+            # reserved stock back
+            await self.db.rollback()
+            if order is not None:
+                await self.order_repo.delete(order.id)
+            await self.product_repo.adjust_stock_many(quantities)
+            invalidate_storefront(store_username)
+            raise
         
+        # Stock levels changed, so cached storefront pages are stale
+        invalidate_storefront(store_username)
+        invalidate_user_analytics(store_owner_id)
         logger.info(f"Order created: {order_number}")
         
         return {
@@ -202,6 +225,7 @@ class OrderService:
         search: Optional[str] = None,
         date_from: Optional[str] = None,
         date_to: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Get all orders for user's stores."""
         return await self.order_repo.get_user_orders(
@@ -214,6 +238,28 @@ class OrderService:
             search=search,
             date_from=date_from,
             date_to=date_to,
+            cursor=cursor,
+        )
+    
+    def stream_user_orders(
+        self,
+        user_id: str,
+        store_id: Optional[str] = None,
+        status: Optional[str] = None,
+        payment_status: Optional[str] = None,
+        search: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream all orders for user's stores (unpaginated export)."""
+        return self.order_repo.stream_user_orders(
+            user_id=user_id,
+            store_id=store_id,
+            status=status,
+            payment_status=payment_status,
+            search=search,
+            date_from=date_from,
+            date_to=date_to,
         )
     
     async def update_order_status(
@@ -233,15 +279,13 @@ class OrderService:
             raise AuthorizationError(message="You don't have access to this order")
         
         # Validate status transition
-        current_status = OrderStatus(order.status)
-        allowed = ORDER_STATUS_TRANSITIONS.get(current_status, [])
-        
-        if new_status not in [s.value for s in allowed]:
+        if new_status not in ORDER_STATUS_TRANSITIONS.get(order.status, frozenset()):
             raise BadRequestError(
                 message=f"Cannot transition from {order.status} to {new_status}"
             )
         
         order = await self.order_repo.update_status(order_id, new_status)
+        invalidate_user_analytics(user_id)
         
         logger.info(f"Order status updated: {order_id} -> {new_status}")
         
@@ -269,14 +313,14 @@ class OrderService:
             raise BadRequestError(message="Order cannot be cancelled")
         
         # Restore stock from JSON items
+        restored: Dict[str, int] = {}
         for item in order.items:
-            await self.product_repo.update_stock(
-                item["product_id"],
-                item["quantity"],
-                "increment",
-            )
+            restored[item["product_id"]] = restored.get(item["product_id"], 0) + item["quantity"]
+        await self.product_repo.adjust_stock_many(restored)
         
         await self.order_repo.update_status(order_id, "cancelled")
+        invalidate_storefront(store.username)
+        invalidate_user_analytics(user_id)
         logger.info(f"Order cancelled: {order_id}")
     
     def _order_to_dict(self, order) -> Dict[str, Any]:
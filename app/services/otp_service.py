@@ -13,6 +13,7 @@ from loguru import logger
 
 from app.core.config import settings
 from app.core.constants import OTPType
+from app.services.email_service import EmailService
 
 
 class OTPService:
@@ -43,7 +44,6 @@ class OTPService:
         
         if not settings.USE_DEFAULT_OTP:
             # Send via email service
-            from app.services.email_service import EmailService
             email_service = EmailService()
             await email_service.send_otp(email, otp)
         
@@ -61,7 +61,6 @@ class OTPService:
         await self._store_otp(email, otp, OTPType.PASSWORD_RESET)
         
         if not settings.USE_DEFAULT_OTP:
-            from app.services.email_service import EmailService
             email_service = EmailService()
             await email_service.send_password_reset_otp(email, otp)
         
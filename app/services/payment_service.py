@@ -4,14 +4,22 @@ AGM Store Builder - Payment Service
 Business logic for payment processing with Monnify.
 """
 
+import asyncio
 from typing import Dict, Any, Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from loguru import logger
 
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.core.exceptions import NotFoundError, BadRequestError, ConflictError
 from app.repositories.payment_repository import PaymentRepository, BankAccountRepository
 from app.repositories.order_repository import OrderRepository
 from app.services.monnify_service import MonnifyService
+from app.utils.constants import NIGERIAN_BANKS
+
+# Live Monnify name lookups, briefly, so repeated checks of the same
+# account while a user fills in the form don't each hit the API
+_resolved_accounts = TTLCache(maxsize=10000, ttl=3600)
 
 
 class PaymentService:
@@ -30,8 +38,12 @@ class PaymentService:
         if not payment:
             raise NotFoundError(message="Payment not found", resource_type="Payment")
         
-        # Verify with Monnify
-        monnify_status = await self.monnify.verify_payment(reference)
+        # The Monnify round trip and the order lookup don't depend on each other
+        monnify_status, order = await asyncio.gather(
+            self.monnify.verify_payment(reference),
+            self.order_repo.get_by_id(payment.order_id),
+        )
+        order_dict = self._order_to_dict(order) if order else None
         
         # Update local status if changed
         if monnify_status["status"] != payment.status:
@@ -45,14 +57,14 @@ class PaymentService:
             # Update order payment status
             if monnify_status["status"] == "paid":
                 await self.order_repo.update_payment_status(payment.order_id, "paid")
-        
-        order = await self.order_repo.get_by_id(payment.order_id)
+                if order_dict:
+                    order_dict["payment_status"] = "paid"
         
         return {
             "verified": monnify_status["status"] == "paid",
             "status": monnify_status["status"],
             "payment": self._payment_to_dict(payment),
-            "order": self._order_to_dict(order) if order else None,
+            "order": order_dict,
         }
     
     async def get_payment_details(self, reference: str) -> Dict[str, Any]:
@@ -101,6 +113,11 @@ class PaymentService:
             logger.warning(f"Payment not found for reference: {payment_reference}")
             return
         
+        # A replayed event must not move paid_at or the order status again
+        if payment.status == "paid":
+            logger.info(f"Payment already processed: {payment_reference}")
+            return
+        
         # Update payment status
         await self.payment_repo.update_status(
             payment.id,
@@ -185,8 +202,12 @@ class PaymentService:
         Resolve/verify a bank account number using Monnify API.
         
         In development, returns mock data. In production, calls Monnify API.
+        Successful production lookups are cached for an hour.
         """
-        from app.utils.constants import NIGERIAN_BANKS
+        cache_key = f"bankacct:{bank_code}:{account_number}"
+        cached = _resolved_accounts.get(cache_key)
+        if cached is not None:
+            return cached
         
         # Get bank name from code
         bank_name = "Unknown Bank"
@@ -201,12 +222,21 @@ class PaymentService:
             bank_code=bank_code,
         )
         
-        return {
+        resolved = {
             "account_name": result["account_name"],
             "account_number": result["account_number"],
             "bank_code": bank_code,
             "bank_name": bank_name,
         }
+        # Never cache mock names, blank names or unknown bank codes
+        if (
+            settings.is_production
+            and self.monnify.api_key
+            and resolved["account_name"]
+            and bank_name != "Unknown Bank"
+        ):
+            _resolved_accounts.set(cache_key, resolved)
+        return resolved
     
     async def get_user_bank_accounts(self, user_id: str) -> List[Dict[str, Any]]:
         """Get all bank accounts for a user."""
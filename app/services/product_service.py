@@ -8,6 +8,7 @@ from typing import Dict, Any, Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from loguru import logger
 
+from app.core.cache import invalidate_storefront
 from app.core.exceptions import NotFoundError, AuthorizationError
 from app.repositories.product_repository import ProductRepository
 from app.repositories.store_repository import StoreRepository
@@ -71,6 +72,7 @@ class ProductService:
             is_featured=is_featured,
         )
         
+        invalidate_storefront(store.username)
         logger.info(f"Product created: {product.id} in store {store_id}")
         return self._product_to_dict(product)
     
@@ -96,6 +98,7 @@ class ProductService:
         search: Optional[str] = None,
         category: Optional[str] = None,
         product_status: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Get all products for a user's stores."""
         return await self.product_repo.get_user_products(
@@ -106,6 +109,7 @@ class ProductService:
             search=search,
             category=category,
             product_status=product_status,
+            cursor=cursor,
         )
     
     async def get_store_products(
@@ -116,6 +120,7 @@ class ProductService:
         search: Optional[str] = None,
         category: Optional[str] = None,
         sort_by: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Get public products for a store (for storefront)."""
         return await self.product_repo.get_store_products(
@@ -125,6 +130,7 @@ class ProductService:
             search=search,
             category=category,
             sort_by=sort_by,
+            cursor=cursor,
         )
     
     async def get_public_product(
@@ -141,10 +147,14 @@ class ProductService:
             raise NotFoundError(message="Product not found", resource_type="Product")
         
         # Increment view count
-        await self.product_repo.increment_view_count(product_id)
+        await self.record_product_view(product_id)
         
         return self._product_to_dict(product)
     
+    async def record_product_view(self, product_id: str) -> None:
+        """Count a storefront view of a product."""
+        await self.product_repo.increment_view_count(product_id)
+    
     async def update_product(
         self,
         product_id: str,
@@ -167,14 +177,18 @@ class ProductService:
             "variants": "variations",
         }
         
+        # Only fields the client sent are passed in; an explicit null
+        # clears a nullable column and is ignored for required ones
+        columns = self.product_repo.model.__table__.columns
         updates = {}
         for key, value in kwargs.items():
-            if value is not None:
-                field = field_mapping.get(key, key)
+            field = field_mapping.get(key, key)
+            if value is not None or columns[field].nullable:
                 updates[field] = value
         
         if updates:
             product = await self.product_repo.update(product_id, **updates)
+            invalidate_storefront(store.username)
         
         logger.info(f"Product updated: {product_id}")
         return self._product_to_dict(product)
@@ -199,6 +213,7 @@ class ProductService:
         
         qty = stock_quantity if stock_quantity is not None else quantity or 0
         product = await self.product_repo.update_stock(product_id, qty, operation)
+        invalidate_storefront(store.username)
         
         logger.info(f"Product stock updated: {product_id} ({operation}: {qty})")
         return self._product_to_dict(product)
@@ -220,6 +235,7 @@ class ProductService:
             raise AuthorizationError(message="You don't have access to this product")
         
         product = await self.product_repo.update(product_id, is_active=is_active)
+        invalidate_storefront(store.username)
         
         status = "activated" if is_active else "deactivated"
         logger.info(f"Product {status}: {product_id}")
@@ -237,6 +253,7 @@ class ProductService:
             raise AuthorizationError(message="You don't have access to this product")
         
         await self.product_repo.delete(product_id)
+        invalidate_storefront(store.username)
         logger.info(f"Product deleted: {product_id}")
     
     async def bulk_update(
@@ -245,8 +262,27 @@ class ProductService:
         user_id: str,
         updates: Dict[str, Any],
     ) -> int:
-        """Bulk update multiple products."""
+        """
+        Bulk update multiple products.
+        
+        Ownership is checked by the UPDATE itself; if any id is missing or
+        not owned by the user, nothing is changed.
+        
+        Args:
+            product_ids: Products to update
+            user_id: Requesting user's ID
+            updates: Column values to set
+            
+        Returns:
+            Number of products updated
+            
+        Raises:
+            AuthorizationError: If any product is missing or not owned by the user
+        """
         count = await self.product_repo.bulk_update(product_ids, user_id, updates)
+        if count:
+            for store in await self.store_repo.get_by_user_id(user_id):
+                invalidate_storefront(store.username)
         logger.info(f"Bulk updated {count} products for user {user_id}")
         return count
     
@@ -5,9 +5,15 @@ Business logic for store management.
 """
 
 from typing import Dict, Any, Optional, List
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from loguru import logger
 
+from app.core.cache import (
+    invalidate_checkout_store,
+    invalidate_storefront,
+    invalidate_user_store_ids,
+)
 from app.core.exceptions import NotFoundError, ConflictError, AuthorizationError
 from app.repositories.store_repository import StoreRepository
 
@@ -49,25 +55,35 @@ class StoreService:
         Raises:
             ConflictError: If username already exists
         """
-        # Check username availability
+        # The unique constraint on stores.username is the source of truth;
+        # a pre-check here would only race with concurrent creates.
         username_lower = username.lower()
-        if await self.store_repo.username_exists(username_lower):
+        try:
+            store = await self.store_repo.create(
+                user_id=user_id,
+                username=username_lower,
+                display_name=name,
+                description=description,
+                category=category,
+                logo_url=logo,
+                banner_url=banner,
+                social_links=social_links,
+            )
+        except IntegrityError:
+            await self.db.rollback()
+            if not await self.store_repo.username_exists(username_lower):
+                raise
             raise ConflictError(
                 message="Username already taken",
-                details={"username": username_lower},
+                details={
+                    "username": username_lower,
+                    "suggestions": await self.store_repo.generate_username_suggestions(
+                        username_lower
+                    ),
+                },
             )
         
-        store = await self.store_repo.create(
-            user_id=user_id,
-            username=username_lower,
-            display_name=name,
-            description=description,
-            category=category,
-            logo_url=logo,
-            banner_url=banner,
-            social_links=social_links,
-        )
-        
+        invalidate_user_store_ids(user_id)
         logger.info(f"Store created: {store.id} by user {user_id}")
         return self._store_to_dict(store)
     
@@ -164,15 +180,21 @@ class StoreService:
             "banner": "banner_url",
         }
         
+        # Only fields the client sent are passed in; an explicit null
+        # clears a nullable column and is ignored for required ones
+        columns = self.store_repo.model.__table__.columns
         updates = {}
         for key, value in kwargs.items():
-            if value is not None:
-                field = field_mapping.get(key, key)
+            field = field_mapping.get(key, key)
+            if value is not None or columns[field].nullable:
                 updates[field] = value
         
+        previous_username = store.username
         if updates:
             store = await self.store_repo.update(store_id, **updates)
         
+        invalidate_storefront(previous_username)
+        invalidate_checkout_store(store_id, previous_username)
         logger.info(f"Store updated: {store_id}")
         return self._store_to_dict(store)
     
@@ -201,6 +223,8 @@ class StoreService:
             raise AuthorizationError(message="You don't have access to this store")
         
         store = await self.store_repo.update(store_id, is_active=is_active)
+        invalidate_storefront(store.username)
+        invalidate_checkout_store(store_id, store.username)
         
         status = "activated" if is_active else "deactivated"
         logger.info(f"Store {status}: {store_id}")
@@ -226,6 +250,9 @@ class StoreService:
             raise AuthorizationError(message="You don't have access to this store")
         
         await self.store_repo.delete(store_id)
+        invalidate_user_store_ids(user_id)
+        invalidate_storefront(store.username)
+        invalidate_checkout_store(store_id, store.username)
         logger.info(f"Store deleted: {store_id}")
     
     async def check_username_availability(self, username: str) -> Dict[str, Any]:
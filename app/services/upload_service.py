@@ -5,6 +5,7 @@ Image upload service that stores images as base64 data URLs.
 No external storage services required - images are stored directly in the database.
 """
 
+import asyncio
 import base64
 import uuid
 from typing import Dict, Any, Optional
@@ -26,6 +27,11 @@ ALLOWED_MIME_TYPES = {
 MAX_FILE_SIZE = 5 * 1024 * 1024
 
 
+def _to_data_url(content: bytes, mime_type: str) -> str:
+    """Encode image bytes as a base64 data URL."""
+    return f"data:{mime_type};base64,{base64.b64encode(content).decode('ascii')}"
+
+
 class UploadService:
     """
     Upload service that converts images to base64 data URLs.
@@ -110,9 +116,9 @@ class UploadService:
             # Validate image
             mime_type = self._validate_image(file_content, filename)
             
-            # Convert to base64 data URL
-            base64_data = base64.b64encode(file_content).decode('utf-8')
-            data_url = f"data:{mime_type};base64,{base64_data}"
+            # Encode off the event loop; multi-MB images would otherwise
+            # stall every other request while being converted
+            data_url = await asyncio.to_thread(_to_data_url, file_content, mime_type)
             
             # Generate a unique ID for tracking
             public_id = f"{folder}/{uuid.uuid4().hex[:12]}"
@@ -8,8 +8,10 @@ from typing import Dict, Any, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from loguru import logger
 
-from app.core.security import hash_password, verify_password
+from app.core.cache import invalidate_user_role
+from app.core.security import ahash_password, averify_password
 from app.core.exceptions import NotFoundError, BadRequestError, AuthenticationError
+from app.repositories.refresh_token_repository import RefreshTokenRepository
 from app.repositories.user_repository import UserRepository
 
 
@@ -98,12 +100,13 @@ class UserService:
             raise NotFoundError(message="User not found", resource_type="User")
         
         # Verify current password
-        if not verify_password(current_password, user.password_hash):
+        if not await averify_password(current_password, user.password_hash):
             raise AuthenticationError(message="Current password is incorrect")
         
         # Hash and update new password
-        new_hash = hash_password(new_password)
+        new_hash = await ahash_password(new_password)
         await self.user_repo.update_password(user_id, new_hash)
+        await RefreshTokenRepository(self.db).revoke_all_for_user(user_id)
         
         logger.info(f"Password changed for user: {user_id}")
     
@@ -122,6 +125,8 @@ class UserService:
             raise NotFoundError(message="User not found", resource_type="User")
         
         await self.user_repo.soft_delete(user_id)
+        invalidate_user_role(user_id)
+        await RefreshTokenRepository(self.db).revoke_all_for_user(user_id)
         logger.info(f"User account deleted: {user_id}")
     
     async def complete_onboarding(self, user_id: str) -> Dict[str, Any]:
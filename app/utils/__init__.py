@@ -23,6 +23,9 @@ from app.utils.helpers import (
     get_nigerian_state_lgas,
     parse_json_safely,
     dict_to_query_string,
+    encode_cursor,
+    decode_cursor,
+    client_ip,
 )
 from app.utils.validators import (
     ValidationError,
@@ -55,6 +58,9 @@ __all__ = [
     "get_nigerian_state_lgas",
     "parse_json_safely",
     "dict_to_query_string",
+    "encode_cursor",
+    "decode_cursor",
+    "client_ip",
     # Validators
     "ValidationError",
     "validate_password",
@@ -5,12 +5,23 @@ Common utility functions for the application.
 """
 
 import re
+import json
+import base64
 import random
 import string
-from typing import Optional, List, Dict, Any
+from typing import TYPE_CHECKING, Optional, List, Dict, Any
 from datetime import datetime, timezone
 from uuid import uuid4
 
+if TYPE_CHECKING:
+    from fastapi import Request
+
+# Patterns used on request paths, compiled once at import
+_NON_DIGITS = re.compile(r'\D')
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_SLUG_STRIP = re.compile(r'[^\w\s-]')
+_SLUG_SEPARATORS = re.compile(r'[-\s]+')
+
 
 def generate_uuid() -> str:
     """Generate a new UUID string."""
@@ -53,7 +64,7 @@ def format_phone(phone: str, country_code: str = "234") -> str:
         Formatted phone number
     """
     # Remove all non-digits
-    digits = re.sub(r'\D', '', phone)
+    digits = _NON_DIGITS.sub('', phone)
     
     # Handle Nigerian numbers
     if digits.startswith('0') and len(digits) == 11:
@@ -68,13 +79,12 @@ def format_phone(phone: str, country_code: str = "234") -> str:
 
 def validate_email(email: str) -> bool:
     """Validate email format."""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_PATTERN.match(email))
 
 
 def validate_phone(phone: str) -> bool:
     """Validate Nigerian phone number."""
-    digits = re.sub(r'\D', '', phone)
+    digits = _NON_DIGITS.sub('', phone)
     
     # Valid formats: 0XXXXXXXXXX, 234XXXXXXXXXX, +234XXXXXXXXXX
     if len(digits) == 11 and digits.startswith('0'):
@@ -88,8 +98,8 @@ def validate_phone(phone: str) -> bool:
 def slugify(text: str) -> str:
     """Convert text to URL-friendly slug."""
     text = text.lower().strip()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[-\s]+', '-', text)
+    text = _SLUG_STRIP.sub('', text)
+    text = _SLUG_SEPARATORS.sub('-', text)
     return text.strip('-')
 
 
@@ -116,7 +126,7 @@ def mask_email(email: str) -> str:
 
 def mask_phone(phone: str) -> str:
     """Mask phone number for privacy."""
-    digits = re.sub(r'\D', '', phone)
+    digits = _NON_DIGITS.sub('', phone)
     if len(digits) < 4:
         return phone
     
@@ -171,3 +181,42 @@ def dict_to_query_string(params: Dict[str, Any]) -> str:
     """Convert dictionary to URL query string."""
     from urllib.parse import urlencode
     return urlencode({k: v for k, v in params.items() if v is not None})
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode keyset pagination values into an opaque URL-safe cursor."""
+    raw = json.dumps([str(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def client_ip(request: "Request") -> str:
+    """
+    Get the client's IP address from the request.
+    
+    Handles X-Forwarded-For header for requests behind proxies, taking the
+    first IP in the chain (original client).
+    
+    Args:
+        request: FastAPI Request object
+        
+    Returns:
+        Client IP address string
+    """
+    forwarded = request.headers.get("X-Forwarded-For")
+    if forwarded:
+        # partition avoids building a list of every hop
+        return forwarded.partition(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def decode_cursor(cursor: str, size: int) -> Optional[List[str]]:
+    """Decode a cursor from encode_cursor; returns None if it is malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        return None
+    
+    if not isinstance(values, list) or len(values) != size:
+        return None
+    return [str(v) for v in values]
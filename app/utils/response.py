@@ -0,0 +1,96 @@
+"""
+AGM Store Builder - Response Utilities
+
+Helpers for building pre-serialized and streamed API responses.
+"""
+
+import hashlib
+from typing import Any, AsyncIterator, Dict, Tuple
+
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Public data may be reused by browsers/CDNs briefly, then revalidated by ETag
+PUBLIC_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=300"
+
+
+def model_response(
+    adapter: TypeAdapter,
+    payload: Dict[str, Any],
+    status_code: int = 200,
+) -> Response:
+    """
+    Validate a payload once and serialize it straight to JSON bytes.
+
+    Used instead of ``response_model`` on hot endpoints so the payload is
+    not validated, re-dumped to Python and then JSON-encoded separately.
+
+    Args:
+        adapter: TypeAdapter for the response schema
+        payload: Response body as plain data
+        status_code: HTTP status code
+
+    Returns:
+        Response with the serialized body
+    """
+    body = adapter.dump_json(adapter.validate_python(payload))
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+def etag_body(body: bytes) -> Tuple[bytes, str]:
+    """Pair a serialized body with a strong ETag derived from its content."""
+    return body, f'"{hashlib.md5(body).hexdigest()}"'
+
+
+def conditional_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    cache_control: str = PUBLIC_CACHE_CONTROL,
+) -> Response:
+    """
+    Serve a pre-serialized JSON body, or 304 if the client already has it.
+
+    Args:
+        request: Incoming request (checked for If-None-Match)
+        body: Serialized JSON body
+        etag: Quoted ETag for the body
+        cache_control: Cache-Control header value
+
+    Returns:
+        304 response on an ETag match, otherwise the full body
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def wants_ndjson(request: Request) -> bool:
+    """Check whether the client asked for a newline-delimited JSON stream."""
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def ndjson_response(rows: AsyncIterator[Dict[str, Any]]) -> StreamingResponse:
+    """
+    Stream rows as newline-delimited JSON.
+
+    Args:
+        rows: Async iterator of JSON-serializable dicts
+
+    Returns:
+        StreamingResponse emitting one JSON document per line
+    """
+    async def encode() -> AsyncIterator[bytes]:
+        async for row in rows:
+            yield orjson.dumps(row, default=str) + b"\n"
+
+    return StreamingResponse(encode(), media_type=NDJSON_MEDIA_TYPE)
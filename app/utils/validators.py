@@ -7,6 +7,13 @@ Custom validation utilities for the application.
 import re
 from typing import Optional, List
 
+from app.utils.helpers import _EMAIL_PATTERN, _NON_DIGITS
+
+# Patterns compiled once at import rather than looked up per call
+_USERNAME_PATTERN = re.compile(r'^[a-z0-9_]+$')
+_ACCOUNT_NUMBER_PATTERN = re.compile(r'^\d{10}$')
+_URL_PATTERN = re.compile(r'^https?://[^\s/$.?#].[^\s]*$', re.IGNORECASE)
+
 
 class ValidationError(Exception):
     """Custom validation error."""
@@ -33,8 +40,7 @@ def validate_email(email: str) -> bool:
     if not email:
         raise ValidationError("Email is required", "email")
     
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if not re.match(pattern, email):
+    if not _EMAIL_PATTERN.match(email):
         raise ValidationError("Invalid email format", "email")
     
     return True
@@ -101,7 +107,7 @@ def validate_phone(phone: str) -> bool:
         raise ValidationError("Phone number is required", "phone")
     
     # Remove all non-digits
-    digits = re.sub(r'\D', '', phone)
+    digits = _NON_DIGITS.sub('', phone)
     
     # Valid formats
     valid = False
@@ -147,7 +153,7 @@ def validate_username(username: str) -> bool:
         )
     
     # Only allow lowercase letters, numbers, and underscores
-    if not re.match(r'^[a-z0-9_]+$', username.lower()):
+    if not _USERNAME_PATTERN.match(username.lower()):
         raise ValidationError(
             "Username can only contain letters, numbers, and underscores",
             "username"
@@ -196,7 +202,7 @@ def validate_account_number(account_number: str) -> bool:
     account_number = account_number.replace(' ', '')
     
     # Must be exactly 10 digits
-    if not re.match(r'^\d{10}$', account_number):
+    if not _ACCOUNT_NUMBER_PATTERN.match(account_number):
         raise ValidationError(
             "Account number must be exactly 10 digits",
             "account_number"
@@ -271,9 +277,7 @@ def validate_image_url(url: str) -> bool:
     if not url:
         return True  # Optional
     
-    # Basic URL pattern
-    pattern = r'^https?://[^\s/$.?#].[^\s]*$'
-    if not re.match(pattern, url, re.IGNORECASE):
+    if not _URL_PATTERN.match(url):
         raise ValidationError("Invalid URL format", "url")
     
     # Check for valid image extensions or Cloudinary URL
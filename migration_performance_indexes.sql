@@ -0,0 +1,37 @@
+-- PERFORMANCE INDEXES
+-- Composite indexes for the dominant dashboard/storefront query shapes,
+-- plus server-side defaults that let hot writes skip client-side work.
+-- Safe to run once against an existing database (TiDB / MySQL 8.0).
+
+-- 1. Orders: dashboard customer aggregation (per store, grouped by phone)
+CREATE INDEX ix_orders_store_customer_phone_created ON orders(store_id, customer_phone, created_at);
+
+-- 2. Orders: keyset pagination of order lists (created_at DESC, id DESC)
+CREATE INDEX ix_orders_store_created_id ON orders(store_id, created_at, id);
+
+-- 3. Products: keyset pagination of product lists (created_at DESC, id DESC)
+CREATE INDEX ix_products_store_created_id ON products(store_id, created_at, id);
+
+-- 4. User settings: generate ids server-side (MySQL 8.0.13+ / TiDB 8.0+)
+ALTER TABLE user_settings ALTER COLUMN id SET DEFAULT (UUID());
+
+-- 5. Orders: paid-revenue analytics per store over a date range
+CREATE INDEX ix_orders_store_payment_status_created ON orders(store_id, payment_status, created_at);
+
+-- 6. Products: active / in-stock product lists and counts per store
+CREATE INDEX ix_products_store_active_stock ON products(store_id, is_active, stock_quantity);
+
+-- 7. Refunds: refunds of a payment by status
+CREATE INDEX ix_refunds_payment_status ON refunds(payment_id, status);
+
+-- 8. OTPs: live-code lookup (code, unverified, unexpired); replaces the
+--    single-column code and verified indexes (MySQL has no partial indexes)
+CREATE INDEX ix_otp_verifications_code_verified_expires ON otp_verifications(code, verified, expires_at);
+DROP INDEX ix_otp_verifications_code ON otp_verifications;
+DROP INDEX ix_otp_verifications_verified ON otp_verifications;
+
+-- 9. Refresh tokens: a user's unrevoked tokens; also backs the user_id
+--    foreign key, so it is created before the old indexes are dropped
+CREATE INDEX ix_refresh_tokens_user_revoked ON refresh_tokens(user_id, revoked);
+DROP INDEX ix_refresh_tokens_user_id ON refresh_tokens;
+DROP INDEX ix_refresh_tokens_revoked ON refresh_tokens;
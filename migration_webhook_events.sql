@@ -0,0 +1,17 @@
+-- WEBHOOK EVENTS
+-- Received Monnify webhook events, stored before they are acknowledged so
+-- a failed or lost background run can be replayed. Safe to run once
+-- against an existing database (TiDB / MySQL 8.0).
+
+CREATE TABLE IF NOT EXISTS `webhook_events` (
+  `id`            VARCHAR(36)  NOT NULL,
+  `event_key`     VARCHAR(160) NOT NULL,
+  `event_type`    VARCHAR(50)  NOT NULL,
+  `event_data`    JSON         NOT NULL,
+  `claimed_at`    DATETIME     DEFAULT NULL,
+  `processed_at`  DATETIME     DEFAULT NULL,
+  `created_at`    DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (`id`),
+  UNIQUE KEY `uq_webhook_events_event_key` (`event_key`),
+  KEY `ix_webhook_events_processed_claimed` (`processed_at`, `claimed_at`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
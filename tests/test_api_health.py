@@ -35,3 +35,21 @@ class TestHealthEndpoint:
         response = await async_client.get("/health")
         data = response.json()
         assert "version" in data
+
+
+class TestApiHealthEndpoint:
+    async def test_reports_connected_database(self, async_client, mock_db_session):
+        response = await async_client.get("/api/v1/health")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "ok"
+        assert data["database"] == "connected"
+        mock_db_session.execute.assert_awaited_once()
+
+    async def test_unreachable_database_returns_503(self, async_client, mock_db_session):
+        mock_db_session.execute.side_effect = OSError("connection refused")
+        response = await async_client.get("/api/v1/health")
+        assert response.status_code == 503
+        data = response.json()
+        assert data["status"] == "degraded"
+        assert data["database"] == "unavailable"
@@ -0,0 +1,27 @@
+"""
+Tests for payment API endpoints.
+"""
+
+import pytest
+
+
+class TestBanksEndpoint:
+    async def test_banks_returns_list_with_etag(self, async_client):
+        response = await async_client.get("/api/v1/payments/banks")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert len(data["data"]) > 0
+        assert response.headers["etag"]
+        assert "max-age" in response.headers["cache-control"]
+
+    async def test_banks_not_modified_when_etag_matches(self, async_client):
+        first = await async_client.get("/api/v1/payments/banks")
+        etag = first.headers["etag"]
+
+        response = await async_client.get(
+            "/api/v1/payments/banks",
+            headers={"If-None-Match": etag},
+        )
+        assert response.status_code == 304
+        assert response.content == b""
@@ -0,0 +1,36 @@
+"""
+Tests for upload API endpoints.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from app.core.exceptions import FileUploadError
+from app.dependencies import get_upload_service
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 16
+
+
+class TestUploadMultipleImages:
+    async def test_failed_file_deletes_the_uploaded_ones(self, async_client, auth_headers):
+        from app.main import app
+
+        service = MagicMock(
+            upload_image=AsyncMock(side_effect=[
+                {"public_id": "products/ok", "url": "data:image/png;base64,"},
+                FileUploadError(message="Invalid image"),
+            ]),
+            delete_image=AsyncMock(return_value=True),
+        )
+        app.dependency_overrides[get_upload_service] = lambda: service
+
+        response = await async_client.post(
+            "/api/v1/upload/images",
+            headers=auth_headers,
+            files=[
+                ("images", ("a.png", PNG, "image/png")),
+                ("images", ("b.png", PNG, "image/png")),
+            ],
+        )
+
+        assert response.status_code == 400
+        service.delete_image.assert_awaited_once_with("products/ok", "test-user-id-123")
@@ -0,0 +1,78 @@
+"""
+Tests for app.services.auth_service — refresh-token rotation and logout.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.exceptions import AuthenticationError
+from app.core.security import create_refresh_token, hash_refresh_token, verify_refresh_token
+from app.services.auth_service import AuthService
+
+USER_ID = "user-rt-1"
+
+
+@pytest.fixture
+def auth_service(mock_db_session):
+    service = AuthService(mock_db_session)
+    service.user_repo = MagicMock(
+        get_by_id=AsyncMock(return_value=MagicMock(id=USER_ID, is_active=True)),
+    )
+    service.refresh_token_repo = MagicMock(
+        add=AsyncMock(),
+        revoke=AsyncMock(return_value=True),
+        revoke_all_for_user=AsyncMock(),
+    )
+    return service
+
+
+class TestRefreshRotation:
+    async def test_rotation_revokes_presented_token_and_records_new_one(self, auth_service):
+        token = create_refresh_token(data={"sub": USER_ID})
+
+        tokens = await auth_service.refresh_tokens(token)
+
+        auth_service.refresh_token_repo.revoke.assert_awaited_once_with(hash_refresh_token(token), USER_ID)
+        assert verify_refresh_token(tokens["refreshToken"]) == USER_ID
+        assert tokens["refreshToken"] != token
+        recorded = auth_service.refresh_token_repo.add.await_args.kwargs
+        assert recorded["user_id"] == USER_ID
+        assert recorded["token_hash"] == hash_refresh_token(tokens["refreshToken"])
+
+    async def test_reused_token_is_rejected(self, auth_service):
+        # The conditional UPDATE matches nothing once the token is revoked
+        auth_service.refresh_token_repo.revoke.return_value = False
+        token = create_refresh_token(data={"sub": USER_ID})
+
+        with pytest.raises(AuthenticationError):
+            await auth_service.refresh_tokens(token)
+        auth_service.refresh_token_repo.add.assert_not_awaited()
+
+    async def test_inactive_user_is_rejected(self, auth_service):
+        auth_service.user_repo.get_by_id.return_value = MagicMock(id=USER_ID, is_active=False)
+        token = create_refresh_token(data={"sub": USER_ID})
+
+        with pytest.raises(AuthenticationError):
+            await auth_service.refresh_tokens(token)
+        auth_service.refresh_token_repo.revoke.assert_not_awaited()
+
+    async def test_malformed_token_is_rejected(self, auth_service):
+        with pytest.raises(AuthenticationError):
+            await auth_service.refresh_tokens("not-a-jwt")
+
+
+class TestLogout:
+    async def test_logout_with_token_revokes_only_that_token(self, auth_service):
+        token = create_refresh_token(data={"sub": USER_ID})
+
+        await auth_service.logout(USER_ID, token)
+
+        auth_service.refresh_token_repo.revoke.assert_awaited_once_with(hash_refresh_token(token), USER_ID)
+        auth_service.refresh_token_repo.revoke_all_for_user.assert_not_awaited()
+
+    async def test_logout_without_token_revokes_all(self, auth_service):
+        await auth_service.logout(USER_ID)
+
+        auth_service.refresh_token_repo.revoke_all_for_user.assert_awaited_once_with(USER_ID)
+        auth_service.refresh_token_repo.revoke.assert_not_awaited()
@@ -0,0 +1,127 @@
+"""
+Tests for the in-process TTL cache and endpoint rate limiting.
+"""
+
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.cache import TTLCache
+from app.core.exceptions import RateLimitError
+from app.core.config import settings
+from app.middleware.rate_limit import get_rate_limit_key, rate_limit
+
+
+class TestTTLCache:
+    def test_set_and_get(self):
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", {"x": 1})
+        assert cache.get("a") == {"x": 1}
+
+    def test_missing_key_returns_none(self):
+        cache = TTLCache()
+        assert cache.get("nope") is None
+
+    def test_expired_entry_returns_none(self, monkeypatch):
+        cache = TTLCache(ttl=10)
+        now = time.monotonic()
+        monkeypatch.setattr("app.core.cache.time.monotonic", lambda: now)
+        cache.set("a", 1)
+        monkeypatch.setattr("app.core.cache.time.monotonic", lambda: now + 11)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_delete_prefix(self):
+        cache = TTLCache()
+        cache.set("analytics:u1:dashboard", 1)
+        cache.set("analytics:u1:revenue", 2)
+        cache.set("analytics:u2:dashboard", 3)
+        assert cache.delete_prefix("analytics:u1:") == 2
+        assert cache.get("analytics:u2:dashboard") == 3
+
+
+class TestEndpointRateLimit:
+    async def test_rejects_after_limit(self):
+        request = MagicMock()
+        request.headers = {}
+        request.client.host = "10.0.0.1"
+        request.json = AsyncMock(return_value={"email": "user@example.com"})
+        dependency = rate_limit("test-scope", limit=2, window=60)
+
+        await dependency(request)
+        await dependency(request)
+        with pytest.raises(RateLimitError):
+            await dependency(request)
+
+    async def test_keys_on_normalized_email(self):
+        request = MagicMock()
+        request.headers = {}
+        request.client.host = "10.0.0.2"
+        request.json = AsyncMock(return_value={"email": "a@example.com"})
+        dependency = rate_limit("email-scope", limit=1, window=60)
+
+        await dependency(request)
+        request.json.return_value = {"email": " A@Example.com "}
+        with pytest.raises(RateLimitError):
+            await dependency(request)
+
+        # Another address from the same IP has its own counter
+        request.json.return_value = {"email": "b@example.com"}
+        await dependency(request)
+
+    async def test_email_bucket_spans_ips(self):
+        request = MagicMock()
+        request.headers = {}
+        request.json = AsyncMock(return_value={"email": "victim@example.com"})
+        dependency = rate_limit("email-bucket", limit=5, email_limit=2, window=60)
+
+        for host in ("10.1.0.1", "10.1.0.2"):
+            request.client.host = host
+            await dependency(request)
+        request.client.host = "10.1.0.3"
+        with pytest.raises(RateLimitError):
+            await dependency(request)
+
+    async def test_ip_bucket_spans_emails(self):
+        request = MagicMock()
+        request.headers = {}
+        request.client.host = "10.2.0.1"
+        request.json = AsyncMock()
+        dependency = rate_limit("ip-bucket", limit=5, ip_limit=2, window=60)
+
+        for email in ("a@example.com", "b@example.com"):
+            request.json.return_value = {"email": email}
+            await dependency(request)
+        request.json.return_value = {"email": "c@example.com"}
+        with pytest.raises(RateLimitError):
+            await dependency(request)
+
+    async def test_ignores_forwarded_for_without_trusted_proxy(self):
+        request = MagicMock()
+        request.client.host = "10.3.0.1"
+        request.json = AsyncMock(return_value={"email": "user@example.com"})
+        dependency = rate_limit("spoof-scope", limit=1, window=60)
+
+        request.headers = {"X-Forwarded-For": "1.1.1.1"}
+        await dependency(request)
+        request.headers = {"X-Forwarded-For": "2.2.2.2"}
+        with pytest.raises(RateLimitError):
+            await dependency(request)
+
+    def test_trusted_proxy_reads_appended_hop(self, monkeypatch):
+        monkeypatch.setattr(settings, "TRUSTED_PROXY_COUNT", 1)
+        request = MagicMock()
+        request.client.host = "10.0.0.254"
+        request.headers = {"X-Forwarded-For": "6.6.6.6, 203.0.113.7"}
+        assert get_rate_limit_key(request) == "203.0.113.7"
@@ -0,0 +1,46 @@
+"""
+Tests for app.middleware.error_handler — responses for unhandled errors.
+"""
+
+from httpx import ASGITransport, AsyncClient
+
+from app.dependencies import get_upload_service
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 16
+
+
+def _broken_service():
+    raise RuntimeError("boom")
+
+
+async def _post_image(headers):
+    from app.main import app
+
+    app.dependency_overrides[get_upload_service] = _broken_service
+    # ServerErrorMiddleware re-raises after responding; keep the response
+    transport = ASGITransport(app=app, raise_app_exceptions=False)
+    try:
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post(
+                "/api/v1/upload/image",
+                headers=headers,
+                files={"image": ("a.png", PNG, "image/png")},
+            )
+    finally:
+        app.dependency_overrides.clear()
+
+
+class TestUnhandledExceptionCors:
+    async def test_500_carries_cors_headers_for_allowed_origin(self, auth_headers):
+        response = await _post_image({**auth_headers, "Origin": "http://localhost:3000"})
+
+        assert response.status_code == 500
+        assert response.json()["message"] == "An unexpected error occurred"
+        assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+        assert response.headers["access-control-allow-credentials"] == "true"
+
+    async def test_500_omits_cors_headers_for_unknown_origin(self, auth_headers):
+        response = await _post_image({**auth_headers, "Origin": "https://evil.example"})
+
+        assert response.status_code == 500
+        assert "access-control-allow-origin" not in response.headers
@@ -22,7 +22,11 @@ from app.utils.helpers import (
     calculate_percentage,
     parse_json_safely,
     dict_to_query_string,
+    encode_cursor,
+    decode_cursor,
+    client_ip,
 )
+from starlette.requests import Request
 
 
 # ── UUID Generation ───────────────────────────────────────────────
@@ -260,3 +264,41 @@ class TestDictToQueryString:
         result = dict_to_query_string({"a": "1", "b": None})
         assert "a=1" in result
         assert "b" not in result
+
+
+# ── Pagination Cursor ─────────────────────────────────────────────
+
+
+class TestCursor:
+    def test_round_trip(self):
+        cursor = encode_cursor("2026-01-01T00:00:00", "order-id")
+        assert decode_cursor(cursor, 2) == ["2026-01-01T00:00:00", "order-id"]
+
+    def test_malformed_returns_none(self):
+        assert decode_cursor("not-a-cursor!", 2) is None
+
+    def test_wrong_size_returns_none(self):
+        assert decode_cursor(encode_cursor("a"), 2) is None
+
+
+# ── Client IP ─────────────────────────────────────────────────────
+
+
+def _request(headers=None, client=("10.0.0.1", 1234)):
+    raw = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    return Request({"type": "http", "headers": raw, "client": client})
+
+
+class TestClientIP:
+    def test_first_forwarded_hop(self):
+        request = _request({"X-Forwarded-For": " 1.2.3.4 , 5.6.7.8"})
+        assert client_ip(request) == "1.2.3.4"
+
+    def test_single_forwarded_ip(self):
+        assert client_ip(_request({"X-Forwarded-For": "1.2.3.4"})) == "1.2.3.4"
+
+    def test_falls_back_to_peer(self):
+        assert client_ip(_request()) == "10.0.0.1"
+
+    def test_unknown_without_peer(self):
+        assert client_ip(_request(client=None)) == "unknown"
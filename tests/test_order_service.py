@@ -0,0 +1,116 @@
+"""
+Tests for app.services.order_service — order placement and stock reservation.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.exceptions import ExternalServiceError
+from app.services.order_service import OrderService
+
+
+def _product(product_id="prod-1", stock=5, price=1000):
+    product = MagicMock()
+    product.id = product_id
+    product.store_id = "store-1"
+    product.name = "Sneakers"
+    product.price = price
+    product.stock_quantity = stock
+    product.is_active = True
+    product.images = []
+    return product
+
+
+@pytest.fixture
+def order_service(mock_db_session):
+    service = OrderService(mock_db_session)
+    service.store_repo = MagicMock(
+        get_checkout_store=AsyncMock(return_value=("store-1", "owner-1", "teststore")),
+    )
+    service.product_repo = MagicMock(
+        get_by_ids=AsyncMock(return_value={"prod-1": _product()}),
+        adjust_stock_many=AsyncMock(),
+    )
+    service.order_repo = MagicMock(
+        generate_order_number=AsyncMock(return_value="ORD-20260101-12345"),
+        create=AsyncMock(return_value=MagicMock(id="order-1")),
+        delete=AsyncMock(return_value=True),
+    )
+    service.payment_repo = MagicMock(create=AsyncMock())
+    service.monnify = MagicMock()
+    return service
+
+
+async def _place(service):
+    return await service.create_order(
+        store_username="teststore",
+        customer_name="Ada",
+        customer_phone="08012345678",
+        delivery_address="1 Marina",
+        delivery_state="Lagos",
+        items=[{"product_id": "prod-1", "quantity": 2}],
+    )
+
+
+class TestCreateOrderPaymentFailure:
+    async def test_payment_failure_deletes_order_and_restores_stock(self, order_service):
+        order_service.monnify.create_payment = AsyncMock(
+            side_effect=ExternalServiceError(message="Monnify unavailable")
+        )
+
+        with pytest.raises(ExternalServiceError):
+            await _place(order_service)
+
+        stock_calls = [c.args[0] for c in order_service.product_repo.adjust_stock_many.await_args_list]
+        assert stock_calls == [{"prod-1": -2}, {"prod-1": 2}]
+        order_service.order_repo.delete.assert_awaited_once_with("order-1")
+        order_service.payment_repo.create.assert_not_awaited()
+
+    async def test_failure_before_order_only_restores_stock(self, order_service):
+        order_service.order_repo.create = AsyncMock(side_effect=RuntimeError("insert failed"))
+
+        with pytest.raises(RuntimeError):
+            await _place(order_service)
+
+        stock_calls = [c.args[0] for c in order_service.product_repo.adjust_stock_many.await_args_list]
+        assert stock_calls == [{"prod-1": -2}, {"prod-1": 2}]
+        order_service.order_repo.delete.assert_not_awaited()
+
+
+class TestStorefrontInvalidation:
+    async def test_created_order_invalidates_storefront(self, order_service):
+        order_service.monnify.create_payment = AsyncMock(return_value={
+            "payment_reference": "PAY-1",
+            "accountDetails": {"accountNumber": "0123456789", "accountName": "AGM", "bankName": "Wema"},
+        })
+
+        with patch("app.services.order_service.invalidate_storefront") as invalidate:
+            await _place(order_service)
+
+        invalidate.assert_called_once_with("teststore")
+
+    async def test_payment_failure_invalidates_storefront(self, order_service):
+        order_service.monnify.create_payment = AsyncMock(
+            side_effect=ExternalServiceError(message="Monnify unavailable")
+        )
+
+        with patch("app.services.order_service.invalidate_storefront") as invalidate:
+            with pytest.raises(ExternalServiceError):
+                await _place(order_service)
+
+        invalidate.assert_called_once_with("teststore")
+
+    async def test_cancelled_order_invalidates_storefront(self, order_service):
+        order = MagicMock(store_id="store-1", is_cancellable=True, items=[{"product_id": "prod-1", "quantity": 2}])
+        order_service.order_repo.get_with_details = AsyncMock(return_value=order)
+        order_service.order_repo.update_status = AsyncMock()
+        order_service.store_repo.get_by_id = AsyncMock(
+            return_value=MagicMock(user_id="owner-1", username="teststore")
+        )
+
+        with patch("app.services.order_service.invalidate_storefront") as invalidate:
+            await order_service.cancel_order("order-1", "owner-1")
+
+        order_service.product_repo.adjust_stock_many.assert_awaited_once_with({"prod-1": 2})
+        invalidate.assert_called_once_with("teststore")
@@ -0,0 +1,49 @@
+"""
+Tests for app.services.payment_service — bank account resolution.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.config import settings
+from app.services import payment_service
+from app.services.payment_service import PaymentService
+
+ACCOUNT = {"account_name": "ADA OBI", "account_number": "0123456789", "bank_code": "058"}
+
+
+@pytest.fixture
+def service(mock_db_session, monkeypatch):
+    monkeypatch.setattr(payment_service, "_resolved_accounts", payment_service.TTLCache(maxsize=10, ttl=60))
+    service = PaymentService(mock_db_session)
+    service.monnify = MagicMock(api_key="live-key", validate_bank_account=AsyncMock(return_value=ACCOUNT))
+    return service
+
+
+class TestResolveBankAccount:
+    async def test_live_production_lookup_is_cached(self, service, monkeypatch):
+        monkeypatch.setitem(settings.__dict__, "is_production", True)
+
+        await service.resolve_bank_account("0123456789", "058")
+        await service.resolve_bank_account("0123456789", "058")
+
+        service.monnify.validate_bank_account.assert_awaited_once()
+
+    async def test_mock_lookup_is_not_cached(self, service, monkeypatch):
+        monkeypatch.setitem(settings.__dict__, "is_production", True)
+        service.monnify.api_key = ""
+
+        await service.resolve_bank_account("0123456789", "058")
+        await service.resolve_bank_account("0123456789", "058")
+
+        assert service.monnify.validate_bank_account.await_count == 2
+
+    async def test_blank_name_is_not_cached(self, service, monkeypatch):
+        monkeypatch.setitem(settings.__dict__, "is_production", True)
+        service.monnify.validate_bank_account.return_value = {**ACCOUNT, "account_name": None}
+
+        await service.resolve_bank_account("0123456789", "058")
+        await service.resolve_bank_account("0123456789", "058")
+
+        assert service.monnify.validate_bank_account.await_count == 2
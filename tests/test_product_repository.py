@@ -0,0 +1,45 @@
+"""
+Tests for app.repositories.product_repository — bulk updates.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.exceptions import AuthorizationError
+from app.repositories.product_repository import ProductRepository
+
+
+def _result(ids=(), rowcount=0):
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = list(ids)
+    result.rowcount = rowcount
+    return result
+
+
+class TestBulkUpdate:
+    async def test_unchanged_rows_do_not_fail_the_ownership_check(self, mock_db_session):
+        # MySQL without FOUND_ROWS reports 0 for rows already holding the values
+        mock_db_session.execute.side_effect = [_result(["p1", "p2"]), _result(rowcount=0)]
+
+        count = await ProductRepository(mock_db_session).bulk_update(
+            ["p1", "p2"], "user-1", {"is_active": True},
+        )
+
+        assert count == 2
+        assert mock_db_session.execute.await_count == 2
+        mock_db_session.commit.assert_awaited_once()
+        mock_db_session.rollback.assert_not_awaited()
+
+    async def test_unowned_product_rejects_the_whole_batch(self, mock_db_session):
+        mock_db_session.execute.side_effect = [_result(["p1"])]
+
+        with pytest.raises(AuthorizationError):
+            await ProductRepository(mock_db_session).bulk_update(
+                ["p1", "p2"], "user-1", {"is_active": False},
+            )
+
+        # Only the ownership SELECT ran; no UPDATE was issued
+        assert mock_db_session.execute.await_count == 1
+        mock_db_session.rollback.assert_awaited_once()
+        mock_db_session.commit.assert_not_awaited()
@@ -183,3 +183,7 @@ class TestResendVerificationRequest:
     def test_invalid_email_raises(self):
         with pytest.raises(ValidationError):
             ResendVerificationRequest(email="bad")
+
+    def test_email_whitespace_is_stripped(self):
+        req = ResendVerificationRequest(email="  user@example.com ")
+        assert req.email == "user@example.com"
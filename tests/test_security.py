@@ -2,19 +2,24 @@
 Tests for app.core.security — JWT tokens and password hashing.
 """
 
+import time
 from datetime import timedelta
 
 import pytest
 
 from app.core.security import (
+    DUMMY_PASSWORD_HASH,
     hash_password,
     verify_password,
+    ahash_password,
+    averify_password,
     create_access_token,
     create_refresh_token,
     create_tokens,
     decode_token,
     verify_access_token,
     verify_refresh_token,
+    hash_refresh_token,
     create_password_reset_token,
     verify_password_reset_token,
 )
@@ -40,6 +45,15 @@ class TestPasswordHashing:
     def test_verify_password_garbage_hash(self):
         assert verify_password("anything", "not-a-hash") is False
 
+    async def test_async_hash_and_verify(self):
+        hashed = await ahash_password("SecurePass1")
+        assert await averify_password("SecurePass1", hashed) is True
+        assert await averify_password("WrongPassword1", hashed) is False
+
+    def test_dummy_hash_is_valid_and_never_matches(self):
+        assert DUMMY_PASSWORD_HASH.startswith("$2b$12$")
+        assert verify_password("SecurePass1", DUMMY_PASSWORD_HASH) is False
+
     def test_different_passwords_produce_different_hashes(self):
         h1 = hash_password("Password1")
         h2 = hash_password("Password2")
@@ -80,6 +94,34 @@ class TestAccessTokens:
         with pytest.raises(TokenError):
             verify_access_token(token)
 
+    def test_repeat_verification_skips_decode(self, monkeypatch):
+        token = create_access_token(data={"sub": "user-cached"})
+        assert verify_access_token(token) == "user-cached"
+
+        def fail(_token):
+            raise AssertionError("token decoded twice")
+
+        monkeypatch.setattr("app.core.security.decode_token", fail)
+        assert verify_access_token(token) == "user-cached"
+
+    def test_cached_token_expires_with_token(self, monkeypatch):
+        token = create_access_token(
+            data={"sub": "user-short"},
+            expires_delta=timedelta(seconds=1),
+        )
+        assert verify_access_token(token) == "user-short"
+
+        # Past the token's expiry but well inside the cache TTL
+        later = time.monotonic() + 1.5
+        monkeypatch.setattr("app.core.cache.time.monotonic", lambda: later)
+
+        def expired(_token):
+            raise TokenError(message="Invalid or expired token")
+
+        monkeypatch.setattr("app.core.security.decode_token", expired)
+        with pytest.raises(TokenError):
+            verify_access_token(token)
+
 
 # ── Refresh Tokens ────────────────────────────────────────────────
 
@@ -103,6 +145,13 @@ class TestRefreshTokens:
         with pytest.raises(TokenError):
             verify_refresh_token(token)
 
+    def test_hash_refresh_token_is_stable_and_distinct(self):
+        token = create_refresh_token(data={"sub": "user-400"})
+        other = create_refresh_token(data={"sub": "user-400"})
+        assert hash_refresh_token(token) == hash_refresh_token(token)
+        assert hash_refresh_token(token) != hash_refresh_token(other)
+        assert len(hash_refresh_token(token)) == 64
+
 
 # ── Token Pairs ───────────────────────────────────────────────────
 
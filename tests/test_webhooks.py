@@ -0,0 +1,160 @@
+"""
+Tests for app.api.v1.webhooks — Monnify signature verification.
+"""
+
+import hashlib
+import hmac
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.api.v1.webhooks import (
+    MAX_WEBHOOK_BODY_BYTES,
+    _event_key,
+    _keyed_mac,
+    _process_event,
+    _read_body,
+    verify_monnify_signature,
+)
+
+SECRET = "test_webhook_secret"
+PAYLOAD = b'{"eventType":"SUCCESSFUL_TRANSACTION","eventData":{"paymentReference":"REF-1"}}'
+
+
+def _request(chunks, content_length=None) -> Request:
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+        for i, chunk in enumerate(chunks)
+    ]
+
+    async def receive():
+        return messages.pop(0)
+
+    headers = [] if content_length is None else [(b"content-length", str(content_length).encode())]
+    return Request({"type": "http", "method": "POST", "headers": headers}, receive)
+
+
+def _sign(payload: bytes, secret: str = SECRET) -> str:
+    return hmac.new(secret.encode(), payload, hashlib.sha512).hexdigest()
+
+
+class TestVerifyMonnifySignature:
+    def test_valid_signature(self):
+        assert verify_monnify_signature(PAYLOAD, _sign(PAYLOAD), SECRET) is True
+
+    def test_tampered_payload(self):
+        assert verify_monnify_signature(PAYLOAD + b" ", _sign(PAYLOAD), SECRET) is False
+
+    def test_wrong_secret(self):
+        assert verify_monnify_signature(PAYLOAD, _sign(PAYLOAD, "other"), SECRET) is False
+
+    def test_uppercase_hex_signature(self):
+        assert verify_monnify_signature(PAYLOAD, _sign(PAYLOAD).upper(), SECRET) is True
+
+    def test_garbage_signature(self):
+        assert verify_monnify_signature(PAYLOAD, "not-a-signature", SECRET) is False
+
+    def test_wrong_length_signature(self):
+        assert verify_monnify_signature(PAYLOAD, _sign(PAYLOAD)[:-2], SECRET) is False
+
+
+class TestReadBody:
+    async def test_reads_all_chunks(self):
+        body = await _read_body(_request([PAYLOAD[:10], PAYLOAD[10:]], len(PAYLOAD)))
+        assert bytes(body) == PAYLOAD
+
+    async def test_wrong_content_length(self):
+        assert bytes(await _read_body(_request([PAYLOAD], 5))) == PAYLOAD
+        assert bytes(await _read_body(_request([PAYLOAD], len(PAYLOAD) + 50))) == PAYLOAD
+
+    async def test_rejects_oversized_content_length(self):
+        with pytest.raises(HTTPException) as exc:
+            await _read_body(_request([PAYLOAD], MAX_WEBHOOK_BODY_BYTES + 1))
+        assert exc.value.status_code == 413
+
+    async def test_rejects_oversized_stream(self):
+        chunk = b"x" * (MAX_WEBHOOK_BODY_BYTES // 2 + 1)
+        with pytest.raises(HTTPException) as exc:
+            await _read_body(_request([chunk, chunk]))
+        assert exc.value.status_code == 413
+
+    async def test_feeds_mac_while_reading(self):
+        mac = _keyed_mac(SECRET).copy()
+        await _read_body(_request([PAYLOAD[:7], PAYLOAD[7:]]), mac)
+        assert mac.hexdigest() == _sign(PAYLOAD)
+
+    async def test_feeds_mac_for_large_chunks(self):
+        payload = b"y" * (256 * 1024)
+        mac = _keyed_mac(SECRET).copy()
+        body = await _read_body(_request([payload[:100], payload[100:]]), mac)
+        assert bytes(body) == payload
+        assert mac.hexdigest() == _sign(payload)
+
+
+class TestEventKey:
+    def test_prefers_transaction_reference(self):
+        data = {"transactionReference": "MNFY-1", "paymentReference": "REF-1"}
+        assert _event_key("SUCCESSFUL_TRANSACTION", data, PAYLOAD) == "SUCCESSFUL_TRANSACTION:MNFY-1"
+
+    def test_same_reference_differs_by_event_type(self):
+        data = {"paymentReference": "REF-1"}
+        assert _event_key("FAILED_TRANSACTION", data, PAYLOAD) != _event_key(
+            "SUCCESSFUL_TRANSACTION", data, PAYLOAD
+        )
+
+    def test_falls_back_to_body_hash(self):
+        key = _event_key("FAILED_TRANSACTION", {}, PAYLOAD)
+        assert key == f"FAILED_TRANSACTION:{hashlib.sha256(PAYLOAD).hexdigest()}"
+
+
+class TestProcessEvent:
+    def _patch(self, repo):
+        session = MagicMock()
+        session.rollback = AsyncMock()
+        maker = MagicMock()
+        maker.return_value.__aenter__ = AsyncMock(return_value=session)
+        maker.return_value.__aexit__ = AsyncMock(return_value=False)
+        return (
+            patch("app.api.v1.webhooks.async_session_maker", maker),
+            patch("app.api.v1.webhooks.WebhookEventRepository", return_value=repo),
+        )
+
+    async def test_skips_event_claimed_elsewhere(self):
+        repo = MagicMock(claim=AsyncMock(return_value=None), mark_processed=AsyncMock())
+        handler = AsyncMock()
+        maker_patch, repo_patch = self._patch(repo)
+        with maker_patch, repo_patch, patch.dict(
+            "app.api.v1.webhooks._EVENT_HANDLERS", {"SUCCESSFUL_TRANSACTION": handler}
+        ):
+            assert await _process_event("evt-1") is False
+        handler.assert_not_awaited()
+        repo.mark_processed.assert_not_awaited()
+
+    async def test_failed_handler_releases_claim(self):
+        event = MagicMock(event_type="SUCCESSFUL_TRANSACTION", event_data={})
+        repo = MagicMock(
+            claim=AsyncMock(return_value=event),
+            release=AsyncMock(),
+            mark_processed=AsyncMock(),
+        )
+        handler = AsyncMock(side_effect=RuntimeError("db down"))
+        maker_patch, repo_patch = self._patch(repo)
+        with maker_patch, repo_patch, patch.dict(
+            "app.api.v1.webhooks._EVENT_HANDLERS", {"SUCCESSFUL_TRANSACTION": handler}
+        ):
+            assert await _process_event("evt-2") is False
+        repo.release.assert_awaited_once_with("evt-2")
+        repo.mark_processed.assert_not_awaited()
+
+    async def test_processed_event_is_marked(self):
+        event = MagicMock(event_type="SUCCESSFUL_TRANSACTION", event_data={"paymentReference": "REF-1"})
+        repo = MagicMock(claim=AsyncMock(return_value=event), mark_processed=AsyncMock())
+        handler = AsyncMock()
+        maker_patch, repo_patch = self._patch(repo)
+        with maker_patch, repo_patch, patch.dict(
+            "app.api.v1.webhooks._EVENT_HANDLERS", {"SUCCESSFUL_TRANSACTION": handler}
+        ):
+            assert await _process_event("evt-3") is True
+        repo.mark_processed.assert_awaited_once_with("evt-3")
@@ -41,7 +41,7 @@ CREATE TABLE `users` (
 -- TABLE: user_settings
 -- ============================================================
 CREATE TABLE `user_settings` (
-  `id`                      VARCHAR(36)  NOT NULL,
+  `id`                      VARCHAR(36)  NOT NULL DEFAULT (UUID()),
   `user_id`                 VARCHAR(36)  NOT NULL,
   `email_notifications`     TINYINT(1)   NOT NULL DEFAULT 1,
   `sms_notifications`       TINYINT(1)   NOT NULL DEFAULT 1,
@@ -79,10 +79,9 @@ CREATE TABLE `refresh_tokens` (
   `revoked_at`  DATETIME     DEFAULT NULL,
   `created_at`  DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP,
   PRIMARY KEY (`id`),
-  KEY `ix_refresh_tokens_user_id`    (`user_id`),
   KEY `ix_refresh_tokens_token_hash` (`token_hash`),
   KEY `ix_refresh_tokens_expires_at` (`expires_at`),
-  KEY `ix_refresh_tokens_revoked`    (`revoked`),
+  KEY `ix_refresh_tokens_user_revoked` (`user_id`, `revoked`),
   CONSTRAINT `fk_refresh_tokens_user_id`
     FOREIGN KEY (`user_id`) REFERENCES `users` (`id`) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -103,10 +102,9 @@ CREATE TABLE `otp_verifications` (
   PRIMARY KEY (`id`),
   KEY `ix_otp_verifications_email`      (`email`),
   KEY `ix_otp_verifications_phone`      (`phone`),
-  KEY `ix_otp_verifications_code`       (`code`),
   KEY `ix_otp_verifications_otp_type`   (`otp_type`),
-  KEY `ix_otp_verifications_verified`   (`verified`),
-  KEY `ix_otp_verifications_expires_at` (`expires_at`)
+  KEY `ix_otp_verifications_expires_at` (`expires_at`),
+  KEY `ix_otp_verifications_code_verified_expires` (`code`, `verified`, `expires_at`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 
@@ -201,6 +199,8 @@ CREATE TABLE `products` (
   KEY `ix_products_is_active`     (`is_active`),
   KEY `ix_products_is_featured`   (`is_featured`),
   KEY `ix_products_deleted_at`    (`deleted_at`),
+  KEY `ix_products_store_created_id` (`store_id`, `created_at`, `id`),
+  KEY `ix_products_store_active_stock` (`store_id`, `is_active`, `stock_quantity`),
   CONSTRAINT `fk_products_store_id`
     FOREIGN KEY (`store_id`) REFERENCES `stores` (`id`) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -241,6 +241,9 @@ CREATE TABLE `orders` (
   KEY `ix_orders_status`         (`status`),
   KEY `ix_orders_payment_status` (`payment_status`),
   KEY `ix_orders_deleted_at`     (`deleted_at`),
+  KEY `ix_orders_store_customer_phone_created` (`store_id`, `customer_phone`, `created_at`),
+  KEY `ix_orders_store_created_id` (`store_id`, `created_at`, `id`),
+  KEY `ix_orders_store_payment_status_created` (`store_id`, `payment_status`, `created_at`),
   CONSTRAINT `fk_orders_store_id`
     FOREIGN KEY (`store_id`) REFERENCES `stores` (`id`) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -311,6 +314,7 @@ CREATE TABLE `refunds` (
   KEY `ix_refunds_status`            (`status`),
   KEY `ix_refunds_refund_reference`  (`refund_reference`),
   KEY `ix_refunds_monnify_reference` (`monnify_reference`),
+  KEY `ix_refunds_payment_status`    (`payment_id`, `status`),
   CONSTRAINT `fk_refunds_payment_id`
     FOREIGN KEY (`payment_id`) REFERENCES `payments` (`id`) ON DELETE CASCADE,
   CONSTRAINT `fk_refunds_order_id`
@@ -354,6 +358,23 @@ CREATE TABLE `disbursements` (
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 
+-- ============================================================
+-- TABLE: webhook_events
+-- ============================================================
+CREATE TABLE `webhook_events` (
+  `id`            VARCHAR(36)  NOT NULL,
+  `event_key`     VARCHAR(160) NOT NULL,
+  `event_type`    VARCHAR(50)  NOT NULL,
+  `event_data`    JSON         NOT NULL,
+  `claimed_at`    DATETIME     DEFAULT NULL,
+  `processed_at`  DATETIME     DEFAULT NULL,
+  `created_at`    DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (`id`),
+  UNIQUE KEY `uq_webhook_events_event_key` (`event_key`),
+  KEY `ix_webhook_events_processed_claimed` (`processed_at`, `claimed_at`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+
 -- ============================================================
 -- END OF SCHEMA
 -- ============================================================